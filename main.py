@@ -6,7 +6,9 @@ import logging
 from src.core.config_manager import ConfigManager
 from src.core.logger_setup import setup_logging
 from src.cli.argument_parser import parse_arguments
-from src.cli.application_factory import run_benchmark, run_application, validate_arguments
+from src.cli.application_factory import (
+    run_benchmark, run_application, run_mhl_verification, validate_arguments
+)
 
 # Initialize configuration first
 config_manager = ConfigManager()
@@ -34,6 +36,9 @@ def main():
     if args.benchmark:
         return run_benchmark(args)
     
+    if args.verify_mhl:
+        return run_mhl_verification(args)
+    
     return run_application(args)
 
 if __name__ == "__main__":
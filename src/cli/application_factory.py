@@ -44,6 +44,42 @@ def run_benchmark(args):
         sys.argv = original_argv
 
 
+def run_mhl_verification(args):
+    """
+    Verify the files listed in an existing MHL.
+    
+    Args:
+        args: Parsed command line arguments containing verify_mhl
+        
+    Returns:
+        Exit code (0 if every file verified, 1 otherwise)
+    """
+    from pathlib import Path
+    from src.core.config_manager import ConfigManager
+    from src.core.mhl_verifier import MHLVerifier
+    from src.core.rich_display import RichDisplay
+    
+    mhl_path = Path(args.verify_mhl).expanduser()
+    config = ConfigManager().load_config()
+    verifier = MHLVerifier(RichDisplay(),
+                           max_workers=config.verify_threads,
+                           per_device=config.verify_threads_per_device)
+    try:
+        report = verifier.verify(mhl_path)
+    except KeyboardInterrupt:
+        print("\nVerification interrupted")
+        return 1
+    except Exception as e:
+        logger.error(f"MHL verification failed: {e}", exc_info=True)
+        print(f"Error: Could not verify {mhl_path}: {e}")
+        return 1
+    
+    print("")
+    for line in report.summary_lines():
+        print(line)
+    return 0 if report.success else 1
+
+
 def run_application(args):
     """
     Run the main application with given arguments.
@@ -88,6 +124,13 @@ def validate_arguments(args):
     Returns:
         tuple: (is_valid: bool, error_message: str)
     """
+    verify_mhl = getattr(args, 'verify_mhl', None)
+    if verify_mhl is not None:
+        if not verify_mhl.strip():
+            return False, "MHL path cannot be empty"
+        if not verify_mhl.lower().endswith('.mhl'):
+            return False, "MHL path must point to a .mhl file"
+    
     # Validate benchmark-specific arguments
     if args.benchmark:
         if args.iterations and args.iterations < 1:
@@ -33,6 +33,13 @@ def parse_arguments():
         help="Number of iterations per benchmark test"
     )
     
+    parser.add_argument(
+        "--verify-mhl",
+        type=str,
+        metavar="PATH",
+        help="Re-hash every file listed in an existing MHL and report pass/fail"
+    )
+    
     parser.add_argument(
         "--webui", 
         action="store_true", 
@@ -9,6 +9,7 @@ from datetime import datetime
 import os
 import shutil
 import random
+import tracemalloc
 import xxhash
 from dataclasses import dataclass, field
 
@@ -18,9 +19,15 @@ from .interfaces.storage_inter import StorageInterface
 from .interfaces.types import TransferProgress, TransferStatus
 from .file_transfer import FileTransfer
 from .state_manager import StateManager
-from .file_operations import FileOperations, CHUNK_SIZE, BUFFER_SIZE
+from .file_operations import (
+    FileOperations, CHUNK_SIZE, BUFFER_SIZE,
+    COPY_MODE_SERIAL, COPY_MODES, copy_stream
+)
 from .progress_tracker import ProgressTracker
 from .checksum import ChecksumCalculator
+from .buffer_pool import clear_buffer_pools, iter_chunks
+from .page_cache import page_cache_size, sequential_read
+from .mhl_handler import open_mhl_writer
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,9 @@ class BenchmarkResult:
     success: bool = True
     error: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    copy_mode: str = COPY_MODE_SERIAL  # copy engine used for the run
+    peak_allocation: int = 0  # peak traced Python allocation during the run, in bytes
+    page_cache_growth: int = 0  # page cache growth over the run, in bytes (Linux only)
 
 @dataclass
 class BenchmarkConfig:
@@ -54,7 +64,10 @@ class BenchmarkConfig:
         500 * 1024 * 1024,    # 500MB
         4096 * 1024 * 1024,   # 4GB
     ])
+    copy_modes: List[str] = field(default_factory=lambda: [COPY_MODE_SERIAL])
     iterations: int = 3
+    trace_allocations: bool = True  # measure peak allocation with tracemalloc
+    cache_hints: bool = True  # fadvise readahead/eviction, as with page_cache_hints
     cleanup_after_run: bool = True
     generate_plots: bool = True
     output_dir: Path = Path("benchmark_results")
@@ -140,7 +153,8 @@ class TransferBenchmark:
     def run_single_benchmark(
         self, 
         buffer_size: int, 
-        test_file: Path
+        test_file: Path,
+        copy_mode: str = COPY_MODE_SERIAL
     ) -> BenchmarkResult:
         """
         Run a single benchmark with specified buffer size and test file.
@@ -148,6 +162,7 @@ class TransferBenchmark:
         Args:
             buffer_size: Buffer size to use for transfer in bytes
             test_file: Path to the test file
+            copy_mode: Copy engine to benchmark, one of COPY_MODES
             
         Returns:
             BenchmarkResult with performance metrics
@@ -159,10 +174,13 @@ class TransferBenchmark:
             elif item.is_dir():
                 shutil.rmtree(item)
         
+        # Start every run with empty buffer pools so allocation peaks are comparable
+        clear_buffer_pools()
+        
         # Create required objects for the benchmark
         progress_tracker = ProgressTracker(self.display)
-        checksum_calculator = ChecksumCalculator(self.display)
-        file_ops = FileOperations(self.display, self.storage)
+        cache_hints = self.benchmark_config.cache_hints
+        checksum_calculator = ChecksumCalculator(self.display, cache_hints=cache_hints)
         
         # Create a custom file operations class with the specified buffer size
         class CustomFileOperations(FileOperations):
@@ -173,25 +191,14 @@ class TransferBenchmark:
                 # Get file size for progress updates
                 file_size = src_path.stat().st_size
                 
-                # Copy the file with custom buffer size
+                # Copy the file with custom buffer size and the engine under test
                 with open(src_path, 'rb') as src:
                     with open(dst_path, 'wb') as dst:
-                        bytes_transferred = 0
-                        
-                        while True:
-                            chunk = src.read(buffer_size)
-                            if not chunk:
-                                break
-                                
-                            dst.write(chunk)
-                            if hash_obj:
-                                hash_obj.update(chunk)
-                            
-                            bytes_transferred += len(chunk)
-                            
-                            # Update progress if callback provided
-                            if progress_callback:
-                                progress_callback(bytes_transferred, file_size)
+                        trimmer = self._cache_trimmer(src, [dst], progress_callback)
+                        copy_stream(src, dst, hash_obj, buffer_size, file_size,
+                                    trimmer or progress_callback, copy_mode)
+                        if trimmer:
+                            trimmer.finish()
                 
                 # Return checksum if hash_obj provided
                 if hash_obj:
@@ -199,7 +206,7 @@ class TransferBenchmark:
                 return True, None
         
         # Use the custom file operations for benchmarking
-        custom_file_ops = CustomFileOperations(self.display, self.storage)
+        custom_file_ops = CustomFileOperations(self.display, self.storage, cache_hints=cache_hints)
         
         # Prepare result object
         result = BenchmarkResult(
@@ -209,24 +216,28 @@ class TransferBenchmark:
             duration=0.0,
             checksum_duration=0.0,
             verification_duration=0.0,
-            total_duration=0.0
+            total_duration=0.0,
+            copy_mode=copy_mode
         )
         
+        started_tracing = False
+        if self.benchmark_config.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        
         try:
             # Enter transfer state
             self.state_manager.enter_transfer()
             
             # Start timing
+            cache_before = page_cache_size()
             start_time = time.time()
             checksum_start = start_time
             
             # Calculate source checksum
             hash_obj = checksum_calculator.create_hash()
-            with open(test_file, 'rb') as f:
-                while True:
-                    chunk = f.read(buffer_size)
-                    if not chunk:
-                        break
+            with open(test_file, 'rb') as f, sequential_read(f, cache_hints):
+                for chunk in iter_chunks(f, buffer_size):
                     hash_obj.update(chunk)
             
             checksum = hash_obj.hexdigest()
@@ -248,7 +259,7 @@ class TransferBenchmark:
             
             # Perform the actual copy with custom file operations
             success, actual_checksum = custom_file_ops.copy_file_with_hash(
-                test_file, dest_file, hash_obj, progress_callback
+                test_file, dest_file, checksum_calculator.create_hash(), progress_callback
             )
             
             transfer_end = time.time()
@@ -259,6 +270,9 @@ class TransferBenchmark:
             verification_success = custom_file_ops.verify_checksum(dest_file, checksum, progress_callback)
             verify_end = time.time()
             result.verification_duration = verify_end - verify_start
+            cache_after = page_cache_size()
+            if cache_before is not None and cache_after is not None:
+                result.page_cache_growth = cache_after - cache_before
             
             # Calculate total duration and transfer speed
             result.total_duration = verify_end - start_time
@@ -286,6 +300,11 @@ class TransferBenchmark:
                 logger.error(f"Error exiting transfer state: {exit_err}")
             
             return result
+        
+        finally:
+            if started_tracing:
+                result.peak_allocation = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
     
     def run_benchmarks(self) -> Dict[str, List[BenchmarkResult]]:
         """
@@ -303,29 +322,30 @@ class TransferBenchmark:
             # Create test file for this size
             test_file = self.create_test_file(file_size)
             
-            for buffer_size in self.benchmark_config.buffer_sizes:
-                buffer_key = f"{buffer_size // (1024 * 1024)}MB"
-                logger.info(f"Running benchmark with {buffer_key} buffer on {size_key} file")
-                
-                # Run multiple iterations
-                iteration_results: List[BenchmarkResult] = []
-                for i in range(self.benchmark_config.iterations):
-                    logger.info(f"  Iteration {i+1}/{self.benchmark_config.iterations}")
-                    result = self.run_single_benchmark(buffer_size, test_file)
-                    iteration_results.append(result)
+            for copy_mode in self.benchmark_config.copy_modes:
+                for buffer_size in self.benchmark_config.buffer_sizes:
+                    buffer_key = f"{buffer_size // (1024 * 1024)}MB"
+                    logger.info(f"Running {copy_mode} benchmark with {buffer_key} buffer on {size_key} file")
                     
-                    if not result.success:
-                        logger.warning(f"  Iteration {i+1} failed: {result.error}")
-                    else:
-                        logger.info(f"  Iteration {i+1} complete: {result.transfer_speed:.2f} MB/s")
-                
-                # Calculate average and save results
-                if iteration_results:
-                    avg_result = self._average_results(iteration_results)
-                    results[size_key].append(avg_result)
+                    # Run multiple iterations
+                    iteration_results: List[BenchmarkResult] = []
+                    for i in range(self.benchmark_config.iterations):
+                        logger.info(f"  Iteration {i+1}/{self.benchmark_config.iterations}")
+                        result = self.run_single_benchmark(buffer_size, test_file, copy_mode)
+                        iteration_results.append(result)
+                        
+                        if not result.success:
+                            logger.warning(f"  Iteration {i+1} failed: {result.error}")
+                        else:
+                            logger.info(f"  Iteration {i+1} complete: {result.transfer_speed:.2f} MB/s")
                     
-                    logger.info(f"Average transfer speed for {buffer_key} buffer on {size_key} file: "
-                                f"{avg_result.transfer_speed:.2f} MB/s")
+                    # Calculate average and save results
+                    if iteration_results:
+                        avg_result = self._average_results(iteration_results)
+                        results[size_key].append(avg_result)
+                        
+                        logger.info(f"Average {copy_mode} transfer speed for {buffer_key} buffer on {size_key} file: "
+                                    f"{avg_result.transfer_speed:.2f} MB/s")
         
         # Save results to file
         self.save_results(results)
@@ -362,7 +382,10 @@ class TransferBenchmark:
             total_duration=statistics.mean(r.total_duration for r in successful_results),
             success=True,
             error=None,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            copy_mode=results[0].copy_mode,
+            peak_allocation=max(r.peak_allocation for r in successful_results),
+            page_cache_growth=max(r.page_cache_growth for r in successful_results)
         )
         
         return avg_result
@@ -377,6 +400,7 @@ class TransferBenchmark:
         for size_key, size_results in results.items():
             serializable_results[size_key] = [
                 {
+                    "copy_mode": r.copy_mode,
                     "buffer_size": r.buffer_size,
                     "buffer_size_mb": r.buffer_size / (1024 * 1024),
                     "file_size": r.file_size,
@@ -386,6 +410,10 @@ class TransferBenchmark:
                     "checksum_duration": r.checksum_duration,
                     "verification_duration": r.verification_duration,
                     "total_duration": r.total_duration,
+                    "peak_allocation": r.peak_allocation,
+                    "peak_allocation_mb": r.peak_allocation / (1024 * 1024),
+                    "page_cache_growth": r.page_cache_growth,
+                    "page_cache_growth_mb": r.page_cache_growth / (1024 * 1024),
                     "success": r.success,
                     "error": r.error,
                     "timestamp": r.timestamp
@@ -411,12 +439,15 @@ class TransferBenchmark:
             if not size_results:
                 continue
                 
-            # Extract data
-            buffer_sizes = [r.buffer_size / (1024 * 1024) for r in size_results]  # Convert to MB
-            transfer_speeds = [r.transfer_speed for r in size_results]
-            
-            # Plot transfer speed
-            plt.plot(buffer_sizes, transfer_speeds, marker='o', label=f"File size: {size_key}")
+            for copy_mode in self._modes_in(size_results):
+                mode_results = [r for r in size_results if r.copy_mode == copy_mode]
+                
+                # Extract data
+                buffer_sizes = [r.buffer_size / (1024 * 1024) for r in mode_results]  # Convert to MB
+                transfer_speeds = [r.transfer_speed for r in mode_results]
+                
+                # Plot transfer speed
+                plt.plot(buffer_sizes, transfer_speeds, marker='o', label=f"File size: {size_key} ({copy_mode})")
         
         plt.title("Transfer Speed vs Buffer Size")
         plt.xlabel("Buffer Size (MB)")
@@ -438,16 +469,20 @@ class TransferBenchmark:
             if not size_results:
                 continue
                 
-            # Extract data for the largest file size
-            buffer_sizes = [r.buffer_size / (1024 * 1024) for r in size_results]  # Convert to MB
-            durations = [r.duration for r in size_results]
-            checksum_durations = [r.checksum_duration for r in size_results]
-            verification_durations = [r.verification_duration for r in size_results]
-            
-            # Plot durations
-            plt.plot(buffer_sizes, durations, marker='o', label=f"Transfer Time ({size_key})")
-            plt.plot(buffer_sizes, checksum_durations, marker='s', label=f"Checksum Time ({size_key})")
-            plt.plot(buffer_sizes, verification_durations, marker='^', label=f"Verification Time ({size_key})")
+            for copy_mode in self._modes_in(size_results):
+                mode_results = [r for r in size_results if r.copy_mode == copy_mode]
+                
+                # Extract data for the largest file size
+                buffer_sizes = [r.buffer_size / (1024 * 1024) for r in mode_results]  # Convert to MB
+                durations = [r.duration for r in mode_results]
+                checksum_durations = [r.checksum_duration for r in mode_results]
+                verification_durations = [r.verification_duration for r in mode_results]
+                
+                # Plot durations
+                label = f"{size_key}, {copy_mode}"
+                plt.plot(buffer_sizes, durations, marker='o', label=f"Transfer Time ({label})")
+                plt.plot(buffer_sizes, checksum_durations, marker='s', label=f"Checksum Time ({label})")
+                plt.plot(buffer_sizes, verification_durations, marker='^', label=f"Verification Time ({label})")
         
         plt.title("Operation Durations vs Buffer Size")
         plt.xlabel("Buffer Size (MB)")
@@ -461,6 +496,32 @@ class TransferBenchmark:
         plt.savefig(duration_plot_file)
         logger.info(f"Duration plot saved to {duration_plot_file}")
     
+    @staticmethod
+    def _modes_in(results: List[BenchmarkResult]) -> List[str]:
+        """Return the copy modes present in results, in first-seen order"""
+        return list(dict.fromkeys(r.copy_mode for r in results))
+    
+    @staticmethod
+    def compare_copy_modes(results: List[BenchmarkResult]) -> Dict[int, Dict[str, float]]:
+        """
+        Compare each copy mode against the serial loop for the same buffer size.
+        
+        Args:
+            results: Benchmark results for a single file size
+            
+        Returns:
+            Mapping of buffer size to {copy_mode: speedup over serial}
+        """
+        serial = {r.buffer_size: r.transfer_speed for r in results
+                  if r.copy_mode == COPY_MODE_SERIAL and r.success}
+        comparison: Dict[int, Dict[str, float]] = {}
+        for r in results:
+            baseline = serial.get(r.buffer_size)
+            if not r.success or not baseline:
+                continue
+            comparison.setdefault(r.buffer_size, {})[r.copy_mode] = r.transfer_speed / baseline
+        return comparison
+    
     def cleanup(self) -> None:
         """Clean up temporary files"""
         logger.info("Cleaning up temporary files")
@@ -472,6 +533,42 @@ class TransferBenchmark:
             logger.error(f"Error cleaning up temporary directory: {e}")
 
 
+def benchmark_mhl_writer(entry_count: int = 100_000, work_dir: Optional[Path] = None) -> Dict[str, float]:
+    """
+    Measure streaming MHL entries, e.g. for a card of DPX frames.
+    
+    Args:
+        entry_count: Number of <hash> entries to write
+        work_dir: Directory for the MHL file, a temporary one if not given
+        
+    Returns:
+        Dictionary with 'entries', 'seconds', 'entries_per_second' and 'file_size'
+    """
+    temp_dir = None
+    if work_dir is None:
+        import tempfile
+        temp_dir = Path(tempfile.mkdtemp(prefix="transferbox_mhl_bench_"))
+        work_dir = temp_dir
+    try:
+        start_time = time.perf_counter()
+        writer = open_mhl_writer("benchmark", work_dir)
+        with writer:
+            for i in range(entry_count):
+                frame = work_dir / "A001C003" / f"A001C003.{i:07d}.dpx"
+                writer.add(frame, f"{i:016x}", 12 * 1024 * 1024, mtime=0.0)
+        duration = time.perf_counter() - start_time
+        file_size = writer.mhl_filename.stat().st_size
+        return {
+            'entries': entry_count,
+            'seconds': duration,
+            'entries_per_second': entry_count / duration if duration > 0 else 0.0,
+            'file_size': file_size,
+        }
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def run_benchmark_cli():
     """Run benchmarks from command line"""
     import argparse
@@ -479,13 +576,29 @@ def run_benchmark_cli():
     parser = argparse.ArgumentParser(description="TransferBox Benchmark Tool")
     parser.add_argument("--buffer-sizes", type=str, help="Comma-separated list of buffer sizes in MB")
     parser.add_argument("--file-sizes", type=str, help="Comma-separated list of file sizes in MB")
+    parser.add_argument("--copy-modes", type=str,
+                        help=f"Comma-separated list of copy engines to compare ({', '.join(COPY_MODES)})")
     parser.add_argument("--iterations", type=int, default=3, help="Number of iterations per benchmark")
     parser.add_argument("--output-dir", type=str, default="benchmark_results", help="Output directory for results")
     parser.add_argument("--no-cleanup", action="store_true", help="Skip cleanup of temporary files")
     parser.add_argument("--no-plots", action="store_true", help="Skip generating plots")
+    parser.add_argument("--no-cache-hints", action="store_true",
+                        help="Copy without page cache hints, to compare page cache growth")
+    parser.add_argument("--mhl-entries", type=int,
+                        help="Benchmark writing an MHL with this many entries instead of file copies")
     
     args = parser.parse_args()
     
+    if args.mhl_entries:
+        mhl_result = benchmark_mhl_writer(args.mhl_entries)
+        print("\nMHL Writer Benchmark:")
+        print("---------------------")
+        print(f"  Entries: {mhl_result['entries']}")
+        print(f"  Duration: {mhl_result['seconds']:.2f} seconds")
+        print(f"  Entries per second: {mhl_result['entries_per_second']:.0f}")
+        print(f"  MHL size: {mhl_result['file_size'] / (1024 * 1024):.1f} MB")
+        return 0
+    
     # Configure benchmarks
     benchmark_config = BenchmarkConfig()
     
@@ -497,6 +610,10 @@ def run_benchmark_cli():
         file_sizes = [int(size.strip()) * 1024 * 1024 for size in args.file_sizes.split(",")]
         benchmark_config.test_file_sizes = file_sizes
     
+    if args.copy_modes:
+        copy_modes = [mode.strip().lower() for mode in args.copy_modes.split(",")]
+        benchmark_config.copy_modes = [mode for mode in copy_modes if mode in COPY_MODES] or [COPY_MODE_SERIAL]
+    
     if args.iterations:
         benchmark_config.iterations = args.iterations
     
@@ -509,6 +626,9 @@ def run_benchmark_cli():
     if args.no_plots:
         benchmark_config.generate_plots = False
     
+    if args.no_cache_hints:
+        benchmark_config.cache_hints = False
+    
     # Initialize required components
     from .interfaces.dummy_display import DummyDisplay
     from .interfaces.local_storage import LocalStorage
@@ -534,9 +654,22 @@ def run_benchmark_cli():
         
         for result in size_results:
             buffer_mb = result.buffer_size / (1024 * 1024)
+            print(f"  Copy mode: {result.copy_mode}")
             print(f"  Buffer size: {buffer_mb:.1f} MB")
             print(f"  Transfer speed: {result.transfer_speed:.2f} MB/s")
             print(f"  Duration: {result.duration:.2f} seconds")
+            print(f"  Peak allocation: {result.peak_allocation / (1024 * 1024):.1f} MB")
+            print(f"  Page cache growth: {result.page_cache_growth / (1024 * 1024):.1f} MB")
+            print("")
+        
+        comparison = TransferBenchmark.compare_copy_modes(size_results)
+        if any(len(modes) > 1 for modes in comparison.values()):
+            print("  Speedup vs serial:")
+            for buffer_size, modes in comparison.items():
+                buffer_mb = buffer_size / (1024 * 1024)
+                speedups = ", ".join(f"{mode} x{ratio:.2f}" for mode, ratio in modes.items()
+                                     if mode != COPY_MODE_SERIAL)
+                print(f"    {buffer_mb:.1f} MB buffer: {speedups}")
             print("")
     
     return 0
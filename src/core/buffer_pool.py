@@ -0,0 +1,147 @@
+# src/core/buffer_pool.py
+
+import logging
+import threading
+from collections import deque
+from typing import BinaryIO, Deque, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the memory one pool may hold, shared by every transfer
+POOL_MEMORY_LIMIT = 256 * 1024 * 1024  # 256MB keeps 1-2GB Pi units comfortable
+MIN_POOL_BUFFERS = 2  # Enough for one reader to overlap with one consumer
+
+
+class BufferPool:
+    """
+    Size-bounded pool of preallocated, reusable bytearray buffers.
+
+    Hot I/O loops fill pooled buffers with readinto instead of creating a new
+    bytes object per chunk. Buffers are allocated lazily up to max_buffers;
+    once that many are checked out, acquire() blocks until one is released.
+    """
+
+    def __init__(self, buffer_size: int, max_buffers: int):
+        """
+        Initialize the pool.
+
+        Args:
+            buffer_size: Size of every buffer in bytes
+            max_buffers: Maximum number of buffers the pool will allocate
+        """
+        self.buffer_size = buffer_size
+        self.max_buffers = max(1, max_buffers)
+        self._free: Deque[bytearray] = deque()
+        self._allocated = 0
+        self._condition = threading.Condition()
+
+    @property
+    def allocated(self) -> int:
+        """Number of buffers currently allocated, idle or checked out."""
+        with self._condition:
+            return self._allocated
+
+    def acquire(self) -> bytearray:
+        """
+        Check out a buffer, blocking while the pool is exhausted.
+
+        Returns:
+            bytearray: Buffer of buffer_size bytes with undefined contents
+        """
+        with self._condition:
+            while not self._free and self._allocated >= self.max_buffers:
+                self._condition.wait()
+            if self._free:
+                return self._free.pop()
+            self._allocated += 1
+        try:
+            return bytearray(self.buffer_size)
+        except MemoryError:
+            with self._condition:
+                self._allocated -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, buffer: bytearray) -> None:
+        """
+        Return a buffer obtained from acquire().
+
+        Args:
+            buffer: Buffer to return to the pool
+        """
+        with self._condition:
+            self._free.append(buffer)
+            self._condition.notify()
+
+    def clear(self) -> int:
+        """
+        Drop idle buffers so their memory can be returned to the system.
+
+        Returns:
+            int: Number of buffers dropped
+        """
+        with self._condition:
+            dropped = len(self._free)
+            self._free.clear()
+            self._allocated -= dropped
+            self._condition.notify_all()
+        return dropped
+
+
+_pools: Dict[int, BufferPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_buffer_pool(buffer_size: int) -> BufferPool:
+    """
+    Get the process-wide pool for a buffer size, creating it on first use.
+
+    Args:
+        buffer_size: Size of the buffers in bytes
+
+    Returns:
+        BufferPool: Shared pool whose total size stays within POOL_MEMORY_LIMIT
+    """
+    with _pools_lock:
+        pool = _pools.get(buffer_size)
+        if pool is None:
+            max_buffers = max(MIN_POOL_BUFFERS, POOL_MEMORY_LIMIT // max(1, buffer_size))
+            pool = BufferPool(buffer_size, max_buffers)
+            _pools[buffer_size] = pool
+            logger.debug(f"Created buffer pool: {max_buffers} x {buffer_size} bytes")
+        return pool
+
+
+def clear_buffer_pools() -> None:
+    """Drop idle buffers from every pool, e.g. once a transfer session ends."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.clear()
+
+
+def iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Read a binary file in chunks through a single pooled buffer.
+
+    Each yielded view is only valid until the next iteration; consumers that
+    need to keep data must copy it.
+
+    Args:
+        f: File opened for binary reading
+        chunk_size: Maximum chunk size in bytes
+
+    Yields:
+        memoryview: View over the bytes read into the pooled buffer
+    """
+    pool = get_buffer_pool(chunk_size)
+    buffer = pool.acquire()
+    view = memoryview(buffer)
+    try:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            yield view[:n]
+    finally:
+        pool.release(buffer)
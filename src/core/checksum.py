@@ -1,23 +1,191 @@
 # src/core/checksum.py
 
+import hashlib
 import logging
+import os
+import threading
 import xxhash
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, Iterator
+from typing import Optional, Callable, Dict, Iterable, Iterator, List
 from .interfaces.types import TransferProgress, TransferStatus
 from .interfaces.display import DisplayInterface
+from .buffer_pool import iter_chunks
+from .page_cache import sequential_read
 
 logger = logging.getLogger(__name__)
 
+CHECKSUM_CHUNK_SIZE = 32 * 1024 * 1024  # 32MB chunks, read into pooled buffers
+
+# Hash algorithms that can be recorded, keyed by their ASC MHL element name
+HASH_ALGORITHMS = {
+    "xxh64": xxhash.xxh64,
+    "xxh128": xxhash.xxh3_128,
+    "xxh3": xxhash.xxh3_64,
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+}
+PRIMARY_ALGORITHM = "xxh64"  # Always computed; used for verification and the ingest index
+PARALLEL_HASH_MIN_CHUNK = 1024 * 1024  # Smaller chunks are hashed in turn on the calling thread
+
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Shared worker threads for the secondary hashers of every MultiHasher."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(
+                max_workers=max(2, min(len(HASH_ALGORITHMS), os.cpu_count() or 1)),
+                thread_name_prefix="hasher")
+        return _hash_pool
+
+
+def normalize_algorithms(algorithms: Optional[Iterable[str]]) -> List[str]:
+    """
+    Clean up a list of hash algorithm names.
+    
+    Args:
+        algorithms: Algorithm names in any case; unknown names are dropped
+        
+    Returns:
+        List[str]: Known algorithms without duplicates, xxh64 first
+    """
+    names = [PRIMARY_ALGORITHM]
+    for name in algorithms or ():
+        name = str(name).strip().lower()
+        if name not in HASH_ALGORITHMS:
+            logger.warning(f"Ignoring unsupported hash algorithm: {name}")
+        elif name not in names:
+            names.append(name)
+    return names
+
+
+class MultiHasher:
+    """
+    Computes several digests of the same data in one pass.
+    
+    Behaves like a single hash object whose hexdigest() is the XXH64, so it
+    can be handed to any copy routine. For large chunks the secondary hashers
+    run on shared worker threads while XXH64 runs on the caller's; both
+    xxhash and hashlib release the GIL, so the cost of a chunk is that of the
+    slowest algorithm rather than the sum. update() returns only once every
+    hasher has consumed the chunk, so callers may reuse the buffer.
+    """
+    
+    def __init__(self, algorithms: Iterable[str]):
+        """
+        Initialize the hashers.
+        
+        Args:
+            algorithms: Algorithms to compute; xxh64 is always included
+        """
+        self.algorithms = normalize_algorithms(algorithms)
+        self.reset()
+    
+    def reset(self) -> None:
+        """Start every digest over, e.g. when a resumed copy rewinds."""
+        self._hashers = {name: HASH_ALGORITHMS[name]() for name in self.algorithms}
+        self._primary = self._hashers[PRIMARY_ALGORITHM]
+        self._secondary = [h for name, h in self._hashers.items() if name != PRIMARY_ALGORITHM]
+    
+    def update(self, data) -> None:
+        """Feed a chunk to every hasher."""
+        if not self._secondary or len(data) < PARALLEL_HASH_MIN_CHUNK:
+            for hasher in self._hashers.values():
+                hasher.update(data)
+            return
+        pool = _get_hash_pool()
+        futures = [pool.submit(hasher.update, data) for hasher in self._secondary]
+        self._primary.update(data)
+        for future in futures:
+            future.result()
+    
+    def hexdigest(self) -> str:
+        """XXH64 hex digest, as a plain xxhash object would return."""
+        return self._primary.hexdigest()
+    
+    def hexdigests(self) -> Dict[str, str]:
+        """Hex digest of every algorithm, xxh64 first."""
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+
+def hexdigests(hash_obj) -> Dict[str, str]:
+    """
+    Get every digest a hash object computed.
+    
+    Args:
+        hash_obj: MultiHasher or a plain xxh64 object
+        
+    Returns:
+        Dict[str, str]: Algorithm name -> hex digest
+    """
+    if isinstance(hash_obj, MultiHasher):
+        return hash_obj.hexdigests()
+    return {PRIMARY_ALGORITHM: hash_obj.hexdigest()}
+
+
 class ChecksumCalculator:
     """Handles file checksum calculations with progress monitoring"""
 
-    def __init__(self, display: DisplayInterface):
+    def __init__(self, display: DisplayInterface, cache_hints: bool = True):
+        """
+        Initialize the calculator.
+        
+        Args:
+            display: Display interface for progress and errors
+            cache_hints: Read files with sequential readahead and evict them
+                from the page cache afterwards; every file is read only once
+        """
         self.display = display
+        self.cache_hints = cache_hints
 
-    def create_hash(self) -> xxhash.xxh64:
-        """Create a new xxhash object for checksum calculation."""
-        return xxhash.xxh64()
+    def create_hash(self, algorithms: Optional[Iterable[str]] = None):
+        """
+        Create a new hash object for checksum calculation.
+        
+        Args:
+            algorithms: Optional algorithms to compute in the same pass
+            
+        Returns:
+            A plain xxh64 object, or a MultiHasher when algorithms other
+            than xxh64 are requested
+        """
+        names = normalize_algorithms(algorithms)
+        if len(names) == 1:
+            return xxhash.xxh64()
+        return MultiHasher(names)
+
+    def compute_checksum(self, file_path: Path,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         algorithm: str = PRIMARY_ALGORITHM) -> str:
+        """
+        Hash a file without touching the display, e.g. from a worker thread.
+        
+        Args:
+            file_path: File to hash
+            progress_callback: Optional callback receiving (bytes_processed, file_size)
+            algorithm: Hash algorithm, one of HASH_ALGORITHMS
+            
+        Returns:
+            str: Hex digest
+            
+        Raises:
+            OSError: If the file can't be read
+            KeyError: If the algorithm is not supported
+        """
+        hash_obj = HASH_ALGORITHMS[algorithm]()
+        bytes_processed = 0
+        with open(file_path, 'rb') as f, sequential_read(f, self.cache_hints):
+            file_size = os.fstat(f.fileno()).st_size
+            for chunk in iter_chunks(f, CHECKSUM_CHUNK_SIZE):
+                hash_obj.update(chunk)
+                bytes_processed += len(chunk)
+                if progress_callback:
+                    progress_callback(bytes_processed, file_size)
+        return hash_obj.hexdigest()
 
     def calculate_file_checksum(
         self, 
@@ -64,13 +232,9 @@ class ChecksumCalculator:
             )
 
             try:
-                with open(file_path, 'rb') as f:
-                    while True:
-                        try:
-                            chunk = f.read(32 * 1024 * 1024)  # 32MB chunks
-                            if not chunk:
-                                break
-                                
+                with open(file_path, 'rb') as f, sequential_read(f, self.cache_hints):
+                    try:
+                        for chunk in iter_chunks(f, CHECKSUM_CHUNK_SIZE):
                             hash_obj.update(chunk)
                             bytes_processed += len(chunk)
                             
@@ -93,14 +257,14 @@ class ChecksumCalculator:
                                     logger.warning(f"Progress callback error: {callback_err}")
                                     # Continue checksumming despite callback error
                                     
-                        except MemoryError as e:
-                            logger.error(f"Memory error processing chunk of {file_path}: {e}")
-                            self.display.show_error("Memory error")
-                            return None
-                        except IOError as e:
-                            logger.error(f"I/O error reading {file_path}: {e}")
-                            self.display.show_error("Read error")
-                            return None
+                    except MemoryError as e:
+                        logger.error(f"Memory error processing chunk of {file_path}: {e}")
+                        self.display.show_error("Memory error")
+                        return None
+                    except IOError as e:
+                        logger.error(f"I/O error reading {file_path}: {e}")
+                        self.display.show_error("Read error")
+                        return None
             
             except FileNotFoundError as e:
                 logger.error(f"File disappeared during checksum: {file_path}, {e}")
@@ -174,12 +338,8 @@ class ChecksumCalculator:
             bytes_processed = 0
             hash_obj = xxhash.xxh64()
             
-            with open(file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(32 * 1024 * 1024)  # 32MB chunks
-                    if not chunk:
-                        break
-                        
+            with open(file_path, 'rb') as f, sequential_read(f, self.cache_hints):
+                for chunk in iter_chunks(f, CHECKSUM_CHUNK_SIZE):
                     hash_obj.update(chunk)
                     bytes_processed += len(chunk)
                     
@@ -0,0 +1,317 @@
+# src/core/chunk_hashes.py
+
+import logging
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+import xxhash
+
+from .buffer_pool import get_buffer_pool
+from .page_cache import drop_pages
+
+logger = logging.getLogger(__name__)
+
+CHUNK_TREE_EXTENSION = ".tbchunks"  # Hidden sidecar next to the copy: .clip.mov.tbchunks
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024  # Bytes covered by each block hash
+CHUNK_READ_SIZE = 8 * 1024 * 1024  # Read size when hashing a block
+
+_MAGIC = b"TBCT"
+_VERSION = 1
+_ALGORITHM_XXH3_64 = 1
+_HEADER = struct.Struct("<4sHHQQ")  # magic, version, algorithm, chunk size, file size
+_DIGEST = struct.Struct("<Q")
+
+
+class ChunkTreeError(ValueError):
+    """Raised when a chunk tree sidecar is malformed"""
+
+
+def _leaf_count(file_size: int, chunk_size: int) -> int:
+    return max(1, -(-file_size // chunk_size))
+
+
+@dataclass
+class ChunkHashTree:
+    """
+    Two-level hash tree of a file: an XXH3 digest per fixed-size block and a
+    root digest over all of them.
+
+    The root says whether anything changed; the leaves say which blocks.
+    """
+    chunk_size: int
+    file_size: int
+    leaves: List[int] = field(default_factory=list)  # XXH3-64 per block, in file order
+
+    @property
+    def root(self) -> int:
+        """XXH3-64 over the concatenated leaf digests."""
+        hasher = xxhash.xxh3_64()
+        for leaf in self.leaves:
+            hasher.update(_DIGEST.pack(leaf))
+        return hasher.intdigest()
+
+    def block_range(self, index: int) -> range:
+        """Byte range of one block."""
+        start = index * self.chunk_size
+        return range(start, min(start + self.chunk_size, self.file_size))
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact sidecar format."""
+        return b"".join([
+            _HEADER.pack(_MAGIC, _VERSION, _ALGORITHM_XXH3_64, self.chunk_size, self.file_size),
+            b"".join(_DIGEST.pack(leaf) for leaf in self.leaves),
+            _DIGEST.pack(self.root),
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ChunkHashTree":
+        """
+        Parse the sidecar format.
+
+        Raises:
+            ChunkTreeError: If the data is truncated, of an unknown version,
+                or its root doesn't match its leaves
+        """
+        if len(data) < _HEADER.size:
+            raise ChunkTreeError("Chunk tree is truncated")
+        magic, version, algorithm, chunk_size, file_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or algorithm != _ALGORITHM_XXH3_64 or not chunk_size:
+            raise ChunkTreeError("Not a supported chunk tree")
+        count = _leaf_count(file_size, chunk_size)
+        if len(data) != _HEADER.size + (count + 1) * _DIGEST.size:
+            raise ChunkTreeError("Chunk tree is truncated")
+        leaves = [_DIGEST.unpack_from(data, _HEADER.size + i * _DIGEST.size)[0] for i in range(count)]
+        tree = cls(chunk_size, file_size, leaves)
+        if tree.root != _DIGEST.unpack_from(data, len(data) - _DIGEST.size)[0]:
+            raise ChunkTreeError("Chunk tree root doesn't match its blocks")
+        return tree
+
+
+def chunk_tree_path(file_path: Path) -> Path:
+    """Get the chunk tree sidecar path for a copied file."""
+    return file_path.with_name(f".{file_path.name}{CHUNK_TREE_EXTENSION}")
+
+
+def save_chunk_tree(file_path: Path, tree: ChunkHashTree) -> Path:
+    """
+    Write the chunk tree sidecar for a copied file.
+
+    Args:
+        file_path: File the tree describes
+        tree: Tree to save
+
+    Returns:
+        Path: Sidecar that was written
+
+    Raises:
+        OSError: If the sidecar can't be written
+    """
+    path = chunk_tree_path(file_path)
+    path.write_bytes(tree.to_bytes())
+    return path
+
+
+def load_chunk_tree(file_path: Path) -> Optional[ChunkHashTree]:
+    """
+    Read the chunk tree sidecar for a copied file.
+
+    Args:
+        file_path: File the tree describes
+
+    Returns:
+        The tree, or None if there is no usable sidecar
+    """
+    path = chunk_tree_path(file_path)
+    try:
+        return ChunkHashTree.from_bytes(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ChunkTreeError) as e:
+        logger.warning(f"Ignoring unreadable chunk tree {path}: {e}")
+        return None
+
+
+class ChunkHasher:
+    """
+    Hash adapter that builds a ChunkHashTree while a file is copied.
+
+    Stands in for the copy's hash object: every update is passed on to the
+    wrapped hash (which keeps producing the whole-file XXH64 for the MHL)
+    and is also hashed per block.
+    """
+
+    def __init__(self, hash_obj, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the hasher.
+
+        Args:
+            hash_obj: Hash object to pass updates on to
+            chunk_size: Bytes covered by each block hash
+        """
+        self.hash_obj = hash_obj
+        self.chunk_size = chunk_size
+        self._start()
+
+    def _start(self) -> None:
+        self._leaves: List[int] = []
+        self._block = xxhash.xxh3_64()
+        self._block_filled = 0
+        self._hashed = 0
+
+    def reset(self) -> None:
+        """Start over, e.g. when a resumed copy rewinds."""
+        self.hash_obj.reset()
+        self._start()
+
+    def update(self, data) -> None:
+        """Hash a chunk of copied data."""
+        self.hash_obj.update(data)
+        view = memoryview(data)
+        self._hashed += len(view)
+        while len(view):
+            part = view[:self.chunk_size - self._block_filled]
+            self._block.update(part)
+            self._block_filled += len(part)
+            view = view[len(part):]
+            if self._block_filled == self.chunk_size:
+                self._leaves.append(self._block.intdigest())
+                self._block = xxhash.xxh3_64()
+                self._block_filled = 0
+
+    def hexdigest(self) -> str:
+        """Digest of the wrapped hash."""
+        return self.hash_obj.hexdigest()
+
+    def tree(self) -> ChunkHashTree:
+        """Tree of everything hashed so far."""
+        leaves = list(self._leaves)
+        if self._block_filled or not leaves:
+            leaves.append(self._block.intdigest())
+        return ChunkHashTree(self.chunk_size, self._hashed, leaves)
+
+
+def _hash_block(f: BinaryIO, block: range) -> int:
+    """Hash one block of an open file; each thread needs its own file object."""
+    pool = get_buffer_pool(CHUNK_READ_SIZE)
+    buffer = pool.acquire()
+    view = memoryview(buffer)
+    hasher = xxhash.xxh3_64()
+    try:
+        f.seek(block.start)
+        remaining = len(block)
+        while remaining:
+            n = f.readinto(view[:min(len(view), remaining)])
+            if not n:
+                break  # File shorter than the block; the digest won't match
+            hasher.update(view[:n])
+            remaining -= n
+    finally:
+        pool.release(buffer)
+    return hasher.intdigest()
+
+
+def verify_chunks(file_path: Path, tree: ChunkHashTree, max_workers: int = 2,
+                  progress_callback: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    Check a file block by block against its tree, hashing blocks in parallel.
+
+    Args:
+        file_path: File to check
+        tree: Tree recorded when the file was copied
+        max_workers: Blocks hashed at once
+        progress_callback: Optional callback receiving (bytes_verified, file_size);
+            calls are serialized
+
+    Returns:
+        List[int]: Indices of blocks that don't match, in file order; every
+            block if the file has the wrong size
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    size = os.stat(file_path).st_size
+    if size != tree.file_size:
+        logger.error(f"{file_path} is {size} bytes, expected {tree.file_size}")
+        return list(range(len(tree.leaves)))
+    lock = threading.Lock()
+    verified = 0
+
+    def check(index: int) -> bool:
+        nonlocal verified
+        block = tree.block_range(index)
+        with open(file_path, 'rb', buffering=0) as f:
+            matches = _hash_block(f, block) == tree.leaves[index]
+            drop_pages(f.fileno(), block.start, len(block))
+        if progress_callback:
+            with lock:
+                verified += len(block)
+                progress_callback(verified, tree.file_size)
+        return matches
+
+    indices = range(len(tree.leaves))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(indices))),
+                            thread_name_prefix="chunk-verify") as executor:
+        return [index for index, ok in zip(indices, executor.map(check, indices)) if not ok]
+
+
+def repair_chunks(src_path: Path, dst_path: Path, tree: ChunkHashTree, blocks: List[int]) -> bool:
+    """
+    Re-copy damaged blocks from the source into an existing copy.
+
+    Each block is read from the source and checked against its leaf before
+    it is written, then read back from the copy once it is on disk. The
+    copy's modification time is left as it was.
+
+    Args:
+        src_path: Source file
+        dst_path: Copy with damaged blocks
+        tree: Tree recorded when the file was copied
+        blocks: Indices of the blocks to re-copy
+
+    Returns:
+        bool: True if every block now matches
+    """
+    pool = get_buffer_pool(tree.chunk_size)
+    buffer = pool.acquire()
+    view = memoryview(buffer)
+    try:
+        dst_stat = os.stat(dst_path)
+        if dst_stat.st_size != tree.file_size:
+            return False
+        with open(src_path, 'rb', buffering=0) as src, open(dst_path, 'r+b') as dst:
+            for index in blocks:
+                block = tree.block_range(index)
+                src.seek(block.start)
+                filled = 0
+                while filled < len(block):
+                    n = src.readinto(view[filled:len(block)])
+                    if not n:
+                        break
+                    filled += n
+                data = view[:filled]
+                if filled != len(block) or xxhash.xxh3_64_intdigest(data) != tree.leaves[index]:
+                    logger.error(f"Source block {index} of {src_path} no longer matches the copy's tree")
+                    return False
+                dst.seek(block.start)
+                dst.write(data)
+            dst.flush()
+            os.fsync(dst.fileno())
+            # Re-hash what reached the disk, not the pages just written
+            for index in blocks:
+                block = tree.block_range(index)
+                drop_pages(dst.fileno(), block.start, len(block))
+            repaired = all(_hash_block(dst, tree.block_range(i)) == tree.leaves[i] for i in blocks)
+        os.utime(dst_path, ns=(dst_stat.st_atime_ns, dst_stat.st_mtime_ns))
+    except OSError as e:
+        logger.error(f"Failed to re-copy blocks of {dst_path}: {e}")
+        return False
+    finally:
+        pool.release(buffer)
+    if repaired:
+        logger.info(f"Re-copied {len(blocks)} block(s) of {dst_path} from {src_path}")
+    return repaired
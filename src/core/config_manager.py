@@ -24,7 +24,7 @@ class TransferConfig(BaseModel):
         ],
         "# Media transfer settings": [
             "media_only_transfer", "preserve_folder_structure", 
-            "transfer_destination", "media_extensions"
+            "transfer_destination", "mirror_destinations", "media_extensions"
         ],
         "# Directory structure settings": [
             "create_date_folders", "date_folder_format", 
@@ -39,7 +39,12 @@ class TransferConfig(BaseModel):
             "success_sound_path", "error_sound_path"
         ],
         "# Advanced settings": [
-            "buffer_size", "verify_transfers", "max_transfer_threads"
+            "buffer_size", "verify_transfers", "background_verification",
+            "max_transfer_threads", "copy_mode", "resume_partial_transfers",
+            "skip_ingested_files", "verify_threads", "verify_threads_per_device",
+            "checksum_algorithms", "chunk_hash_size_mb", "release_card_before_verify",
+            "page_cache_hints", "drop_cache_before_verify", "progress_rate_hz",
+            "threaded_display", "drive_cache_ttl"
         ],
         "# Logging settings": [
             "log_level", "log_file_rotation", "log_file_max_size"
@@ -61,6 +66,7 @@ class TransferConfig(BaseModel):
     media_only_transfer: bool = True
     preserve_folder_structure: bool = True
     transfer_destination: str = "/media/transfer"  # Default destination path for embedded mode
+    mirror_destinations: List[str] = Field(default_factory=list)  # Extra drives written from the same card read
     media_extensions: List[str] = Field(default_factory=lambda: [
         # Video formats
         '.mp4', '.mov', '.mxf', '.avi', '.braw', '.r3d',
@@ -95,7 +101,22 @@ class TransferConfig(BaseModel):
     # Advanced settings
     buffer_size: int = 1024 * 1024  # 1MB default
     verify_transfers: bool = True
+    background_verification: bool = True  # Verify each file while the next one copies
+    release_card_before_verify: bool = False  # Unmount the card once read; verify destinations afterwards
     max_transfer_threads: int = 1
+    copy_mode: str = "serial"  # serial, pipelined or kernel (Linux)
+    resume_partial_transfers: bool = False  # Continue interrupted .TBPART copies from checkpoints (not with mirror_destinations)
+    page_cache_hints: bool = True  # Sequential readahead; evict copied data from the page cache (Linux)
+    drop_cache_before_verify: bool = False  # fsync and evict each copy so verification reads the disk
+    skip_ingested_files: bool = False  # Skip files already verified at the destination (needs verify_transfers); cards without a filesystem UUID are matched by volume name and capacity
+    verify_threads: int = 4  # Files verified at once, in the background of a transfer or from an MHL
+    verify_threads_per_device: int = 2  # Of those, how many may read from one drive
+    checksum_algorithms: List[str] = Field(default_factory=lambda: ["xxh64"])  # Hashes recorded per file: xxh64, xxh128, xxh3, md5, sha1
+    chunk_hash_size_mb: int = 0  # Per-block hash sidecar for files larger than this (e.g. 64); 0 disables
+    progress_rate_hz: Dict[str, float] = Field(default_factory=lambda: {
+        "web": 10.0, "lcd": 4.0, "terminal": 20.0})  # Progress updates per second per display; 0 for every update
+    threaded_display: bool = True  # Draw the LCD/terminal on its own thread so it never slows a copy
+    drive_cache_ttl: float = 5.0  # Seconds the web UI reuses drive info before querying drives again
     
     # Logging settings
     log_level: str = "INFO"
@@ -119,6 +140,63 @@ class TransferConfig(BaseModel):
             return 100 * 1024 * 1024
         return v
     
+    @field_validator('max_transfer_threads')
+    def validate_max_transfer_threads(cls, v):
+        """Ensure the number of concurrent copy workers is reasonable"""
+        if v < 1:
+            return 1
+        if v > 16:
+            return 16
+        return v
+    
+    @field_validator('verify_threads', 'verify_threads_per_device')
+    def validate_verify_threads(cls, v):
+        """Ensure the number of verification workers is reasonable"""
+        if v < 1:
+            return 1
+        if v > 32:
+            return 32
+        return v
+    
+    @field_validator('chunk_hash_size_mb')
+    def validate_chunk_hash_size(cls, v):
+        """Ensure the chunk hash block size is reasonable"""
+        if v < 0:
+            return 0
+        if v > 1024:
+            return 1024
+        return v
+    
+    @field_validator('checksum_algorithms')
+    def validate_checksum_algorithms(cls, v):
+        """Keep known algorithms only, always computing xxh64 first"""
+        valid_algorithms = ['xxh64', 'xxh128', 'xxh3', 'md5', 'sha1']
+        algorithms = ['xxh64']
+        for name in v:
+            name = name.strip().lower()
+            if name in valid_algorithms and name not in algorithms:
+                algorithms.append(name)
+        return algorithms
+    
+    @field_validator('progress_rate_hz')
+    def validate_progress_rate(cls, v):
+        """Keep progress rates between 0 (every update) and 60 per second"""
+        return {sink.strip().lower(): min(max(rate, 0.0), 60.0) for sink, rate in v.items()}
+    
+    @field_validator('drive_cache_ttl')
+    def validate_drive_cache_ttl(cls, v):
+        """Keep the drive info cache between 0 (no caching) and 60 seconds"""
+        return min(max(v, 0.0), 60.0)
+    
+    @field_validator('copy_mode')
+    def validate_copy_mode(cls, v):
+        """Validate copy engine selection"""
+        valid_modes = ['serial', 'pipelined', 'kernel']
+        v = v.lower()
+        if v not in valid_modes:
+            return 'serial'
+        return v
+    
     @field_validator('log_level')
     def validate_log_level(cls, v):
         """Validate log level"""
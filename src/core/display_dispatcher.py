@@ -0,0 +1,156 @@
+# src/core/display_dispatcher.py
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+from .interfaces.display import DisplayInterface
+from .interfaces.types import TransferProgress
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING_UPDATES = 64  # Queued calls kept while the display is stuck; oldest are dropped
+
+
+class DisplayDispatcher(DisplayInterface):
+    """
+    Runs another display's updates on a dedicated renderer thread.
+
+    Drawing can be slow: the Pi's I2C LCD sleeps between nibbles and Rich
+    redraws the whole screen. Calls made through the dispatcher are queued
+    in order and return at once, so a copy loop never waits for hardware.
+    Progress is latest-value-wins: a progress update replaces one that is
+    still waiting to be drawn.
+
+    Other attributes are passed through to the wrapped display; methods
+    called that way wait for queued updates first, keeping their output in
+    order with everything shown before.
+    """
+
+    def __init__(self, display: DisplayInterface, max_pending: int = MAX_PENDING_UPDATES):
+        """
+        Initialize the dispatcher and start its renderer thread.
+
+        Args:
+            display: Display to draw on
+            max_pending: Queued calls kept before the oldest are dropped
+        """
+        self.display = display
+        self.progress_sink = getattr(display, 'progress_sink', "")
+        self.max_pending = max(1, max_pending)
+        self._queue: Deque[Tuple[str, tuple, dict]] = deque()
+        self._cond = threading.Condition()
+        self._rendering = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="display-renderer", daemon=True)
+        self._thread.start()
+
+    def show_status(self, message: str, line: int = 0) -> None:
+        """Queue a status message."""
+        self._submit("show_status", (message, line), {})
+
+    def show_progress(self, progress: TransferProgress) -> None:
+        """Queue a progress update, replacing one not yet drawn."""
+        self._submit("show_progress", (progress,), {})
+
+    def show_error(self, message: str) -> None:
+        """Queue an error message."""
+        self._submit("show_error", (message,), {})
+
+    def clear(self, *args, **kwargs) -> None:
+        """Queue clearing the display."""
+        self._submit("clear", args, kwargs)
+
+    def _submit(self, method: str, args: tuple, kwargs: dict) -> None:
+        with self._cond:
+            if not self._closed:
+                if method == "show_progress" and self._queue and self._queue[-1][0] == method:
+                    self._queue[-1] = (method, args, kwargs)
+                else:
+                    if len(self._queue) >= self.max_pending:
+                        self._drop_oldest()
+                    self._queue.append((method, args, kwargs))
+                self._cond.notify_all()
+                return
+        self._call(method, args, kwargs)  # Closed: draw on the caller's thread
+
+    def _drop_oldest(self) -> None:
+        """Make room in a full queue, giving up stale progress before messages."""
+        for index, (method, _, _) in enumerate(self._queue):
+            if method == "show_progress":
+                del self._queue[index]
+                break
+        else:
+            method = self._queue.popleft()[0]
+        logger.debug(f"Display is falling behind, dropped a queued {method}")
+
+    def _call(self, method: str, args: tuple, kwargs: dict) -> None:
+        try:
+            getattr(self.display, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Display {method} failed: {e}")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                method, args, kwargs = self._queue.popleft()
+                self._rendering = True
+            try:
+                self._call(method, args, kwargs)
+            finally:
+                with self._cond:
+                    self._rendering = False
+                    self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued update has been drawn.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+
+        Returns:
+            bool: True if the queue drained in time
+        """
+        if threading.current_thread() is self._thread:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._rendering:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Draw what is queued and stop the renderer thread.
+
+        Later calls are drawn on the caller's thread.
+
+        Args:
+            timeout: Seconds to wait for the renderer at most
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "display":
+            raise AttributeError(name)  # Not set up yet
+        attribute = getattr(self.display, name)
+        if not callable(attribute):
+            return attribute
+
+        def call_in_order(*args, **kwargs):
+            self.flush()
+            return attribute(*args, **kwargs)
+        return call_in_order
@@ -12,16 +12,19 @@ logger = logging.getLogger(__name__)
 class FileOperationContext:
     """Context manager for file operations with standardized error handling."""
     
-    def __init__(self, display=None, sound_manager=None):
+    def __init__(self, display=None, sound_manager=None, preserve_temp_files: bool = False):
         """
         Initialize the context manager.
         
         Args:
             display: Optional display interface for showing status messages
             sound_manager: Optional sound manager for playing status sounds
+            preserve_temp_files: Keep registered temp files on error so an
+                interrupted copy can be resumed later
         """
         self.display = display
         self.sound_manager = sound_manager
+        self.preserve_temp_files = preserve_temp_files
         self.temp_files = []
         # Track whether an exception occurred inside the context block
         self.error_occurred = False
@@ -34,7 +37,11 @@ class FileOperationContext:
         if exc_type:
             self.error_occurred = True
             self._handle_exception(exc_type, exc_val)
-            self._clean_up_temp_files()
+            if self.preserve_temp_files:
+                for temp_file in self.temp_files:
+                    logger.info(f"Keeping partial file for resume: {temp_file}")
+            else:
+                self._clean_up_temp_files()
             if self.sound_manager:
                 try:
                     self.sound_manager.play_error()
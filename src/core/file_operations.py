@@ -1,11 +1,22 @@
 # src/core/file_operations.py
 
+import errno
 import logging
 import os
+import queue
 import shutil
+import sys
+import threading
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, Union, BinaryIO
+from typing import Optional, Tuple, Dict, Any, Union, BinaryIO, List
 
+from .buffer_pool import get_buffer_pool, iter_chunks
+from .page_cache import CacheTrimmer
+from .resume import (
+    CheckpointWriter, ResumeCheckpoint, prepare_resume, resume_offset,
+    discard_checkpoint
+)
 from .exceptions import FileTransferError, ChecksumError
 from .file_context import error_handler, file_operation, FileOperationContext
 from .validation import ErrorMessages
@@ -17,11 +28,409 @@ CHUNK_SIZE = 32 * 1024 * 1024  # 32MB chunks for efficient large file handling
 BUFFER_SIZE = 8 * 1024 * 1024  # 8MB buffer for improved I/O performance
 TEMP_FILE_EXTENSION = ".TBPART"  # Temporary file extension during transfer
 
+# Copy engines selectable through TransferConfig.copy_mode
+COPY_MODE_SERIAL = "serial"  # read -> write -> hash on one thread
+COPY_MODE_PIPELINED = "pipelined"  # reader, writer and hasher on separate threads
+COPY_MODE_KERNEL = "kernel"  # copy_file_range/sendfile in the kernel (Linux only)
+COPY_MODES = (COPY_MODE_SERIAL, COPY_MODE_PIPELINED, COPY_MODE_KERNEL)
+PIPELINE_DEPTH = 3  # Chunks each pipeline stage may queue (triple buffering)
+HASH_READ_SIZE = 8 * 1024 * 1024  # Reusable read buffer for hashing beside a kernel copy
+
+# Kernel-assisted copy needs Linux; elsewhere the kernel mode falls back to serial
+KERNEL_COPY_AVAILABLE = sys.platform.startswith("linux") and (
+    hasattr(os, "copy_file_range") or hasattr(os, "sendfile")
+)
+# Errors meaning "this kernel/filesystem pair can't do it", not "the copy failed"
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+
+
+class _PooledChunk:
+    """Chunk read into a pooled buffer, returned to the pool once every stage is done."""
+    
+    __slots__ = ("view", "_buffer", "_pool", "_pending", "_lock")
+    
+    def __init__(self, pool, buffer: bytearray, view: memoryview, consumers: int):
+        self.view = view
+        self._buffer = buffer
+        self._pool = pool
+        self._pending = consumers
+        self._lock = threading.Lock()
+    
+    def done(self) -> None:
+        """Mark one consumer as finished with the chunk."""
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self._pool.release(self._buffer)
+
+
+class _PipelineStage(threading.Thread):
+    """Worker thread that applies a function to every chunk from a bounded queue."""
+    
+    def __init__(self, name: str, func, depth: int, abort: threading.Event):
+        super().__init__(name=name, daemon=True)
+        self.queue = queue.Queue(maxsize=depth)
+        self.func = func
+        self.abort = abort
+        self.error: Optional[BaseException] = None
+    
+    def run(self):
+        while True:
+            chunk = self.queue.get()
+            if chunk is None:
+                return
+            try:
+                if self.error is None:
+                    self.func(chunk.view)
+            except BaseException as e:
+                self.error = e
+                self.abort.set()
+            finally:
+                # Keep draining so the reader never blocks on a dead stage
+                chunk.done()
+
+
+def _copy_stream_serial(src: BinaryIO, dst: BinaryIO, hash_obj, chunk_size: int,
+                        file_size: int, progress_callback=None) -> int:
+    """
+    Copy an open stream chunk by chunk, hashing on the same thread.
+    
+    Returns:
+        int: Number of bytes copied
+    """
+    bytes_transferred = 0
+    for chunk in iter_chunks(src, chunk_size):
+        dst.write(chunk)
+        if hash_obj:
+            hash_obj.update(chunk)
+        
+        bytes_transferred += len(chunk)
+        
+        # Update progress if callback provided
+        if progress_callback:
+            progress_callback(bytes_transferred, file_size)
+    return bytes_transferred
+
+
+def _copy_stream_pipelined(src: BinaryIO, dst: BinaryIO, hash_obj, chunk_size: int,
+                           file_size: int, progress_callback=None,
+                           depth: int = PIPELINE_DEPTH) -> int:
+    """
+    Copy an open stream with reading, writing and hashing overlapped.
+    
+    The calling thread reads chunks into pooled buffers and hands each one to
+    a writer thread and, if hashing, a hasher thread through bounded queues;
+    a buffer goes back to the pool once both stages are done. File I/O and
+    xxhash release the GIL, so throughput approaches the slower of read and
+    write instead of their sum. Progress is reported as chunks are written.
+    
+    Returns:
+        int: Number of bytes copied
+        
+    Raises:
+        Exception: Any error raised by the reader, writer or hasher
+    """
+    abort = threading.Event()
+    bytes_written = 0
+    
+    def write_chunk(chunk):
+        nonlocal bytes_written
+        dst.write(chunk)
+        bytes_written += len(chunk)
+        if progress_callback:
+            progress_callback(bytes_written, file_size)
+    
+    stages = [_PipelineStage("copy-writer", write_chunk, depth, abort)]
+    if hash_obj:
+        stages.append(_PipelineStage("copy-hasher", hash_obj.update, depth, abort))
+    for stage in stages:
+        stage.start()
+    
+    pool = get_buffer_pool(chunk_size)
+    try:
+        while not abort.is_set():
+            buffer = pool.acquire()
+            try:
+                n = src.readinto(buffer)
+            except BaseException:
+                pool.release(buffer)
+                raise
+            if not n:
+                pool.release(buffer)
+                break
+            chunk = _PooledChunk(pool, buffer, memoryview(buffer)[:n], len(stages))
+            for stage in stages:
+                stage.queue.put(chunk)
+    finally:
+        for stage in stages:
+            stage.queue.put(None)
+        for stage in stages:
+            stage.join()
+    
+    for stage in stages:
+        if stage.error is not None:
+            raise stage.error
+    return bytes_written
+
+
+def fan_out_stream(src: BinaryIO, dsts: List[BinaryIO], hash_obj=None, chunk_size: int = CHUNK_SIZE,
+                   file_size: int = 0, progress_callback=None,
+                   depth: int = PIPELINE_DEPTH) -> List[Optional[BaseException]]:
+    """
+    Copy one open source stream to several destinations, reading it once.
+    
+    Each chunk is read into a pooled buffer and queued to one writer thread
+    per destination, plus a hasher thread when hashing. Every destination has
+    its own bounded queue, so a slower drive can fall up to depth chunks
+    behind before the reader waits for it. A destination whose writer fails
+    is dropped and the others carry on. Progress reports the bytes written
+    by the slowest healthy destination.
+    
+    Args:
+        src: Source file opened for reading
+        dsts: Destination files opened for writing
+        hash_obj: Optional hash object updated once per chunk
+        chunk_size: Size of chunks to read
+        file_size: Source size used for progress reporting
+        progress_callback: Optional callback for progress updates
+        depth: Chunks each destination may queue
+        
+    Returns:
+        List with the error raised by each destination's writer, or None
+        
+    Raises:
+        Exception: Any error raised while reading or hashing the source
+    """
+    abort = threading.Event()
+    written = [0] * len(dsts)
+    reported = 0
+    progress_lock = threading.Lock()
+    writers: List[_PipelineStage] = []
+    
+    def make_writer(index: int, dst: BinaryIO):
+        def write_chunk(chunk):
+            nonlocal reported
+            dst.write(chunk)
+            with progress_lock:
+                written[index] += len(chunk)
+                healthy = [written[i] for i, writer in enumerate(writers) if writer.error is None]
+                slowest = min(healthy) if healthy else 0
+                if progress_callback and slowest > reported:
+                    reported = slowest
+                    progress_callback(slowest, file_size)
+        return write_chunk
+    
+    # Each writer gets its own abort event: one failed drive must not stop the rest
+    for index, dst in enumerate(dsts):
+        writers.append(_PipelineStage(f"copy-writer-{index}", make_writer(index, dst),
+                                      depth, threading.Event()))
+    stages = list(writers)
+    hasher = None
+    if hash_obj:
+        hasher = _PipelineStage("copy-hasher", hash_obj.update, depth, abort)
+        stages.append(hasher)
+    for stage in stages:
+        stage.start()
+    
+    pool = get_buffer_pool(chunk_size)
+    try:
+        while not abort.is_set() and any(writer.error is None for writer in writers):
+            buffer = pool.acquire()
+            try:
+                n = src.readinto(buffer)
+            except BaseException:
+                pool.release(buffer)
+                raise
+            if not n:
+                pool.release(buffer)
+                break
+            chunk = _PooledChunk(pool, buffer, memoryview(buffer)[:n], len(stages))
+            for stage in stages:
+                stage.queue.put(chunk)
+    finally:
+        for stage in stages:
+            stage.queue.put(None)
+        for stage in stages:
+            stage.join()
+    
+    if hasher and hasher.error is not None:
+        raise hasher.error
+    return [writer.error for writer in writers]
+
+
+class _FollowingHasher(threading.Thread):
+    """
+    Hashes the source right behind a kernel copy.
+    
+    The copier publishes how far it has got; the hasher only reads up to that
+    offset with pread, so it reads pages the copy has just pulled into the
+    page cache instead of going back to the card. Reads go into one pooled
+    buffer, so no per-chunk bytes objects are created.
+    """
+    
+    def __init__(self, fd: int, hash_obj, buffer_size: int = HASH_READ_SIZE, base: int = 0):
+        super().__init__(name="copy-hasher", daemon=True)
+        self.fd = fd
+        self.base = base
+        self.hash_obj = hash_obj
+        self.buffer_size = buffer_size
+        self.error: Optional[BaseException] = None
+        self._available = 0
+        self._finished = False
+        self._condition = threading.Condition()
+    
+    def publish(self, offset: int, finished: bool = False) -> None:
+        """Tell the hasher how many bytes past its start the copy has reached."""
+        with self._condition:
+            self._available = offset
+            self._finished = finished
+            self._condition.notify()
+    
+    def _read_into(self, view: memoryview, offset: int) -> int:
+        if hasattr(os, "preadv"):
+            return os.preadv(self.fd, [view], offset)
+        data = os.pread(self.fd, len(view), offset)
+        view[:len(data)] = data
+        return len(data)
+    
+    def run(self):
+        hashed = 0
+        pool = get_buffer_pool(self.buffer_size)
+        buffer = pool.acquire()
+        view = memoryview(buffer)
+        try:
+            while True:
+                with self._condition:
+                    while hashed >= self._available and not self._finished:
+                        self._condition.wait()
+                    target = self._available
+                    finished = self._finished
+                
+                while hashed < target:
+                    n = self._read_into(view[:min(len(view), target - hashed)], self.base + hashed)
+                    if n == 0:
+                        raise OSError(errno.EIO, "Source shrank while hashing")
+                    self.hash_obj.update(view[:n])
+                    hashed += n
+                
+                if finished:
+                    return
+        except BaseException as e:
+            self.error = e
+        finally:
+            pool.release(buffer)
+
+
+def _kernel_copy_chunk(method: str, src_fd: int, dst_fd: int, src_offset: int,
+                       dst_offset: int, count: int) -> int:
+    """Copy one chunk inside the kernel, returning the bytes copied (0 at EOF)."""
+    if method == "copy_file_range":
+        return os.copy_file_range(src_fd, dst_fd, count, src_offset, dst_offset)
+    # sendfile writes at the destination's file position, which tracks dst_offset
+    return os.sendfile(dst_fd, src_fd, src_offset, count)
+
+
+def _copy_stream_kernel(src: BinaryIO, dst: BinaryIO, hash_obj, chunk_size: int,
+                        file_size: int, progress_callback=None) -> int:
+    """
+    Copy an open stream with copy_file_range, falling back to sendfile.
+    
+    Data moves between the files inside the kernel, so no chunk is ever
+    materialized as a Python bytes object. When hashing, a second thread
+    hashes the source from the page cache right behind the copy. If the
+    kernel or filesystem can't do either call, the serial loop is used.
+    Copying starts at the current position of both files.
+    
+    Returns:
+        int: Number of bytes copied
+    """
+    if not KERNEL_COPY_AVAILABLE:
+        return _copy_stream_serial(src, dst, hash_obj, chunk_size, file_size, progress_callback)
+    
+    src_fd = src.fileno()
+    dst_fd = dst.fileno()
+    dst.flush()
+    src_base = src.tell()
+    dst_base = dst.tell()
+    method = "copy_file_range" if hasattr(os, "copy_file_range") else "sendfile"
+    
+    hasher = _FollowingHasher(src_fd, hash_obj, base=src_base) if hash_obj else None
+    if hasher:
+        hasher.start()
+    
+    copied = 0
+    try:
+        while True:
+            try:
+                n = _kernel_copy_chunk(method, src_fd, dst_fd, src_base + copied,
+                                       dst_base + copied, chunk_size)
+            except OSError as e:
+                if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+                if method == "copy_file_range" and hasattr(os, "sendfile"):
+                    logger.debug(f"copy_file_range unsupported ({e}), trying sendfile")
+                    method = "sendfile"
+                    continue
+                logger.debug(f"Kernel copy unsupported ({e}), using serial copy")
+                if hasher:
+                    hasher.publish(0, finished=True)
+                    hasher.join()
+                    hasher = None
+                return _copy_stream_serial(src, dst, hash_obj, chunk_size, file_size, progress_callback)
+            if n == 0:
+                break
+            copied += n
+            if hasher:
+                hasher.publish(copied)
+            
+            # Update progress if callback provided
+            if progress_callback:
+                progress_callback(copied, file_size)
+    finally:
+        if hasher:
+            hasher.publish(copied, finished=True)
+            hasher.join()
+    
+    if hasher and hasher.error is not None:
+        raise hasher.error
+    return copied
+
+
+def copy_stream(src: BinaryIO, dst: BinaryIO, hash_obj=None, chunk_size: int = CHUNK_SIZE,
+                file_size: int = 0, progress_callback=None,
+                copy_mode: str = COPY_MODE_SERIAL) -> int:
+    """
+    Copy between two open binary files using the selected copy engine.
+    
+    Args:
+        src: Source file opened for reading
+        dst: Destination file opened for writing
+        hash_obj: Optional hash object updated with every chunk
+        chunk_size: Size of chunks to read
+        file_size: Source size used for progress reporting
+        progress_callback: Optional callback for progress updates
+        copy_mode: One of COPY_MODES
+        
+    Returns:
+        int: Number of bytes copied
+    """
+    if copy_mode == COPY_MODE_PIPELINED:
+        return _copy_stream_pipelined(src, dst, hash_obj, chunk_size, file_size, progress_callback)
+    if copy_mode == COPY_MODE_KERNEL:
+        return _copy_stream_kernel(src, dst, hash_obj, chunk_size, file_size, progress_callback)
+    return _copy_stream_serial(src, dst, hash_obj, chunk_size, file_size, progress_callback)
+
 
 class FileOperations:
     """Class for handling low-level file operations with standardized error handling."""
     
-    def __init__(self, display=None, storage=None, sound_manager=None):
+    def __init__(self, display=None, storage=None, sound_manager=None,
+                 copy_mode: str = COPY_MODE_SERIAL, resume: bool = False,
+                 cache_hints: bool = True):
         """
         Initialize the file operations handler.
         
@@ -29,10 +438,86 @@ class FileOperations:
             display: Display interface for showing status messages
             storage: Storage interface for handling storage-specific operations
             sound_manager: Sound manager for playing status sounds
+            copy_mode: Copy engine to use, one of COPY_MODES
+            resume: Keep interrupted .TBPART files with chunk checkpoints and
+                continue them on the next attempt instead of starting over
+            cache_hints: Advise the kernel to read sources sequentially and
+                evict copied data from the page cache once it is written
         """
         self.display = display
         self.storage = storage
         self.sound_manager = sound_manager
+        self.copy_mode = copy_mode if copy_mode in COPY_MODES else COPY_MODE_SERIAL
+        self.resume = resume
+        self.cache_hints = cache_hints
+        self._fan_out_resume_warned = False
+    
+    def _cache_trimmer(self, src: BinaryIO, dsts: List[BinaryIO],
+                       progress_callback) -> Optional[CacheTrimmer]:
+        """
+        Wrap a copy's progress callback to keep its data out of the page cache.
+        
+        Args:
+            src: Source file opened for reading
+            dsts: Destination files being written
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            CacheTrimmer to copy with and finish() afterwards, or None when
+            page cache hints are disabled
+        """
+        if not self.cache_hints:
+            return None
+        return CacheTrimmer(src, dsts, progress_callback)
+    
+    def _prepare_temp(self, src_path: Path, temp_path: Path, hash_obj=None) -> Optional[ResumeCheckpoint]:
+        """
+        Check an existing partial copy before copying into temp_path.
+        
+        Args:
+            src_path: Source file path
+            temp_path: Temporary destination path
+            hash_obj: Optional hash object, rebuilt for any kept prefix
+            
+        Returns:
+            Checkpoint to continue from when resuming is enabled, None otherwise
+        """
+        if not self.resume:
+            return None
+        return prepare_resume(src_path, temp_path, hash_obj)
+    
+    def _copy_into_temp(self, src: BinaryIO, dst: BinaryIO, temp_path: Path, hash_obj,
+                        file_size: int, progress_callback,
+                        checkpoint: Optional[ResumeCheckpoint]) -> None:
+        """
+        Run the copy engine into an open temp file, checkpointing it when resuming.
+        
+        Args:
+            src: Source file opened for reading
+            dst: Temp file opened for writing
+            temp_path: Temporary destination path
+            hash_obj: Optional hash object to update during copy
+            file_size: Source size used for progress reporting
+            progress_callback: Optional callback for progress updates
+            checkpoint: Checkpoint from _prepare_temp, or None
+        """
+        if checkpoint is None:
+            copy_stream(src, dst, hash_obj, CHUNK_SIZE, file_size,
+                        progress_callback, self.copy_mode)
+            return
+        
+        offset = resume_offset(checkpoint)
+        src.seek(offset)
+        dst.seek(offset)
+        writer = CheckpointWriter(hash_obj, temp_path, dst, checkpoint)
+        
+        def checkpointed_progress(bytes_copied, total):
+            writer.written(offset + bytes_copied)
+            if progress_callback:
+                progress_callback(offset + bytes_copied, total)
+        
+        copy_stream(src, dst, writer, CHUNK_SIZE, file_size,
+                    checkpointed_progress, self.copy_mode)
 
     @error_handler
     def copy_file_with_hash(self, src_path: Path, dst_path: Path, 
@@ -56,7 +541,8 @@ class FileOperations:
         """
         try:
             # Use a context manager to handle temporary files and cleanup
-            with FileOperationContext(self.display, self.sound_manager) as context:
+            with FileOperationContext(self.display, self.sound_manager,
+                                      preserve_temp_files=self.resume) as context:
                 # Create a temporary destination path with .TBPART extension
                 temp_dst_path = dst_path.with_suffix(dst_path.suffix + TEMP_FILE_EXTENSION)
                 context.register_temp_file(temp_dst_path)
@@ -67,25 +553,18 @@ class FileOperations:
                 # Get file size for progress updates
                 file_size = src_path.stat().st_size
                 
+                # Continue a checkpointed partial copy if there is one
+                checkpoint = self._prepare_temp(src_path, temp_dst_path, hash_obj)
+                dst_mode = 'r+b' if checkpoint and resume_offset(checkpoint) else 'wb'
+                
                 # Copy the file with progress updates
                 with open(src_path, 'rb', buffering=BUFFER_SIZE) as src:
-                    with open(temp_dst_path, 'wb', buffering=BUFFER_SIZE) as dst:
-                        bytes_transferred = 0
-                        
-                        while True:
-                            chunk = src.read(CHUNK_SIZE)
-                            if not chunk:
-                                break
-                                
-                            dst.write(chunk)
-                            if hash_obj:
-                                hash_obj.update(chunk)
-                            
-                            bytes_transferred += len(chunk)
-                            
-                            # Update progress if callback provided
-                            if progress_callback:
-                                progress_callback(bytes_transferred, file_size)
+                    with open(temp_dst_path, dst_mode, buffering=BUFFER_SIZE) as dst:
+                        trimmer = self._cache_trimmer(src, [dst], progress_callback)
+                        self._copy_into_temp(src, dst, temp_dst_path, hash_obj, file_size,
+                                             trimmer or progress_callback, checkpoint)
+                        if trimmer:
+                            trimmer.finish()
                 
                 # If any error occurred inside the context, abort without renaming
                 if context.error_occurred:
@@ -96,17 +575,107 @@ class FileOperations:
                 if dst_path.exists():
                     dst_path.unlink()
                 temp_dst_path.rename(dst_path)
+                if self.resume:
+                    discard_checkpoint(temp_dst_path)
                 
                 # Return checksum if hash_obj provided
                 if hash_obj:
                     return True, hash_obj.hexdigest()
                 return True, None
+            
+            # The context suppressed an error raised while copying
+            return False, None
         except Exception as e:
             # Log the error
             logger.error(f"Error copying file {src_path} to {dst_path}: {e}")
             # Return failure result
             return False, None
 
+    @error_handler
+    def copy_file_to_destinations(self, src_path: Path, dst_paths: List[Path],
+                                  hash_obj=None, progress_callback=None) -> Tuple[List[bool], Optional[str]]:
+        """
+        Copy a file to several destinations at once, reading the source once.
+        
+        Every destination is written through its own .TBPART temp file and
+        renamed independently, so one failing drive does not fail the others.
+        The fan-out always uses threaded writers; copy_mode does not apply.
+        Fan-out copies keep no checkpoints, so with resume enabled an
+        interrupted copy still starts over from the first byte.
+        
+        Args:
+            src_path: Source file path
+            dst_paths: Destination file paths
+            hash_obj: Optional hash object updated with the source data
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            Tuple of (success_flags, checksum_string):
+                success_flags: One flag per destination, True if that copy succeeded
+                checksum_string: Source checksum if hash_obj provided and any copy succeeded
+        """
+        successes = [False] * len(dst_paths)
+        if self.resume and not self._fan_out_resume_warned:
+            self._fan_out_resume_warned = True
+            logger.warning("Resuming partial transfers is not supported with mirror destinations; "
+                           "interrupted copies will start over")
+        try:
+            with FileOperationContext(self.display, self.sound_manager) as context:
+                temp_paths = [dst.with_suffix(dst.suffix + TEMP_FILE_EXTENSION) for dst in dst_paths]
+                for temp_path in temp_paths:
+                    context.register_temp_file(temp_path)
+                
+                # Get file size for progress updates
+                file_size = src_path.stat().st_size
+                
+                with ExitStack() as stack:
+                    src = stack.enter_context(open(src_path, 'rb', buffering=BUFFER_SIZE))
+                    opened = []
+                    for index, temp_path in enumerate(temp_paths):
+                        try:
+                            temp_path.parent.mkdir(parents=True, exist_ok=True)
+                            opened.append((index, stack.enter_context(
+                                open(temp_path, 'wb', buffering=BUFFER_SIZE))))
+                        except OSError as e:
+                            logger.error(f"Cannot write {dst_paths[index]}: {e}")
+                    if not opened:
+                        return successes, None
+                    
+                    dsts = [dst for _, dst in opened]
+                    trimmer = self._cache_trimmer(src, dsts, progress_callback)
+                    errors = fan_out_stream(src, dsts, hash_obj, CHUNK_SIZE,
+                                            file_size, trimmer or progress_callback)
+                    if trimmer:
+                        trimmer.finish()
+                    for (index, _), error in zip(opened, errors):
+                        if error is None:
+                            successes[index] = True
+                        else:
+                            logger.error(f"Error copying file {src_path} to {dst_paths[index]}: {error}")
+                
+                # Rename finished copies; drop temp files of failed ones
+                for index, (temp_path, dst_path) in enumerate(zip(temp_paths, dst_paths)):
+                    try:
+                        if successes[index]:
+                            if dst_path.exists():
+                                dst_path.unlink()
+                            temp_path.rename(dst_path)
+                        elif temp_path.exists():
+                            temp_path.unlink()
+                    except OSError as e:
+                        logger.error(f"Error finalizing {dst_path}: {e}")
+                        successes[index] = False
+                
+                checksum = hash_obj.hexdigest() if hash_obj and any(successes) else None
+                return successes, checksum
+            
+            # The context suppressed an error raised while copying
+            return [False] * len(dst_paths), None
+        except Exception as e:
+            # Log the error
+            logger.error(f"Error copying file {src_path} to {len(dst_paths)} destinations: {e}")
+            return [False] * len(dst_paths), None
+
     @error_handler
     def verify_checksum(self, file_path: Path, expected_checksum: str, progress_callback=None) -> bool:
         """
@@ -126,7 +695,7 @@ class FileOperations:
         try:
             # Import here to avoid circular imports
             from .checksum import ChecksumCalculator
-            calculator = ChecksumCalculator(self.display)
+            calculator = ChecksumCalculator(self.display, cache_hints=self.cache_hints)
             
             # Use the checksum calculator to verify
             result = calculator.verify_checksum(
@@ -217,6 +786,7 @@ class FileOperations:
                 try:
                     if temp_file.is_file():
                         temp_file.unlink()
+                        discard_checkpoint(temp_file)
                         count += 1
                         logger.info(f"Cleaned up temporary file: {temp_file}")
                 except Exception as e:
@@ -253,7 +823,8 @@ class FileOperations:
                 raise FileTransferError(error_msg, source=src_path, error_type="access")
             
             # Use a context manager to handle temporary files and cleanup
-            with FileOperationContext(self.display, self.sound_manager) as context:
+            with FileOperationContext(self.display, self.sound_manager,
+                                      preserve_temp_files=self.resume) as context:
                 # Create a temporary destination path with .TBPART extension
                 temp_dst_path = dst_path.with_suffix(dst_path.suffix + TEMP_FILE_EXTENSION)
                 context.register_temp_file(temp_dst_path)
@@ -273,32 +844,28 @@ class FileOperations:
                         self.sound_manager.play_error()
                     raise FileTransferError(error_msg, source=src_path, error_type="access")
                 
+                # Continue a checkpointed partial copy if there is one
+                checkpoint = self._prepare_temp(src_path, temp_dst_path)
+                dst_mode = 'r+b' if checkpoint and resume_offset(checkpoint) else 'wb'
+                
                 # Copy the file with progress updates
                 try:
                     with open(src_path, 'rb', buffering=BUFFER_SIZE) as src:
-                        with open(temp_dst_path, 'wb', buffering=BUFFER_SIZE) as dst:
-                            bytes_transferred = 0
-                            
-                            while True:
-                                try:
-                                    chunk = src.read(CHUNK_SIZE)
-                                    if not chunk:
-                                        break
-                                        
-                                    dst.write(chunk)
-                                    bytes_transferred += len(chunk)
-                                    
-                                    # Update progress if callback provided
-                                    if progress_callback:
-                                        progress_callback(bytes_transferred, file_size)
-                                except (OSError, IOError) as io_error:
-                                    error_msg = f"I/O error during file transfer (drive may have been removed): {io_error}"
-                                    logger.error(error_msg)
-                                    if self.display:
-                                        self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                                    if self.sound_manager:
-                                        self.sound_manager.play_error()
-                                    raise FileTransferError(error_msg, source=src_path, error_type="io")
+                        with open(temp_dst_path, dst_mode, buffering=BUFFER_SIZE) as dst:
+                            try:
+                                trimmer = self._cache_trimmer(src, [dst], progress_callback)
+                                self._copy_into_temp(src, dst, temp_dst_path, None, file_size,
+                                                     trimmer or progress_callback, checkpoint)
+                                if trimmer:
+                                    trimmer.finish()
+                            except (OSError, IOError) as io_error:
+                                error_msg = f"I/O error during file transfer (drive may have been removed): {io_error}"
+                                logger.error(error_msg)
+                                if self.display:
+                                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
+                                if self.sound_manager:
+                                    self.sound_manager.play_error()
+                                raise FileTransferError(error_msg, source=src_path, error_type="io")
                 except (FileNotFoundError, PermissionError) as access_error:
                     error_msg = f"Source drive was removed during transfer: {access_error}"
                     logger.error(error_msg)
@@ -317,6 +884,8 @@ class FileOperations:
                 if dst_path.exists():
                     dst_path.unlink()
                 temp_dst_path.rename(dst_path)
+                if self.resume:
+                    discard_checkpoint(temp_dst_path)
                 
                 return True
         except FileTransferError:
@@ -333,7 +902,8 @@ def safe_copy_file(src_path: Path, dst_path: Path,
                  chunk_size: int = CHUNK_SIZE,
                  buffer_size: int = BUFFER_SIZE,
                  hash_obj=None,
-                 progress_callback=None) -> Tuple[bool, Optional[str]]:
+                 progress_callback=None,
+                 copy_mode: str = COPY_MODE_SERIAL) -> Tuple[bool, Optional[str]]:
     """
     Safely copy a file with optional hashing and progress updates.
     This is a standalone function that doesn't require class instantiation.
@@ -345,6 +915,7 @@ def safe_copy_file(src_path: Path, dst_path: Path,
         buffer_size: Buffer size for file I/O
         hash_obj: Optional hash object to update during copy
         progress_callback: Optional callback for progress updates
+        copy_mode: Copy engine to use, one of COPY_MODES
         
     Returns:
         Tuple of (success_flag, checksum_string):
@@ -367,22 +938,8 @@ def safe_copy_file(src_path: Path, dst_path: Path,
         # Copy the file
         with open(src_path, 'rb', buffering=buffer_size) as src:
             with open(temp_dst_path, 'wb', buffering=buffer_size) as dst:
-                bytes_transferred = 0
-                
-                while True:
-                    chunk = src.read(chunk_size)
-                    if not chunk:
-                        break
-                        
-                    dst.write(chunk)
-                    if hash_obj:
-                        hash_obj.update(chunk)
-                    
-                    bytes_transferred += len(chunk)
-                    
-                    # Update progress if callback provided
-                    if progress_callback:
-                        progress_callback(bytes_transferred, file_size)
+                copy_stream(src, dst, hash_obj, chunk_size, file_size,
+                            progress_callback, copy_mode)
         
         # If we got here, rename the temporary file to the final destination
         if dst_path.exists():
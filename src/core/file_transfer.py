@@ -4,7 +4,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Optional, Tuple, List, Any
+from typing import Optional, Tuple, List, Any, Union, Callable
 from datetime import datetime
 
 from .config_manager import TransferConfig
@@ -481,14 +481,48 @@ class FileTransfer:
             
     #         return failures, total_transferred
     
-    def copy_sd_to_dump(self, source_path: Path, destination_path: Path, log_file: Path = None) -> bool:
+    def _resolve_destinations(self, destination_path: Union[Path, List[Path]]) -> List[Path]:
+        """
+        Build the ordered list of destinations for a transfer.
+        
+        Args:
+            destination_path: Primary destination or list of destinations
+            
+        Returns:
+            List[Path]: Primary destination first, then any mirrors from the
+            argument and from the mirror_destinations setting, without duplicates
+        """
+        if isinstance(destination_path, (list, tuple)):
+            destinations = [Path(path) for path in destination_path]
+        else:
+            destinations = [destination_path]
+        mirrors = getattr(self.config, 'mirror_destinations', None)
+        if isinstance(mirrors, (list, tuple)):
+            destinations.extend(Path(mirror) for mirror in mirrors if mirror)
+        
+        unique: List[Path] = []
+        for path in destinations:
+            if path not in unique:
+                unique.append(path)
+        return unique
+    
+    def copy_sd_to_dump(self, source_path: Path, destination_path: Union[Path, List[Path]],
+                        log_file: Path = None,
+                        on_source_released: Optional[Callable[[], None]] = None) -> bool:
         """
         Copy files from source path to destination dump location.
         
+        When several destinations are given (or mirror_destinations is set),
+        the card is read once and every file is written to all of them. The
+        first destination is the primary; each mirror gets its own log file
+        (named like log_file, in the mirror's root), MHL and verification.
+        
         Args:
             source_path: Source path (SD card or other media)
-            destination_path: Destination path (dump location)
+            destination_path: Destination path (dump location), or a list of them
             log_file: Optional path to log file
+            on_source_released: Optional callback run once every file has been
+                read, before verification ends, when release_card_before_verify is set
             
         Returns:
             bool: True if transfer was successful, False otherwise
@@ -505,9 +539,17 @@ class FileTransfer:
                     self.sound_manager.play_error()
                 return False
                 
+            destinations = self._resolve_destinations(destination_path)
+            destination_path = destinations[0]
+            
             # Validate transfer preconditions
-            if not self.validator.validate_transfer(source_path, destination_path):
-                return False
+            for destination in destinations:
+                if not self.validator.validate_transfer(source_path, destination):
+                    return False
+            
+            # Finish verifications an interrupted earlier session left behind
+            for destination in destinations:
+                self.processor.verify_journals(destination)
             
             # Set up transfer environment
             env_result = self.environment.setup(source_path, destination_path)
@@ -516,6 +558,15 @@ class FileTransfer:
                 
             timestamp, target_dir, mhl_data = env_result
             
+            # Set up every mirror destination the same way
+            mirror_targets = []
+            for mirror in destinations[1:]:
+                mirror_env = self.environment.setup(source_path, mirror)
+                if not mirror_env:
+                    return False
+                mirror_log = mirror / log_file.name if log_file else None
+                mirror_targets.append((mirror_env[1], mirror_log))
+            
             # Check if the source path still exists before starting file processing
             if not source_path.exists() or not os.path.ismount(str(source_path)):
                 logger.error(f"Source drive removed before transfer could start: {source_path}")
@@ -525,7 +576,15 @@ class FileTransfer:
                 return False
             
             # Process files
-            success = self.processor.process_files(source_path, target_dir, log_file)
+            if mirror_targets:
+                success = self.processor.process_files(source_path, target_dir, log_file,
+                                                       mirror_targets=mirror_targets,
+                                                       destination_roots=destinations,
+                                                       on_source_released=on_source_released)
+            else:
+                success = self.processor.process_files(source_path, target_dir, log_file,
+                                                       destination_roots=destinations,
+                                                       on_source_released=on_source_released)
             
             # Set no_files_found flag based on processor result
             self.no_files_found = self.processor.no_files_found if hasattr(self.processor, 'no_files_found') else False
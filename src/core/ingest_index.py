@@ -0,0 +1,157 @@
+# src/core/ingest_index.py
+
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+INGEST_INDEX_FILENAME = "ingest_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested (
+    card_id TEXT NOT NULL,
+    rel_path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    destination TEXT NOT NULL,
+    dest_path TEXT NOT NULL,
+    xxh64 TEXT NOT NULL,
+    ingested_at REAL NOT NULL,
+    PRIMARY KEY (card_id, rel_path, destination)
+)
+"""
+
+
+def default_index_path() -> Path:
+    """Get the location of the ingest index in the TransferBox appdata directory."""
+    return ConfigManager.get_appdata_dir() / INGEST_INDEX_FILENAME
+
+
+def _filesystem_uuid(source_path: Path) -> Optional[str]:
+    """Find the filesystem UUID of a mounted volume on Linux, if udev exposes it."""
+    by_uuid = Path("/dev/disk/by-uuid")
+    if not sys.platform.startswith("linux") or not by_uuid.is_dir():
+        return None
+    try:
+        device = os.stat(source_path).st_dev
+        for link in by_uuid.iterdir():
+            if os.stat(link).st_rdev == device:
+                return link.name
+    except OSError as e:
+        logger.debug(f"Could not resolve filesystem UUID for {source_path}: {e}")
+    return None
+
+
+def card_identity(source_path: Path) -> str:
+    """
+    Identify a card so it is recognised when it is inserted again.
+
+    Uses the filesystem UUID where the platform exposes it, otherwise the
+    volume name together with its capacity.
+
+    Args:
+        source_path: Mount point of the card
+
+    Returns:
+        str: Identity string for the card
+    """
+    uuid = _filesystem_uuid(source_path)
+    if uuid:
+        return f"uuid:{uuid}"
+    try:
+        capacity = shutil.disk_usage(source_path).total
+    except OSError:
+        capacity = 0
+    return f"volume:{source_path.name}:{capacity}"
+
+
+class IngestIndex:
+    """
+    Local SQLite record of files already copied and verified from a card.
+
+    Each row ties a file on a card (card identity, path relative to the card
+    root, size and mtime) to a verified copy at a destination, along with its
+    xxh64. A re-inserted card can then skip every file that already has an
+    intact copy at the same destination.
+
+    The connection belongs to the thread that opened the index.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open the index, creating the database if needed.
+
+        Args:
+            db_path: Database location, defaults to default_index_path()
+        """
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, card_id: str, rel_path: str, size: int, mtime_ns: int,
+               destination: Path) -> Optional[Path]:
+        """
+        Find an intact verified copy of a card file at a destination.
+
+        Args:
+            card_id: Identity of the card, from card_identity()
+            rel_path: Path of the file relative to the card root
+            size: Current size of the source file
+            mtime_ns: Current modification time of the source file
+            destination: Destination root the copy must belong to
+
+        Returns:
+            Path of the existing copy, or None if the file must be copied
+        """
+        row = self._conn.execute(
+            "SELECT dest_path FROM ingested WHERE card_id = ? AND rel_path = ? "
+            "AND size = ? AND mtime_ns = ? AND destination = ?",
+            (card_id, rel_path, size, mtime_ns, str(destination))
+        ).fetchone()
+        if row is None:
+            return None
+        dest_path = Path(row[0])
+        try:
+            if dest_path.stat().st_size == size:
+                return dest_path
+        except OSError:
+            pass
+        logger.info(f"Indexed copy of {rel_path} is missing or changed: {dest_path}")
+        return None
+
+    def record(self, card_id: str, rel_path: str, size: int, mtime_ns: int,
+               destination: Path, dest_path: Path, checksum: str) -> None:
+        """
+        Record a verified copy of a card file.
+
+        Args:
+            card_id: Identity of the card, from card_identity()
+            rel_path: Path of the file relative to the card root
+            size: Size of the source file
+            mtime_ns: Modification time of the source file
+            destination: Destination root the copy belongs to
+            dest_path: Path of the verified copy
+            checksum: xxh64 of the copy
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingested VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (card_id, rel_path, size, mtime_ns, str(destination), str(dest_path),
+                 checksum, time.time())
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -5,6 +5,9 @@ from .types import TransferProgress
 class DisplayInterface(ABC):
     """Abstract base class for display implementations"""
     
+    # Key into TransferConfig.progress_rate_hz: "terminal", "web" or "lcd"
+    progress_sink: str = ""
+    
     @abstractmethod
     def show_status(self, message: str, line: int = 0) -> None:
         """Display a status message"""
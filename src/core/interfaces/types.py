@@ -36,4 +36,5 @@ class TransferProgress:
     file_elapsed: float = 0.0   # Current file copy elapsed time
     checksum_elapsed: float = 0.0  # Current file checksum elapsed time
     source_drive_name: str = ""  # Name of the source drive (e.g., "CanonA_002")
-    source_drive_path: str = ""  # Full path to the source drive (e.g., "/Volumes/CanonA_002")
\ No newline at end of file
+    source_drive_path: str = ""  # Full path to the source drive (e.g., "/Volumes/CanonA_002")
+    skipped_files: int = 0  # Files skipped because they were already ingested
\ No newline at end of file
@@ -4,13 +4,24 @@ import logging
 from pathlib import Path
 from datetime import datetime
 import socket
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import Tuple, Optional
+from xml.sax.saxutils import escape
+from typing import Dict, List, Tuple, Optional
 import os
 from src import __version__, __project_name__
 
 logger = logging.getLogger(__name__)
 
+MHL_FLUSH_ENTRIES = 256  # Pending entries that trigger a write
+MHL_FLUSH_INTERVAL = 2.0  # Seconds after which pending entries are written anyway
+
+# The document always ends with these closing tags, so it is valid XML after
+# every write and new entries go in just before them
+_MHL_TAIL = b"</hashes></hashlist>"
+_MHL_EMPTY_TAIL = b"<hashes /></hashlist>"
+
 def initialize_mhl_file(directory_name: str, target_dir: Path) -> Tuple[Path, ET.ElementTree, ET.Element]:
     """
     Initialize a new MHL (Media Hash List) file.
@@ -108,10 +119,12 @@ def initialize_mhl_file(directory_name: str, target_dir: Path) -> Tuple[Path, ET
             logger.error(f"Error creating XML structure: {e}")
             raise OSError(f"Failed to create MHL XML structure: {e}")
         
-        # Write the XML tree to file
+        # Write the XML tree to file, with <hashes> left open for appending
         try:
             tree = ET.ElementTree(root)
-            tree.write(mhl_filename, encoding='utf-8', xml_declaration=True)
+            document = ET.tostring(root, encoding='utf-8', xml_declaration=True)
+            with open(mhl_filename, 'wb') as f:
+                f.write(document[:-len(_MHL_EMPTY_TAIL)] + b"<hashes>" + _MHL_TAIL)
         except PermissionError as e:
             logger.error(f"Permission denied writing MHL file {mhl_filename}: {e}")
             raise OSError(f"Cannot write MHL file due to permissions: {e}")
@@ -140,6 +153,9 @@ def add_file_to_mhl(
     """
     Add a file entry to the MHL file.
     
+    The entry is written but not synced to disk; call sync_mhl_file once
+    after the last entry. Loops over many files should use MHLWriter.
+    
     Args:
         mhl_filename: Path to the MHL file
         tree: XML ElementTree object
@@ -178,57 +194,20 @@ def add_file_to_mhl(
         raise ValueError(f"File size must be positive: {file_size}")
     
     try:
-        # Create hash element
-        hash_element = ET.SubElement(hashes, "hash")
-        
-        # Add path element with size attribute
-        path = ET.SubElement(hash_element, "path", size=str(file_size))
-        
-        # Calculate relative path with error handling
         try:
-            logger.debug(f"Calculating relative path for {file_path} relative to {mhl_filename.parent}")
-            rel_path = Path(file_path).relative_to(mhl_filename.parent)
-            path.text = str(rel_path)
-            logger.debug(f"Relative path calculated: {rel_path}")
-        except ValueError as e:
-            logger.warning(f"Could not determine relative path for {file_path}: {e}")
-            # Fall back to filename only if relative path fails
-            path.text = file_path.name
-            logger.debug(f"Using filename only as fallback: {file_path.name}")
-            
-        # Add last modification date with error handling
-        try:
-            last_modification_date = ET.SubElement(path, "lastmodificationdate")
             mtime = file_path.stat().st_mtime
-            last_modification_date.text = datetime.fromtimestamp(mtime).isoformat()
-        except (OSError, ValueError) as e:
+        except OSError as e:
             logger.warning(f"Error getting modification time for {file_path}: {e}")
-            # Use current time as fallback
-            last_modification_date.text = datetime.now().isoformat()
-            
-        # Add checksum
-        xxh64 = ET.SubElement(hash_element, "xxh64", action="original")
-        xxh64.text = checksum
-        
-        # Get current timestamp with error handling
-        try:
-            timestamp = datetime.now().isoformat()
-        except Exception as e:
-            logger.warning(f"Error creating timestamp: {e}")
-            timestamp = "unknown"
-            
-        xxh64.set("hashdate", timestamp)
+            mtime = None
+        entry = _format_hash_entry(str(mhl_filename.parent), file_path, checksum, file_size, mtime)
+        hashes.append(ET.fromstring(entry))
         
-        # Write updated tree with error handling
+        # Append the entry in place instead of rewriting the whole document
+        writer = MHLWriter(mhl_filename)
         try:
-            logger.debug(f"Writing updated MHL file to {mhl_filename}")
-            tree.write(mhl_filename, encoding='utf-8', xml_declaration=True)
-        except PermissionError as e:
-            logger.error(f"Permission denied writing to MHL file {mhl_filename}: {e}")
-            raise OSError(f"Cannot write to MHL file (permission denied): {e}")
-        except IOError as e:
-            logger.error(f"I/O error writing to MHL file {mhl_filename}: {e}")
-            raise OSError(f"Failed to write to MHL file: {e}")
+            writer.append_entry(entry)
+        finally:
+            writer.close(sync=False)
             
         logger.debug(f"Added file to MHL: {file_path}")
         
@@ -240,4 +219,232 @@ def add_file_to_mhl(
         raise
     except Exception as e:
         logger.error(f"Unexpected error adding file to MHL: {e}", exc_info=True)
-        raise OSError(f"Failed to update MHL file: {e}")
\ No newline at end of file
+        raise OSError(f"Failed to update MHL file: {e}")
+
+
+def sync_mhl_file(mhl_filename: Path) -> None:
+    """
+    Sync an MHL file written with add_file_to_mhl to disk.
+    
+    Args:
+        mhl_filename: Path to the MHL file
+        
+    Raises:
+        OSError: If the file can't be synced
+    """
+    with open(mhl_filename, 'r+b') as f:
+        os.fsync(f.fileno())
+
+
+def _format_hash_entry(base_dir: str, file_path: Path, checksum: str,
+                       file_size: int, mtime: Optional[float],
+                       extra_hashes: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    Serialize the <hash> element for one file, as ElementTree would write it.
+    
+    Args:
+        base_dir: Directory of the MHL file, which paths are relative to
+        file_path: Path to the file being added
+        checksum: File's checksum
+        file_size: File size in bytes
+        mtime: File modification time, or None to use the current time
+        extra_hashes: Optional digests of other algorithms (algorithm -> hex),
+            written after the XXH64
+        
+    Returns:
+        bytes: UTF-8 encoded <hash> element
+    """
+    # Calculate relative path, falling back to the filename
+    path_text = str(file_path)
+    prefix = base_dir.rstrip(os.sep) + os.sep
+    if path_text.startswith(prefix):
+        path_text = path_text[len(prefix):]
+    else:
+        logger.warning(f"Could not determine relative path for {file_path} under {base_dir}")
+        path_text = file_path.name
+        
+    # Last modification date, using current time as fallback
+    try:
+        modified = datetime.fromtimestamp(mtime) if mtime is not None else datetime.now()
+    except (OverflowError, OSError, ValueError) as e:
+        logger.warning(f"Invalid modification time for {file_path}: {e}")
+        modified = datetime.now()
+        
+    hashdate = datetime.now().isoformat()
+    digests = f'<xxh64 action="original" hashdate="{hashdate}">{escape(checksum)}</xxh64>'
+    for algorithm, digest in (extra_hashes or {}).items():
+        if algorithm != 'xxh64':
+            digests += f'<{algorithm} action="original" hashdate="{hashdate}">{escape(digest)}</{algorithm}>'
+    return (
+        f'<hash><path size="{file_size}">{escape(path_text)}'
+        f'<lastmodificationdate>{modified.isoformat()}</lastmodificationdate></path>'
+        f'{digests}</hash>'
+    ).encode('utf-8')
+
+
+class MHLWriter:
+    """
+    Streams <hash> entries into an MHL file created by initialize_mhl_file.
+    
+    Entries are buffered and written in batches just before the closing
+    tags, which are rewritten after them, so each write costs the size of
+    the new entries rather than the whole document and the file on disk is a
+    complete, valid MHL after every flush. A crash loses at most the entries
+    still pending.
+    """
+    
+    def __init__(self, mhl_filename: Path, flush_entries: int = MHL_FLUSH_ENTRIES,
+                 flush_interval: float = MHL_FLUSH_INTERVAL):
+        """
+        Open an MHL file for appending.
+        
+        Args:
+            mhl_filename: Path to an MHL file created by initialize_mhl_file
+            flush_entries: Pending entries that trigger a write
+            flush_interval: Seconds after which pending entries are written anyway
+            
+        Raises:
+            OSError: If the file can't be opened or doesn't end in the expected closing tags
+        """
+        self.mhl_filename = mhl_filename
+        self._base_dir = str(mhl_filename.parent)
+        self.flush_entries = flush_entries
+        self.flush_interval = flush_interval
+        self.entry_count = 0
+        self._pending: List[bytes] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._file = open(mhl_filename, 'r+b')
+        try:
+            self._offset, self._reopen = self._find_tail()
+        except Exception:
+            self._file.close()
+            raise
+    
+    def _find_tail(self) -> Tuple[int, bytes]:
+        """Locate the closing tags that new entries are written in front of."""
+        end = self._file.seek(0, os.SEEK_END)
+        self._file.seek(max(0, end - len(_MHL_EMPTY_TAIL)))
+        tail = self._file.read()
+        if tail.endswith(_MHL_TAIL):
+            return end - len(_MHL_TAIL), b""
+        if tail.endswith(_MHL_EMPTY_TAIL):
+            # Written by ElementTree with no entries yet
+            return end - len(_MHL_EMPTY_TAIL), b"<hashes>"
+        raise OSError(f"MHL file does not end with closing hashlist tags: {self.mhl_filename}")
+    
+    def __enter__(self) -> "MHLWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def add(self, file_path: Path, checksum: str, file_size: int,
+            mtime: Optional[float] = None,
+            extra_hashes: Optional[Dict[str, str]] = None) -> None:
+        """
+        Add a file entry.
+        
+        Args:
+            file_path: Path to the file being added
+            checksum: File's checksum
+            file_size: File size in bytes
+            mtime: File modification time if already known; the file is
+                stat'ed otherwise
+            extra_hashes: Optional digests of other algorithms to record
+            
+        Raises:
+            OSError: If writing to the MHL file fails
+            ValueError: If input parameters are invalid
+        """
+        if not checksum:
+            raise ValueError("Valid checksum is required")
+        if file_size <= 0:
+            raise ValueError(f"File size must be positive: {file_size}")
+        if mtime is None:
+            try:
+                mtime = file_path.stat().st_mtime
+            except OSError as e:
+                logger.warning(f"Error getting modification time for {file_path}: {e}")
+        self.append_entry(_format_hash_entry(self._base_dir, file_path, checksum, file_size, mtime,
+                                             extra_hashes))
+    
+    def append_entry(self, entry: bytes) -> None:
+        """
+        Queue a serialized <hash> element, writing the batch when it is due.
+        
+        Args:
+            entry: Element for one file, from _format_hash_entry
+        """
+        with self._lock:
+            self._pending.append(entry)
+            self.entry_count += 1
+            due = (len(self._pending) >= self.flush_entries or
+                   time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write pending entries followed by the closing tags.
+        
+        Raises:
+            OSError: If writing to the MHL file fails
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending or self._file is None:
+                return
+            data = self._reopen + b"".join(self._pending)
+            try:
+                self._file.seek(self._offset)
+                self._file.write(data + _MHL_TAIL)
+                self._file.truncate()
+                self._file.flush()
+            except OSError as e:
+                logger.error(f"I/O error writing to MHL file {self.mhl_filename}: {e}")
+                raise
+            self._offset += len(data)
+            self._reopen = b""
+            self._pending.clear()
+    
+    def close(self, sync: bool = True) -> None:
+        """
+        Write any pending entries and close the file.
+        
+        Args:
+            sync: Sync the file to disk before closing it
+        
+        Raises:
+            OSError: If writing to the MHL file fails
+        """
+        if self._file is None:
+            return
+        try:
+            self.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+        finally:
+            with self._lock:
+                self._file.close()
+                self._file = None
+        logger.debug(f"Closed MHL file {self.mhl_filename} with {self.entry_count} new entries")
+
+
+def open_mhl_writer(directory_name: str, target_dir: Path) -> MHLWriter:
+    """
+    Initialize a new MHL file and open it for streaming entries.
+    
+    Args:
+        directory_name: Name of the directory being processed
+        target_dir: Path to the target directory
+        
+    Returns:
+        MHLWriter: Writer for the new file; close it when the transfer ends
+        
+    Raises:
+        OSError: If file creation fails
+        ValueError: If input parameters are invalid
+    """
+    mhl_filename, _, _ = initialize_mhl_file(directory_name, target_dir)
+    return MHLWriter(mhl_filename)
@@ -0,0 +1,327 @@
+# src/core/mhl_verifier.py
+
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .checksum import HASH_ALGORITHMS, ChecksumCalculator
+from .interfaces.display import DisplayInterface
+from .interfaces.types import TransferProgress, TransferStatus
+from .verification import DeviceLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERIFY_THREADS = 4
+DEFAULT_VERIFY_THREADS_PER_DEVICE = 2
+
+# Outcomes of verifying one file
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"  # Checksum mismatch
+STATUS_MISSING = "missing"
+STATUS_SIZE_MISMATCH = "size_mismatch"
+STATUS_UNSUPPORTED = "unsupported"  # No hash we can check
+STATUS_OUTSIDE = "outside"  # Listed path resolves outside the MHL's directory; not opened
+STATUS_ERROR = "error"
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit('}', 1)[-1]
+
+
+@dataclass
+class MHLEntry:
+    """One <hash> element of an MHL"""
+    path: Path
+    size: Optional[int]
+    hashes: Dict[str, str] = field(default_factory=dict)  # Algorithm name -> hex digest
+
+
+def iter_mhl_entries(mhl_path: Path) -> Iterator[MHLEntry]:
+    """
+    Stream the file entries of an MHL without building the whole tree.
+
+    Each <hash> element is discarded once read, so memory stays flat however
+    many entries the manifest has.
+
+    Args:
+        mhl_path: MHL file to read
+
+    Yields:
+        MHLEntry: Entries in manifest order, with paths resolved against
+            the MHL's directory
+
+    Raises:
+        ET.ParseError: If the MHL is not well-formed
+        OSError: If the MHL can't be read
+    """
+    base_dir = mhl_path.parent
+    hashes_element = None
+    for event, element in ET.iterparse(str(mhl_path), events=("start", "end")):
+        name = _local_name(element.tag)
+        if event == "start":
+            if name == "hashes":
+                hashes_element = element
+            continue
+        if name != "hash":
+            continue
+        rel_path = None
+        size = None
+        digests = {}
+        for child in element:
+            child_name = _local_name(child.tag)
+            if child_name == "path":
+                rel_path = (child.text or "").strip()
+                size_text = child.get("size")
+                size = int(size_text) if size_text and size_text.isdigit() else None
+            elif child.text:
+                digests[child_name] = child.text.strip()
+        if rel_path:
+            yield MHLEntry(base_dir / rel_path, size, digests)
+        if hashes_element is not None:
+            hashes_element.clear()
+
+
+def count_mhl_entries(mhl_path: Path) -> Tuple[int, int]:
+    """
+    Count the entries of an MHL and the bytes they cover.
+
+    Args:
+        mhl_path: MHL file to read
+
+    Returns:
+        Tuple of (entry count, total size in bytes)
+    """
+    count = 0
+    total_size = 0
+    for entry in iter_mhl_entries(mhl_path):
+        count += 1
+        total_size += entry.size or 0
+    return count, total_size
+
+
+@dataclass
+class FileVerification:
+    """Outcome of verifying one file from an MHL"""
+    path: Path
+    status: str
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+    size: int = 0
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.status == STATUS_PASSED
+
+
+@dataclass
+class MHLVerificationReport:
+    """Pass/fail report for one MHL"""
+    mhl_path: Path
+    total_files: int = 0
+    checked_files: int = 0
+    passed_files: int = 0
+    bytes_verified: int = 0
+    duration: float = 0.0
+    stopped: bool = False
+    failures: List[FileVerification] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """Whether every file in the MHL was checked and matched."""
+        return not self.stopped and self.passed_files == self.total_files
+
+    def add(self, result: FileVerification) -> None:
+        """Count one file's outcome."""
+        self.checked_files += 1
+        if result.passed:
+            self.passed_files += 1
+            self.bytes_verified += result.size
+        else:
+            self.failures.append(result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a JSON-friendly dictionary."""
+        return {
+            "mhl_path": str(self.mhl_path),
+            "success": self.success,
+            "total_files": self.total_files,
+            "checked_files": self.checked_files,
+            "passed_files": self.passed_files,
+            "failed_files": len(self.failures),
+            "bytes_verified": self.bytes_verified,
+            "duration": self.duration,
+            "stopped": self.stopped,
+            "failures": [
+                {"path": str(f.path), "status": f.status, "expected": f.expected,
+                 "actual": f.actual, "error": f.error}
+                for f in self.failures
+            ],
+        }
+
+    def summary_lines(self) -> List[str]:
+        """Human-readable report, one line per failure after the totals."""
+        verdict = "PASSED" if self.success else ("STOPPED" if self.stopped else "FAILED")
+        lines = [
+            f"MHL verification {verdict}: {self.mhl_path}",
+            f"Files passed: {self.passed_files}/{self.total_files}",
+            f"Data verified: {self.bytes_verified / (1024 * 1024):.1f} MB in {self.duration:.1f} seconds",
+        ]
+        for failure in self.failures:
+            detail = failure.error or (f"expected {failure.expected}, got {failure.actual}"
+                                       if failure.actual else "")
+            lines.append(f"  {failure.status.upper()}: {failure.path}" + (f" ({detail})" if detail else ""))
+        return lines
+
+
+class MHLVerifier:
+    """
+    Re-hashes every file referenced by an existing MHL.
+
+    The manifest is streamed, files are hashed on a bounded thread pool with
+    at most a few readers per storage device, and progress goes through the
+    DisplayInterface as files finish, in manifest order.
+    """
+
+    def __init__(self, display: DisplayInterface, max_workers: int = DEFAULT_VERIFY_THREADS,
+                 per_device: int = DEFAULT_VERIFY_THREADS_PER_DEVICE,
+                 stop_event: Optional[threading.Event] = None):
+        """
+        Initialize the verifier.
+
+        Args:
+            display: Display for progress and the final verdict
+            max_workers: Files hashed at once
+            per_device: Files hashed at once from the same storage device
+            stop_event: Optional event that stops verification early
+        """
+        self.display = display
+        self.max_workers = max(1, max_workers)
+        self.limiter = DeviceLimiter(per_device)
+        self.stop_event = stop_event
+        self.checksum_calculator = ChecksumCalculator(display)
+
+    def _verify_entry(self, entry: MHLEntry, root: str) -> FileVerification:
+        """
+        Verify one file; runs on a worker thread.
+
+        Args:
+            entry: Manifest entry to check
+            root: Resolved directory of the MHL; files outside it are refused
+        """
+        # Check the first algorithm we support, fastest first
+        algorithm = next((name for name in HASH_ALGORITHMS if name in entry.hashes), None)
+        expected = entry.hashes.get(algorithm) if algorithm else None
+        resolved = os.path.realpath(entry.path)
+        if os.path.commonpath([root, resolved]) != root:
+            return FileVerification(entry.path, STATUS_OUTSIDE, expected,
+                                    error="path is outside the MHL's directory")
+        if not expected:
+            return FileVerification(entry.path, STATUS_UNSUPPORTED,
+                                    error=f"no supported hash (found {', '.join(entry.hashes) or 'none'})")
+        try:
+            st = os.stat(entry.path)
+        except FileNotFoundError:
+            return FileVerification(entry.path, STATUS_MISSING, expected)
+        except OSError as e:
+            return FileVerification(entry.path, STATUS_ERROR, expected, error=str(e))
+        if entry.size is not None and st.st_size != entry.size:
+            return FileVerification(entry.path, STATUS_SIZE_MISMATCH, expected, size=st.st_size,
+                                    error=f"expected {entry.size} bytes, found {st.st_size}")
+        try:
+            with self.limiter.slot(st.st_dev):
+                actual = self.checksum_calculator.compute_checksum(entry.path, algorithm=algorithm)
+        except OSError as e:
+            return FileVerification(entry.path, STATUS_ERROR, expected, size=st.st_size, error=str(e))
+        status = STATUS_PASSED if actual.lower() == expected.lower() else STATUS_FAILED
+        return FileVerification(entry.path, status, expected, actual, st.st_size)
+
+    def _show_progress(self, report: MHLVerificationReport, total_size: int,
+                       result: FileVerification, started: float) -> None:
+        """Report progress after a file finishes."""
+        elapsed = time.monotonic() - started
+        try:
+            self.display.show_progress(TransferProgress(
+                current_file=result.path.name,
+                file_number=report.checked_files,
+                total_files=report.total_files,
+                bytes_transferred=result.size,
+                total_bytes=result.size,
+                total_transferred=report.bytes_verified,
+                total_size=total_size,
+                current_file_progress=1.0,
+                overall_progress=report.checked_files / report.total_files if report.total_files else 1.0,
+                status=TransferStatus.VERIFYING,
+                speed_bytes_per_sec=report.bytes_verified / elapsed if elapsed > 0 else 0.0,
+                total_elapsed=elapsed,
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to update verification progress: {e}")
+
+    def verify(self, mhl_path: Path) -> MHLVerificationReport:
+        """
+        Verify every file in an MHL.
+
+        Args:
+            mhl_path: MHL file to verify
+
+        Returns:
+            MHLVerificationReport: Outcome for the whole manifest
+
+        Raises:
+            ET.ParseError: If the MHL is not well-formed
+            OSError: If the MHL can't be read
+        """
+        mhl_path = Path(mhl_path)
+        report = MHLVerificationReport(mhl_path)
+        report.total_files, total_size = count_mhl_entries(mhl_path)
+        logger.info(f"Verifying {report.total_files} files from {mhl_path} "
+                    f"with {self.max_workers} workers")
+        self.display.show_status(f"Verifying {report.total_files} files from MHL")
+
+        root = os.path.realpath(mhl_path.parent)
+        started = time.monotonic()
+        window = self.max_workers * 2
+        pending: Deque[Future] = deque()
+
+        def collect(future: Future) -> None:
+            result = future.result()
+            report.add(result)
+            if not result.passed:
+                logger.error(f"MHL verification {result.status}: {result.path}"
+                             + (f" - {result.error}" if result.error else ""))
+            self._show_progress(report, total_size, result, started)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mhl-verify") as executor:
+            try:
+                for entry in iter_mhl_entries(mhl_path):
+                    if self.stop_event and self.stop_event.is_set():
+                        report.stopped = True
+                        break
+                    pending.append(executor.submit(self._verify_entry, entry, root))
+                    if len(pending) >= window:
+                        collect(pending.popleft())
+                while pending:
+                    collect(pending.popleft())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        report.duration = time.monotonic() - started
+        for line in report.summary_lines():
+            logger.info(line)
+        if report.success:
+            self.display.show_status(f"MHL verified: {report.passed_files} files OK")
+        elif report.stopped:
+            self.display.show_status(f"MHL verification stopped: {report.passed_files} files OK")
+        else:
+            self.display.show_error(f"MHL verify failed: {len(report.failures)} files")
+        return report
@@ -0,0 +1,358 @@
+# src/core/mount_table.py
+
+import logging
+import os
+import re
+import select
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+PRESENCE_POLL_INTERVAL = 0.25  # Seconds between checks where mount events aren't available
+MOUNT_EVENT_FALLBACK_INTERVAL = 2.0  # Safety-net check interval while waiting for mount events
+MOUNT_TABLE_POLL_INTERVAL = 0.1  # Seconds between re-reads of a mount table without change events
+
+_OCTAL_ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+
+class MountEntry(NamedTuple):
+    """One line of the mount table"""
+    mount_point: Path
+    source: str  # Mounted device, e.g. /dev/sda1
+    fstype: str
+
+
+def _unescape(field: bytes) -> str:
+    """Decode a mountinfo field, where spaces and the like are octal escaped."""
+    return os.fsdecode(_OCTAL_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), field))
+
+
+def parse_mountinfo(data: bytes) -> List[MountEntry]:
+    """
+    Parse the contents of a mountinfo file.
+
+    Args:
+        data: Raw contents of /proc/self/mountinfo (or a file in its format)
+
+    Returns:
+        List[MountEntry]: Mounts in table order; malformed lines are skipped
+    """
+    entries = []
+    for line in data.splitlines():
+        fields = line.split(b" ")
+        try:
+            separator = fields.index(b"-", 6)
+            entries.append(MountEntry(Path(_unescape(fields[4])),
+                                      _unescape(fields[separator + 2]),
+                                      fields[separator + 1].decode("ascii", "replace")))
+        except (ValueError, IndexError):
+            logger.debug(f"Skipping malformed mountinfo line: {line!r}")
+    return entries
+
+
+class MountTableMonitor:
+    """
+    Reads the mount table in-process and waits for it to change.
+
+    For the kernel's own mountinfo the wait sleeps in poll() until the kernel
+    flags a mount or unmount with POLLPRI, so waiting costs no CPU at all.
+    Any other file in the same format (tests, or platforms without mount
+    events) is re-read on a short interval instead.
+    """
+
+    def __init__(self, mountinfo_path: Union[str, Path] = MOUNTINFO_PATH,
+                 poll_interval: float = MOUNT_TABLE_POLL_INTERVAL):
+        """
+        Initialize the monitor.
+
+        Args:
+            mountinfo_path: Mount table to read
+            poll_interval: Seconds between re-reads when the file has no change events
+        """
+        self.mountinfo_path = Path(mountinfo_path)
+        self.poll_interval = poll_interval
+        self.kernel_events = (str(self.mountinfo_path).startswith("/proc/")
+                              and mount_events_available())
+        self._file = None
+        self._poller = None
+        self._wake_fds: Optional[Tuple[int, int]] = None  # Pipe that interrupts a wait
+        self._snapshot: Optional[bytes] = None
+
+    def open(self) -> "MountTableMonitor":
+        """
+        Open the mount table.
+
+        Raises:
+            OSError: If the mount table can't be opened
+        """
+        self._file = open(self.mountinfo_path, 'rb')
+        self._wake_fds = os.pipe()
+        self._poller = select.poll()
+        self._poller.register(self._wake_fds[0], select.POLLIN)
+        if self.kernel_events:
+            self._poller.register(self._file.fileno(), select.POLLPRI | select.POLLERR)
+        return self
+
+    def close(self) -> None:
+        """Close the mount table."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._wake_fds:
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
+        self._poller = None
+
+    def __enter__(self) -> "MountTableMonitor":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _read(self) -> bytes:
+        """Read the whole table, which also re-arms the kernel's change notification."""
+        self._file.seek(0)
+        self._snapshot = self._file.read()
+        return self._snapshot
+
+    def mounts(self) -> List[MountEntry]:
+        """
+        Read the current mount table.
+
+        Returns:
+            List[MountEntry]: Current mounts
+        """
+        return parse_mountinfo(self._read())
+
+    def wait_for_change(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the mount table changes.
+
+        The table is compared against the last mounts() or wait_for_change()
+        read, so a change between two calls is never missed.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+
+        Returns:
+            bool: True if the table changed, False on timeout or interrupt()
+        """
+        if self._snapshot is None:
+            self._read()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            previous = self._snapshot
+            if self._read() != previous:
+                return True
+            wait = None if self.kernel_events else self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = remaining if wait is None else min(wait, remaining)
+            events = self._poller.poll(None if wait is None else int(wait * 1000) + 1)
+            if any(fd == self._wake_fds[0] for fd, _ in events):
+                os.read(self._wake_fds[0], 512)
+                return False
+
+    def changed(self) -> bool:
+        """
+        Check without blocking whether the table changed since it was last read.
+
+        With kernel events this is a single poll() and doesn't read the table.
+
+        Returns:
+            bool: True if the next mounts() would differ from the last read
+        """
+        if self._snapshot is None:
+            return True
+        if self.kernel_events:
+            fileno = self._file.fileno()
+            return any(fd == fileno for fd, _ in self._poller.poll(0))
+        self._file.seek(0)
+        return self._file.read() != self._snapshot
+
+    def interrupt(self) -> None:
+        """Wake a thread blocked in wait_for_change(); safe to call from any thread."""
+        if self._wake_fds:
+            os.write(self._wake_fds[1], b"x")
+
+
+class MountTableCache:
+    """
+    Mount table kept in memory until the kernel reports a change.
+
+    Lookups such as the mount and filesystem type of a file then cost a
+    prefix match instead of reading the table or spawning findmnt each time.
+    Safe to share between threads.
+    """
+
+    def __init__(self, mountinfo_path: Union[str, Path] = MOUNTINFO_PATH):
+        """
+        Initialize the cache; the table is read on first use.
+
+        Args:
+            mountinfo_path: Mount table to read
+        """
+        self._monitor = MountTableMonitor(mountinfo_path)
+        self._entries: Optional[List[MountEntry]] = None
+        self._lock = threading.Lock()
+
+    def entries(self) -> List[MountEntry]:
+        """
+        Get the current mount table, re-reading it only after a change.
+
+        Returns:
+            List[MountEntry]: Current mounts
+
+        Raises:
+            OSError: If the mount table can't be read
+        """
+        with self._lock:
+            if self._entries is None:
+                self._monitor.open()
+                self._entries = self._monitor.mounts()
+            elif self._monitor.changed():
+                self._entries = self._monitor.mounts()
+            return self._entries
+
+    def find(self, path: Union[str, Path]) -> Optional[MountEntry]:
+        """
+        Find the mount a path lives on.
+
+        Args:
+            path: Any path; it is made absolute but not resolved
+
+        Returns:
+            Optional[MountEntry]: Innermost mount containing the path, if any
+        """
+        path = Path(os.path.abspath(path))
+        best = None
+        for entry in self.entries():
+            if entry.mount_point == path or entry.mount_point in path.parents:
+                if best is None or len(entry.mount_point.parts) >= len(best.mount_point.parts):
+                    best = entry
+        return best
+
+    def close(self) -> None:
+        """Release the mount table."""
+        with self._lock:
+            self._monitor.close()
+            self._entries = None
+
+
+def is_source_present(source_path: Path) -> bool:
+    """
+    Check whether a source drive is present and mounted.
+
+    Args:
+        source_path: Mount point of the source drive
+
+    Returns:
+        bool: True if the path exists and is a mount point
+    """
+    return source_path.exists() and os.path.ismount(str(source_path))
+
+
+def mount_events_available() -> bool:
+    """Check whether the kernel can notify mount table changes (Linux only)."""
+    return (sys.platform.startswith("linux") and hasattr(select, "poll")
+            and os.path.exists(MOUNTINFO_PATH))
+
+
+class SourcePresenceWatcher:
+    """
+    Watches one source drive and sets an Event as soon as it disappears.
+
+    On Linux the watcher sleeps in poll() on /proc/self/mountinfo, which the
+    kernel flags with POLLPRI whenever the mount table changes, so an
+    automounter unmounting a pulled card is noticed within milliseconds.
+    Elsewhere it checks the mount point on a short interval. Either way the
+    real check runs on the watcher thread, and the transfer's hot loop only
+    reads a flag.
+    """
+
+    def __init__(self, source_path: Path, poll_interval: float = PRESENCE_POLL_INTERVAL):
+        """
+        Initialize the watcher.
+
+        Args:
+            source_path: Mount point of the source drive
+            poll_interval: Seconds between checks without mount events
+        """
+        self.source_path = source_path
+        self.poll_interval = poll_interval
+        self.removed = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._monitor: Optional[MountTableMonitor] = None
+        self._monitor_lock = threading.Lock()
+
+    @property
+    def present(self) -> bool:
+        """Whether the source was still present at the last check."""
+        return not self.removed.is_set()
+
+    def check(self) -> bool:
+        """
+        Check the source right now, e.g. after an I/O error.
+
+        Returns:
+            bool: True if the source is still present
+        """
+        if self.removed.is_set():
+            return False
+        if is_source_present(self.source_path):
+            return True
+        logger.warning(f"Source drive no longer present: {self.source_path}")
+        self.removed.set()
+        return False
+
+    def start(self) -> "SourcePresenceWatcher":
+        """Start watching on a background thread."""
+        if self.check():
+            self._thread = threading.Thread(target=self._run, name="source-presence", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        with self._monitor_lock:
+            if self._monitor:
+                self._monitor.interrupt()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Watch until the source disappears or the watcher is stopped."""
+        try:
+            if mount_events_available():
+                self._watch_mount_events()
+                return
+        except OSError as e:
+            logger.warning(f"Mount event watching unavailable, polling instead: {e}")
+        while not self._stop.wait(self.poll_interval):
+            if not self.check():
+                return
+
+    def _watch_mount_events(self) -> None:
+        """Re-check the source whenever the kernel reports a mount table change."""
+        with self._monitor_lock:
+            self._monitor = MountTableMonitor().open()
+        try:
+            while not self._stop.is_set():
+                self._monitor.wait_for_change(MOUNT_EVENT_FALLBACK_INTERVAL)
+                if self._stop.is_set() or not self.check():
+                    return
+        finally:
+            with self._monitor_lock:
+                self._monitor.close()
+                self._monitor = None
@@ -0,0 +1,163 @@
+# src/core/page_cache.py
+
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# posix_fadvise is missing on macOS and Windows; every hint is a no-op there
+FADVISE_AVAILABLE = hasattr(os, "posix_fadvise")
+READAHEAD_WINDOW = 64 * 1024 * 1024  # Source bytes to ask the kernel to prefetch up front
+TRIM_WINDOW = 64 * 1024 * 1024  # Written bytes between page cache trims during a copy
+
+
+def _advise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    """Give the kernel one hint about an open file, ignoring failures."""
+    if not FADVISE_AVAILABLE:
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, getattr(os, advice_name))
+    except (OSError, AttributeError, ValueError) as e:
+        # e.g. ESPIPE on pipes or filesystems without page cache support
+        logger.debug(f"posix_fadvise {advice_name} failed on fd {fd}: {e}")
+
+
+def advise_sequential(fd: int) -> None:
+    """
+    Tell the kernel a file will be read front to back.
+
+    Doubles readahead for the whole file and starts prefetching its first
+    window, so reads from the card stay ahead of the copy.
+
+    Args:
+        fd: File descriptor opened for reading
+    """
+    _advise(fd, 0, 0, "POSIX_FADV_SEQUENTIAL")
+    _advise(fd, 0, READAHEAD_WINDOW, "POSIX_FADV_WILLNEED")
+
+
+def drop_pages(fd: int, offset: int = 0, length: int = 0) -> None:
+    """
+    Ask the kernel to evict a range of a file from the page cache.
+
+    Clean pages are dropped; dirty ones start writeback and stay cached
+    until it completes, so drop a written range again once it has been
+    flushed.
+
+    Args:
+        fd: Open file descriptor
+        offset: Start of the range
+        length: Length of the range, 0 for the rest of the file
+    """
+    _advise(fd, offset, length, "POSIX_FADV_DONTNEED")
+
+
+def flush_and_drop(file_path: Union[str, Path]) -> None:
+    """
+    Write a file's dirty pages to disk and evict it from the page cache.
+
+    A checksum read afterwards has to come from the device rather than
+    memory, so it checks what was actually written.
+
+    Args:
+        file_path: File to flush
+
+    Raises:
+        OSError: If the file can't be opened or synced
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        drop_pages(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def sequential_read(f: BinaryIO, enabled: bool = True) -> Iterator[BinaryIO]:
+    """
+    Read a file once: hint sequential access, then drop its pages afterwards.
+
+    Args:
+        f: File opened for reading
+        enabled: Skip both hints when False
+    """
+    if enabled:
+        advise_sequential(f.fileno())
+    try:
+        yield f
+    finally:
+        if enabled:
+            drop_pages(f.fileno())
+
+
+class CacheTrimmer:
+    """
+    Progress callback wrapper that keeps a copy from filling the page cache.
+
+    Copying a card leaves every byte read and written in the page cache,
+    pushing out what the rest of the system needs, which hurts most on a
+    Raspberry Pi. Every TRIM_WINDOW written, the new window's writeback is
+    started and the window before it, written back by now, is evicted.
+    The source is only dropped in finish(): a kernel copy hashes the
+    source from the cache behind the copy.
+    """
+
+    def __init__(self, src: BinaryIO, dsts: List[BinaryIO],
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 window: int = TRIM_WINDOW):
+        """
+        Initialize the trimmer.
+
+        Args:
+            src: Source file opened for reading
+            dsts: Destination files being written
+            progress_callback: Callback to pass progress on to
+            window: Written bytes between trims
+        """
+        self.src = src
+        self.dsts = dsts
+        self.progress_callback = progress_callback
+        self.window = window
+        self._flushing = 0  # Start of the window whose writeback was started last
+        self._trimmed = 0  # Everything before this has been evicted
+        advise_sequential(src.fileno())
+
+    def __call__(self, bytes_written: int, total: int) -> None:
+        if bytes_written - self._flushing >= self.window:
+            for dst in self.dsts:
+                drop_pages(dst.fileno(), self._trimmed, bytes_written - self._trimmed)
+            self._trimmed = self._flushing
+            self._flushing = bytes_written
+        if self.progress_callback:
+            self.progress_callback(bytes_written, total)
+
+    def finish(self) -> None:
+        """Start writeback of what is left and evict the source."""
+        for dst in self.dsts:
+            try:
+                dst.flush()
+            except (OSError, ValueError):
+                continue  # A failed destination is reported by the copy
+            drop_pages(dst.fileno())
+        drop_pages(self.src.fileno())
+
+
+def page_cache_size() -> Optional[int]:
+    """
+    Get how much memory the page cache currently holds.
+
+    Returns:
+        Bytes cached, or None where /proc/meminfo isn't available
+    """
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("Cached:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
@@ -1,7 +1,9 @@
 # src/core/progress_tracker.py
 
 import logging
-from typing import Optional, Callable, Dict, Any
+import threading
+from collections import deque
+from typing import Optional, Callable, Deque, Dict, Any
 import time
 from .interfaces.types import TransferStatus, TransferProgress
 from pathlib import Path
@@ -9,17 +11,174 @@ import re
 
 logger = logging.getLogger(__name__)
 
+MAX_PENDING_TRANSITIONS = 64  # State changes queued for a stuck display; oldest are dropped
+IDLE_TIMEOUT = 5.0  # Seconds without updates before the flusher thread exits
+FLUSH_TIMEOUT = 2.0  # Seconds complete_transfer waits for the final state to be drawn
+
+
+def progress_rate_for(display, rates: Optional[Dict[str, float]]) -> float:
+    """
+    Look up the progress update rate configured for a display.
+    
+    Args:
+        display: Display interface; its progress_sink names the rate to use
+        rates: Updates per second keyed by sink, e.g. {"lcd": 4.0}
+        
+    Returns:
+        float: Updates per second, 0 for every update
+    """
+    try:
+        return max(0.0, float((rates or {}).get(getattr(display, 'progress_sink', ''), 0.0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ProgressEmitter:
+    """
+    Shows progress for one display from its own flusher thread.
+    
+    Progress callbacks fire for every chunk copied or verified, far more
+    often than any display can usefully redraw, and a redraw can be slow.
+    Callers only record that something changed; the flusher thread draws
+    the latest state at most rate_hz times a second. Forced updates, used
+    for state changes, are captured when they are emitted and each one is
+    drawn, so a state is never skipped. The thread is started on demand
+    and exits after IDLE_TIMEOUT without updates.
+    """
+    
+    def __init__(self, snapshot: Callable[[], TransferProgress],
+                 show: Callable[[TransferProgress], None], rate_hz: float = 0.0,
+                 max_pending: int = MAX_PENDING_TRANSITIONS):
+        """
+        Initialize the emitter.
+        
+        Args:
+            snapshot: Function returning the current progress
+            show: Function displaying a progress snapshot
+            rate_hz: Maximum coalesced updates per second, 0 for as fast as drawn
+            max_pending: Forced updates queued before the oldest are dropped
+        """
+        self.snapshot = snapshot
+        self.show = show
+        self.interval = 1.0 / rate_hz if rate_hz > 0 else 0.0
+        self.max_pending = max(1, max_pending)
+        self._cond = threading.Condition()
+        self._pending: Deque[TransferProgress] = deque()
+        self._dirty = False
+        self._drawing = False
+        self._flushing = 0  # Callers waiting in flush(); draw without waiting for the interval
+        self._last_emit = 0.0
+        self._thread: Optional[threading.Thread] = None
+    
+    def emit(self, force: bool = False) -> None:
+        """
+        Queue the current progress to be shown; never waits for the display.
+        
+        Args:
+            force: Capture the state now and show it, whatever the rate limit
+        """
+        progress = self.snapshot() if force else None
+        with self._cond:
+            if force:
+                if len(self._pending) >= self.max_pending:
+                    self._pending.popleft()
+                    logger.debug("Display is falling behind, dropped a queued progress state")
+                self._pending.append(progress)
+                self._dirty = False  # The snapshot already holds earlier byte progress
+            else:
+                self._dirty = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="progress-flusher", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+    
+    def _next(self) -> Optional[TransferProgress]:
+        """
+        Wait for the next update to draw. Caller must hold the condition.
+        
+        Returns:
+            A forced snapshot, or None for the current state; the thread
+            should exit when _thread has been cleared
+        """
+        while True:
+            if self._pending:
+                return self._pending.popleft()
+            if self._dirty:
+                wait = self._last_emit + self.interval - time.monotonic()
+                if wait <= 0 or self._flushing:
+                    self._dirty = False
+                    return None
+                self._cond.wait(wait)
+            elif not self._cond.wait(IDLE_TIMEOUT) and not self._dirty and not self._pending:
+                self._thread = None
+                return None
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                progress = self._next()
+                if self._thread is None:
+                    return
+                self._drawing = True
+                self._last_emit = time.monotonic()
+            try:
+                self.show(progress if progress is not None else self.snapshot())
+            except Exception as e:
+                logger.warning(f"Failed to update display: {e}")
+            finally:
+                with self._cond:
+                    self._drawing = False
+                    self._cond.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Show everything emitted so far, without waiting for the rate limit.
+        
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+            
+        Returns:
+            bool: True if the display caught up in time
+        """
+        if threading.current_thread() is self._thread:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._dirty or self._drawing:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+
 class ProgressTracker:
-    """Class for tracking transfer progress."""
+    """
+    Class for tracking transfer progress.
     
-    def __init__(self, display=None):
+    All state changes are serialized through an internal lock so that several
+    transfer workers can report into the same tracker. Display updates are
+    drawn on the emitter's flusher thread, so a worker never waits for a
+    display. Byte progress is coalesced to the display's rate; every state
+    change (a file starting, status changes, files and the transfer
+    finishing) is shown.
+    """
+    
+    def __init__(self, display=None, rate_hz: float = 0.0):
         """
         Initialize the progress tracker.
         
         Args:
             display: Optional display interface for showing progress
+            rate_hz: Maximum display updates per second, 0 for every update
         """
         self.display = display
+        self._emitter = ProgressEmitter(self._snapshot, self._show, rate_hz)
         self.current_file = None
         self.file_number = 0
         self.total_files = 0
@@ -32,6 +191,8 @@ class ProgressTracker:
         self.status = TransferStatus.READY
         self.source_drive_name = ""
         self.source_drive_path = ""
+        self.skipped_files = 0
+        self.completed_files = 0  # Files finished; with concurrent workers this lags file_number
         
         # Time tracking for speed and ETA calculation
         self.start_time = time.time()
@@ -41,55 +202,96 @@ class ProgressTracker:
         self.last_bytes = 0
         self.speed_bytes_per_sec = 0
         self.eta_seconds = 0
+        
+        # Concurrency support: lock guarding all counters, plus a token that
+        # identifies which file currently owns the per-file display fields
+        self._lock = threading.RLock()
+        self._file_token = 0
 
-    def start_transfer(self, total_files: int, total_size: int) -> None:
+    def start_transfer(self, total_files: int, total_size: int, skipped_files: int = 0) -> None:
         """
         Start tracking progress for the entire transfer operation.
         
         Args:
             total_files: Total number of files to transfer
             total_size: Total size of all files in bytes
+            skipped_files: Files left out of the transfer as already ingested
         """
-        self.total_files = total_files
-        self.total_size = total_size
-        self.total_transferred = 0
-        self.file_number = 0
-        self.overall_progress = 0.0
-        self.status = TransferStatus.READY
-        self.start_time = time.time()
-        self.last_update_time = time.time()
-        self.last_bytes = 0
-        self.checksum_start_time = None
-        self._update_display()
+        with self._lock:
+            self.total_files = total_files
+            self.total_size = total_size
+            self.skipped_files = skipped_files
+            self.total_transferred = 0
+            self.file_number = 0
+            self.completed_files = 0
+            self.overall_progress = 0.0
+            self.status = TransferStatus.READY
+            self.start_time = time.time()
+            self.last_update_time = time.time()
+            self.last_bytes = 0
+            self.checksum_start_time = None
+        self._update_display(force=True)
     
-    def start_file(self, file_path, file_number: int, total_files: int, 
-                 file_size: int, total_size: int, total_transferred: int) -> None:
+    def start_file(self, file_path, file_number: int, total_files: Optional[int], 
+                 file_size: int, total_size: Optional[int], total_transferred: Optional[int] = None) -> int:
         """
         Start tracking progress for a new file.
         
+        The started file becomes the one shown in the per-file display fields.
+        Progress callbacks created for earlier files keep feeding the aggregate
+        byte counter but no longer drive the per-file fields.
+        
         Args:
             file_path: Path to the file being transferred
             file_number: Current file number
-            total_files: Total number of files
+            total_files: Total number of files, or None to keep the current total
             file_size: Size of the current file in bytes
-            total_size: Total size of all files in bytes
-            total_transferred: Total bytes transferred so far
+            total_size: Total size of all files in bytes, or None to keep the current total
+            total_transferred: Total bytes transferred so far, or None to keep
+                the tracker's running counter (used by concurrent transfers)
+                
+        Returns:
+            int: Token identifying this file, for create_progress_callback
+                and complete_file
         """
-        self.current_file = str(file_path.name)
-        self.file_number = file_number
-        self.total_files = total_files
-        self.bytes_transferred = 0
-        self.total_bytes = file_size
-        self.total_transferred = total_transferred
-        self.total_size = total_size
-        self.current_file_progress = 0.0
-        self.overall_progress = (file_number - 1) / total_files
-        self.status = TransferStatus.COPYING
-        self.file_start_time = time.time()
-        self.checksum_start_time = None
-        self.last_update_time = time.time()
-        self.last_bytes = 0
-        self._update_display()
+        with self._lock:
+            self._file_token += 1
+            file_token = self._file_token
+            self.current_file = str(file_path.name)
+            self.file_number = file_number
+            if total_files is not None:
+                self.total_files = total_files
+            self.bytes_transferred = 0
+            self.total_bytes = file_size
+            if total_transferred is not None:
+                self.total_transferred = total_transferred
+            if total_size is not None:
+                self.total_size = total_size
+            self.current_file_progress = 0.0
+            self.overall_progress = self.completed_files / max(self.total_files, file_number)
+            self.status = TransferStatus.COPYING
+            self.file_start_time = time.time()
+            self.checksum_start_time = None
+            self.last_update_time = time.time()
+            self.last_bytes = 0
+        self._update_display(force=True)
+        return file_token
+    
+    def update_totals(self, total_files: int, total_size: int, skipped_files: int = 0) -> None:
+        """
+        Update the transfer totals while files are still being discovered.
+        
+        The display picks the new totals up with the next progress update.
+        
+        Args:
+            total_files: Number of files known to need transferring
+            total_size: Total size of those files in bytes
+            skipped_files: Files left out of the transfer as already ingested
+        """
+        with self._lock:
+            self.total_files = total_files
+            self.total_size = total_size
+            self.skipped_files = skipped_files
     
     def update_progress(self, bytes_transferred: int = None, files_processed: int = None, 
                       total_files: int = None, status: TransferStatus = None) -> None:
@@ -102,68 +304,89 @@ class ProgressTracker:
             total_files: Total number of files
             status: Current transfer status
         """
-        current_time = time.time()
-        
-        # Handle overall transfer progress updates
-        if files_processed is not None:
-            self.file_number = files_processed
+        with self._lock:
+            status_changed = status is not None and status != self.status
             
-        if total_files is not None:
-            self.total_files = total_files
-            
-        if status is not None:
-            self.status = status
-            
-        # Handle file-specific progress updates
-        if bytes_transferred is not None:
-            # Calculate the additional bytes since last update 
-            additional_bytes = bytes_transferred - self.bytes_transferred
-            if additional_bytes > 0 and self.status == TransferStatus.COPYING:
-                # Only update total_transferred during copy operations, not checksumming
-                self.total_transferred += additional_bytes
+            # Handle overall transfer progress updates
+            if files_processed is not None:
+                self.file_number = files_processed
                 
-            # Update current file progress
-            self.bytes_transferred = bytes_transferred
-            self.current_file_progress = bytes_transferred / self.total_bytes if self.total_bytes > 0 else 1.0
-            
-            # Calculate speed (bytes per second)
-            time_delta = current_time - self.last_update_time
-            if time_delta > 0.1:  # Only update speed every 100ms to prevent division by zero/small numbers
-                bytes_delta = bytes_transferred - self.last_bytes
-                # Calculate instant speed (with smoothing)
-                instant_speed = bytes_delta / time_delta
-                # Apply exponential moving average (EMA) for smoother speed display
-                alpha = 0.3  # Smoothing factor
-                self.speed_bytes_per_sec = alpha * instant_speed + (1 - alpha) * self.speed_bytes_per_sec
+            if total_files is not None:
+                self.total_files = total_files
                 
-                # Calculate ETA
-                if self.speed_bytes_per_sec > 0:
-                    if self.status == TransferStatus.COPYING:
-                        # ETA for current file
-                        bytes_remaining = self.total_bytes - bytes_transferred
-                        self.eta_seconds = bytes_remaining / self.speed_bytes_per_sec
-                    else:
-                        # ETA for overall transfer
-                        bytes_remaining = self.total_size - self.total_transferred
-                        self.eta_seconds = bytes_remaining / self.speed_bytes_per_sec
+            if status is not None:
+                self.status = status
                 
-                # Update time and bytes for next calculation
-                self.last_update_time = current_time
-                self.last_bytes = bytes_transferred
+            # Handle file-specific progress updates
+            if bytes_transferred is not None:
+                # Calculate the additional bytes since last update 
+                additional_bytes = bytes_transferred - self.bytes_transferred
+                if additional_bytes > 0 and self.status == TransferStatus.COPYING:
+                    # Only update total_transferred during copy operations, not checksumming
+                    self.total_transferred += additional_bytes
+                self._apply_file_bytes(bytes_transferred)
+            else:
+                self._apply_overall_progress(file_level=False)
+        
+        # Update the display
+        self._update_display(force=status_changed)
+    
+    def _apply_file_bytes(self, bytes_transferred: int) -> None:
+        """
+        Update per-file progress, speed and ETA. Caller must hold the lock.
+        
+        Args:
+            bytes_transferred: Bytes processed for the displayed file
+        """
+        current_time = time.time()
+        
+        # Update current file progress
+        self.bytes_transferred = bytes_transferred
+        self.current_file_progress = bytes_transferred / self.total_bytes if self.total_bytes > 0 else 1.0
+        
+        # Calculate speed (bytes per second)
+        time_delta = current_time - self.last_update_time
+        if time_delta > 0.1:  # Only update speed every 100ms to prevent division by zero/small numbers
+            bytes_delta = bytes_transferred - self.last_bytes
+            # Calculate instant speed (with smoothing)
+            instant_speed = bytes_delta / time_delta
+            # Apply exponential moving average (EMA) for smoother speed display
+            alpha = 0.3  # Smoothing factor
+            self.speed_bytes_per_sec = alpha * instant_speed + (1 - alpha) * self.speed_bytes_per_sec
+            
+            # Calculate ETA
+            if self.speed_bytes_per_sec > 0:
+                if self.status == TransferStatus.COPYING:
+                    # ETA for current file
+                    bytes_remaining = self.total_bytes - bytes_transferred
+                    self.eta_seconds = bytes_remaining / self.speed_bytes_per_sec
+                else:
+                    # ETA for overall transfer
+                    bytes_remaining = self.total_size - self.total_transferred
+                    self.eta_seconds = bytes_remaining / self.speed_bytes_per_sec
             
-        # Calculate overall progress
+            # Update time and bytes for next calculation
+            self.last_update_time = current_time
+            self.last_bytes = bytes_transferred
+        
+        self._apply_overall_progress(file_level=True)
+    
+    def _apply_overall_progress(self, file_level: bool) -> None:
+        """
+        Recalculate overall progress. Caller must hold the lock.
+        
+        Args:
+            file_level: True when a specific file's byte progress was updated
+        """
         if self.total_files > 0:
-            if bytes_transferred is not None:
-                # If updating a specific file's progress
-                self.overall_progress = (self.file_number - 1 + self.current_file_progress) / self.total_files
+            if file_level:
+                # Finished files plus the part of the displayed file done so far
+                self.overall_progress = min(1.0, (self.completed_files + self.current_file_progress) / self.total_files)
             else:
                 # If just updating overall file count
                 self.overall_progress = self.file_number / self.total_files
         else:
             self.overall_progress = 0.0
-        
-        # Update the display
-        self._update_display()
     
     def set_status(self, status: TransferStatus) -> None:
         """
@@ -172,94 +395,161 @@ class ProgressTracker:
         Args:
             status: New transfer status
         """
-        self.status = status
-        if status == TransferStatus.CHECKSUMMING:
-            self.checksum_start_time = time.time()
-        self._update_display()
+        with self._lock:
+            self.status = status
+            if status == TransferStatus.CHECKSUMMING:
+                self.checksum_start_time = time.time()
+        self._update_display(force=True)
     
-    def complete_file(self, success: bool = True) -> None:
+    def complete_file(self, success: bool = True, file_token: Optional[int] = None) -> None:
         """
-        Mark the current file as complete.
+        Mark a file as complete.
+        
+        With concurrent workers a later file may already own the per-file
+        fields; those are then left alone and only the finished count moves.
         
         Args:
             success: Whether the transfer was successful
+            file_token: Token returned by start_file, or None for the current file
         """
-        self.status = TransferStatus.SUCCESS if success else TransferStatus.ERROR
-        self.current_file_progress = 1.0
-        self.overall_progress = self.file_number / self.total_files if self.total_files > 0 else 1.0
-        
-        # Make sure bytes_transferred matches total_bytes for display consistency
-        if success and self.bytes_transferred < self.total_bytes:
-            self.bytes_transferred = self.total_bytes
+        with self._lock:
+            self.completed_files += 1
+            self.overall_progress = (min(1.0, self.completed_files / self.total_files)
+                                     if self.total_files > 0 else 1.0)
+            if file_token is None or file_token == self._file_token:
+                self.status = TransferStatus.SUCCESS if success else TransferStatus.ERROR
+                self.current_file_progress = 1.0
+                
+                # Make sure bytes_transferred matches total_bytes for display consistency
+                if success and self.bytes_transferred < self.total_bytes:
+                    self.bytes_transferred = self.total_bytes
         
-        self._update_display()
+        self._update_display(force=True)
     
     def complete_transfer(self, successful: bool = True, stopped: bool = False) -> None:
         """
         Mark the entire transfer as complete.
         
+        Waits up to FLUSH_TIMEOUT for the final state to be drawn, so it
+        isn't shown after messages that follow the transfer.
+        
         Args:
             successful: Whether the transfer was successful
             stopped: Whether the transfer was stopped gracefully by user
         """
-        if stopped:
-            self.status = TransferStatus.STOPPED
-        else:
-            self.status = TransferStatus.SUCCESS if successful else TransferStatus.ERROR
+        with self._lock:
+            if stopped:
+                self.status = TransferStatus.STOPPED
+            else:
+                self.status = TransferStatus.SUCCESS if successful else TransferStatus.ERROR
+                
+            self.overall_progress = 1.0
             
-        self.overall_progress = 1.0
-        
-        # For display consistency, make sure total_transferred matches total_size for successful transfers
-        if (successful or stopped) and self.total_transferred < self.total_size:
-            self.total_transferred = self.total_size
+            # For display consistency, make sure total_transferred matches total_size for successful transfers
+            if (successful or stopped) and self.total_transferred < self.total_size:
+                self.total_transferred = self.total_size
             
-        self._update_display()
+        self._update_display(force=True)
+        self.flush(FLUSH_TIMEOUT)
     
-    def _update_display(self) -> None:
-        """Update the display with current progress."""
+    def _update_display(self, force: bool = False) -> None:
+        """
+        Update the display with current progress.
+        
+        Args:
+            force: Show the update now instead of coalescing it
+        """
         if self.display:
-            try:
-                now = time.time()
-                total_elapsed = now - self.start_time if self.start_time else 0.0
-                file_elapsed = now - self.file_start_time if self.file_start_time else 0.0
-                checksum_elapsed = (now - self.checksum_start_time) if (self.checksum_start_time and self.status == TransferStatus.CHECKSUMMING) else 0.0
-                progress = TransferProgress(
-                    current_file=self.current_file,
-                    file_number=self.file_number,
-                    total_files=self.total_files,
-                    bytes_transferred=self.bytes_transferred,
-                    total_bytes=self.total_bytes,
-                    total_transferred=self.total_transferred,
-                    total_size=self.total_size,
-                    current_file_progress=self.current_file_progress,
-                    overall_progress=self.overall_progress,
-                    status=self.status,
-                    speed_bytes_per_sec=getattr(self, 'speed_bytes_per_sec', 0),
-                    eta_seconds=getattr(self, 'eta_seconds', 0),
-                    total_elapsed=total_elapsed,
-                    file_elapsed=file_elapsed,
-                    checksum_elapsed=checksum_elapsed,
-                    source_drive_name=self.source_drive_name,
-                    source_drive_path=self.source_drive_path
-                )
-                self.display.show_progress(progress)
-            except Exception as e:
-                logger.warning(f"Failed to update display: {e}")
+            self._emitter.emit(force)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every progress update so far has been drawn.
+        
+        Args:
+            timeout: Seconds to wait at most, None to wait indefinitely
+            
+        Returns:
+            bool: True if the display caught up in time
+        """
+        return self._emitter.flush(timeout)
+    
+    def _show(self, progress: TransferProgress) -> None:
+        """Pass a progress snapshot to the display."""
+        self.display.show_progress(progress)
+    
+    def _snapshot(self) -> TransferProgress:
+        """
+        Build a consistent TransferProgress from the current state.
+        
+        Returns:
+            TransferProgress: Copy of the current progress values
+        """
+        with self._lock:
+            now = time.time()
+            total_elapsed = now - self.start_time if self.start_time else 0.0
+            file_elapsed = now - self.file_start_time if self.file_start_time else 0.0
+            checksum_elapsed = (now - self.checksum_start_time) if (self.checksum_start_time and self.status == TransferStatus.CHECKSUMMING) else 0.0
+            return TransferProgress(
+                current_file=self.current_file,
+                file_number=self.file_number,
+                total_files=self.total_files,
+                bytes_transferred=self.bytes_transferred,
+                total_bytes=self.total_bytes,
+                total_transferred=self.total_transferred,
+                total_size=self.total_size,
+                current_file_progress=self.current_file_progress,
+                overall_progress=self.overall_progress,
+                status=self.status,
+                speed_bytes_per_sec=getattr(self, 'speed_bytes_per_sec', 0),
+                eta_seconds=getattr(self, 'eta_seconds', 0),
+                total_elapsed=total_elapsed,
+                file_elapsed=file_elapsed,
+                checksum_elapsed=checksum_elapsed,
+                source_drive_name=self.source_drive_name,
+                source_drive_path=self.source_drive_path,
+                skipped_files=self.skipped_files
+            )
     
-    def create_progress_callback(self) -> Callable[[int, int], None]:
+    def create_progress_callback(self, phase: Optional[TransferStatus] = None,
+                                 file_token: Optional[int] = None) -> Callable[[int, int], None]:
         """
         Create a callback function for updating progress.
         
+        Each callback keeps its own byte counter, so callbacks for files that
+        are transferred concurrently add their own deltas to the aggregate
+        total without interfering with each other. Only the callback belonging
+        to the most recently started file updates the per-file fields.
+        
+        Args:
+            phase: Phase this callback reports for. COPYING bytes count toward
+                the transfer total; CHECKSUMMING bytes do not. When None, the
+                tracker's current status decides.
+            file_token: Token returned by start_file for the file this
+                callback reports on, or None for the current file
+        
         Returns:
             Callable that takes (bytes_transferred, total_bytes) as parameters
         """
+        if file_token is None:
+            with self._lock:
+                file_token = self._file_token
+        last_bytes = 0
+        
         def callback(bytes_transferred: int, total_bytes: int) -> None:
-            # Update the internal total_bytes if it's different
-            if total_bytes != self.total_bytes and total_bytes > 0:
-                self.total_bytes = total_bytes
-            
-            # Update the progress with only bytes_transferred parameter
-            self.update_progress(bytes_transferred=bytes_transferred)
+            nonlocal last_bytes
+            with self._lock:
+                current_phase = phase or self.status
+                if current_phase == TransferStatus.COPYING and bytes_transferred > last_bytes:
+                    self.total_transferred += bytes_transferred - last_bytes
+                last_bytes = bytes_transferred
+                
+                if file_token == self._file_token:
+                    # Update the internal total_bytes if it's different
+                    if total_bytes != self.total_bytes and total_bytes > 0:
+                        self.total_bytes = total_bytes
+                    self._apply_file_bytes(bytes_transferred)
+            self._update_display()
         return callback
 
     def set_source_drive(self, source_path: Path) -> None:
@@ -0,0 +1,240 @@
+# src/core/resume.py
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+import xxhash
+
+from .buffer_pool import get_buffer_pool
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_EXTENSION = ".ckpt"  # Sidecar next to the temp file: clip.mov.TBPART.ckpt
+CHECKPOINT_INTERVAL = 256 * 1024 * 1024  # Bytes covered by each checkpoint hash
+VERIFY_READ_SIZE = 32 * 1024 * 1024  # Read size when checking a partial copy
+
+
+@dataclass
+class ResumeCheckpoint:
+    """Chunk hashes proving which prefix of a partial copy is good"""
+    source_name: str
+    source_size: int
+    source_mtime_ns: int
+    interval: int = CHECKPOINT_INTERVAL
+    chunk_hashes: List[str] = field(default_factory=list)
+
+    @classmethod
+    def for_source(cls, src_path: Path, interval: int = CHECKPOINT_INTERVAL) -> "ResumeCheckpoint":
+        """Create an empty checkpoint identifying the given source file."""
+        st = src_path.stat()
+        return cls(src_path.name, st.st_size, st.st_mtime_ns, interval)
+
+    def matches_source(self, src_path: Path) -> bool:
+        """Check that the checkpoint was written for this exact source file."""
+        try:
+            st = src_path.stat()
+        except OSError:
+            return False
+        return (self.source_name == src_path.name and self.source_size == st.st_size
+                and self.source_mtime_ns == st.st_mtime_ns)
+
+
+def checkpoint_path(temp_path: Path) -> Path:
+    """Get the checkpoint sidecar path for a temp file."""
+    return temp_path.with_name(temp_path.name + CHECKPOINT_EXTENSION)
+
+
+def load_checkpoint(temp_path: Path) -> Optional[ResumeCheckpoint]:
+    """
+    Read the checkpoint sidecar for a temp file.
+
+    Args:
+        temp_path: Path of the partial copy
+
+    Returns:
+        The checkpoint, or None if missing or unreadable
+    """
+    path = checkpoint_path(temp_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return ResumeCheckpoint(**json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def save_checkpoint(temp_path: Path, checkpoint: ResumeCheckpoint) -> None:
+    """Atomically write the checkpoint sidecar for a temp file."""
+    path = checkpoint_path(temp_path)
+    staging = path.with_name(path.name + ".new")
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump(asdict(checkpoint), f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging, path)
+
+
+def discard_checkpoint(temp_path: Path) -> None:
+    """Remove the checkpoint sidecar for a temp file, if any."""
+    try:
+        checkpoint_path(temp_path).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove checkpoint for {temp_path}: {e}")
+
+
+def _hash_prefix(f: BinaryIO, length: int, *hashes) -> int:
+    """Feed the next length bytes of f into every hash, returning bytes read."""
+    pool = get_buffer_pool(VERIFY_READ_SIZE)
+    buffer = pool.acquire()
+    view = memoryview(buffer)
+    read = 0
+    try:
+        while read < length:
+            n = f.readinto(view[:min(len(view), length - read)])
+            if not n:
+                break
+            for h in hashes:
+                h.update(view[:n])
+            read += n
+    finally:
+        pool.release(buffer)
+    return read
+
+
+def prepare_resume(src_path: Path, temp_path: Path, hash_obj=None,
+                   interval: int = CHECKPOINT_INTERVAL) -> ResumeCheckpoint:
+    """
+    Work out how much of an existing partial copy can be kept.
+
+    Each checkpointed interval of the temp file is re-hashed and compared to
+    its checkpoint. The copy resumes after the last interval that matches;
+    that prefix is fed into hash_obj so the final hash covers the whole file.
+    Anything past the good prefix is truncated away.
+
+    Args:
+        src_path: Source file being copied
+        temp_path: Existing partial copy, if any
+        hash_obj: Optional streaming hash to rebuild for the kept prefix
+        interval: Checkpoint interval for a fresh checkpoint
+
+    Returns:
+        ResumeCheckpoint covering the kept prefix; resume_offset() gives
+        the offset to continue from (0 to start over)
+    """
+    fresh = ResumeCheckpoint.for_source(src_path, interval)
+    checkpoint = load_checkpoint(temp_path)
+    if checkpoint is None or not temp_path.exists():
+        return fresh
+    if not checkpoint.matches_source(src_path):
+        logger.info(f"Partial copy {temp_path} belongs to a different source, starting over")
+        return fresh
+
+    kept = 0
+    with open(temp_path, 'rb') as f:
+        for expected in checkpoint.chunk_hashes:
+            chunk_hash = xxhash.xxh64()
+            hashes = (chunk_hash, hash_obj) if hash_obj else (chunk_hash,)
+            read = _hash_prefix(f, checkpoint.interval, *hashes)
+            if read == checkpoint.interval and chunk_hash.hexdigest() == expected:
+                kept += 1
+                continue
+            if hash_obj is not None:
+                # The bad interval went into hash_obj too; rebuild it from the good prefix
+                if not hasattr(hash_obj, 'reset'):
+                    return fresh
+                hash_obj.reset()
+                f.seek(0)
+                _hash_prefix(f, kept * checkpoint.interval, hash_obj)
+            break
+
+    checkpoint.chunk_hashes = checkpoint.chunk_hashes[:kept]
+    offset = resume_offset(checkpoint)
+    if offset:
+        os.truncate(temp_path, offset)
+        logger.info(f"Resuming {src_path.name} at {offset} bytes from {temp_path}")
+    return checkpoint
+
+
+def resume_offset(checkpoint: ResumeCheckpoint) -> int:
+    """Offset a copy continues from, given the checkpoints it kept."""
+    return len(checkpoint.chunk_hashes) * checkpoint.interval
+
+
+class CheckpointWriter:
+    """
+    Hash adapter that checkpoints a copy as it goes.
+
+    Stands in for the copy's hash object: every update is passed on to the
+    wrapped hash and also hashed per checkpoint interval. A finished interval
+    is only persisted once the data it covers has been written and fsynced,
+    so a checkpoint never vouches for bytes lost in a power cut.
+    """
+
+    def __init__(self, hash_obj, temp_path: Path, dst: BinaryIO, checkpoint: ResumeCheckpoint):
+        """
+        Initialize the writer.
+
+        Args:
+            hash_obj: Hash object to pass updates on to, or None
+            temp_path: Partial copy being written
+            dst: Open destination file, used to flush and fsync
+            checkpoint: Checkpoint to extend, holding the kept prefix
+        """
+        self.hash_obj = hash_obj
+        self.temp_path = temp_path
+        self.dst = dst
+        self.checkpoint = checkpoint
+        self.interval = checkpoint.interval
+        self._hashed = resume_offset(checkpoint)
+        self._chunk_hash = xxhash.xxh64()
+        self._persisted = len(checkpoint.chunk_hashes)
+        self._lock = threading.Lock()
+
+    def update(self, data) -> None:
+        """Hash a chunk of copied data."""
+        if self.hash_obj is not None:
+            self.hash_obj.update(data)
+        view = memoryview(data)
+        with self._lock:
+            while len(view):
+                room = self.interval - (self._hashed % self.interval)
+                part = view[:room]
+                self._chunk_hash.update(part)
+                self._hashed += len(part)
+                view = view[len(part):]
+                if self._hashed % self.interval == 0:
+                    self.checkpoint.chunk_hashes.append(self._chunk_hash.hexdigest())
+                    self._chunk_hash = xxhash.xxh64()
+
+    def hexdigest(self) -> str:
+        """Digest of the wrapped hash."""
+        return self.hash_obj.hexdigest()
+
+    def written(self, offset: int) -> None:
+        """
+        Report that the copy has written up to offset; persists new checkpoints.
+
+        Must be called from the thread writing dst.
+        """
+        with self._lock:
+            ready = min(offset // self.interval, len(self.checkpoint.chunk_hashes))
+            if ready <= self._persisted:
+                return
+            snapshot = ResumeCheckpoint(**asdict(self.checkpoint))
+            snapshot.chunk_hashes = snapshot.chunk_hashes[:ready]
+        try:
+            self.dst.flush()
+            os.fsync(self.dst.fileno())
+            save_checkpoint(self.temp_path, snapshot)
+            self._persisted = ready
+        except OSError as e:
+            logger.warning(f"Failed to write checkpoint for {self.temp_path}: {e}")
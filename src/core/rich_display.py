@@ -42,6 +42,8 @@ class FileNameColumn(TextColumn):
 class RichDisplay(DisplayInterface):
     """Platform-agnostic display implementation using Rich library"""
     
+    progress_sink = "terminal"
+    
     def __init__(self):
         self.display_lock = Lock()
         self.console = Console()
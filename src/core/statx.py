@@ -0,0 +1,97 @@
+# src/core/statx.py
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+STATX_BTIME = 0x800
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx from linux/stat.h (256 bytes)"""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare", ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx():
+    """Look up glibc's statx wrapper (glibc 2.28+), or None where unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        func = libc.statx
+    except (OSError, AttributeError) as e:
+        logger.debug(f"statx not available: {e}")
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint,
+                     ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    return func
+
+
+_statx = _load_statx()
+
+
+def statx_available() -> bool:
+    """Check whether birth times can be read in-process on this system."""
+    return _statx is not None
+
+
+def birth_time(path: Union[str, Path]) -> Optional[float]:
+    """
+    Read a file's birth (creation) time with statx, without spawning a process.
+
+    Args:
+        path: File to query; symlinks are not followed
+
+    Returns:
+        Optional[float]: Birth time as a Unix timestamp, or None if the
+            platform or filesystem doesn't report one
+    """
+    if _statx is None:
+        return None
+    buf = _Statx()
+    if _statx(AT_FDCWD, os.fsencode(path), AT_SYMLINK_NOFOLLOW, STATX_BTIME, ctypes.byref(buf)) != 0:
+        errno = ctypes.get_errno()
+        logger.debug(f"statx failed for {path}: {os.strerror(errno)}")
+        return None
+    if not buf.stx_mask & STATX_BTIME:
+        return None
+    return buf.stx_btime.tv_sec + buf.stx_btime.tv_nsec / 1e9
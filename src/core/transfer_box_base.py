@@ -8,6 +8,7 @@ from threading import Event
 from src import __version__, __project_name__, __author__
 from .config_manager import ConfigManager
 from .platform_manager import PlatformManager
+from .display_dispatcher import DisplayDispatcher
 from .state_manager import StateManager
 from .file_transfer import FileTransfer
 from .sound_manager import SoundManager
@@ -36,6 +37,8 @@ class BaseTransferBox:
         
         # Create components with unified initialization
         self.display = PlatformManager.create_display()
+        if getattr(self.config, 'threaded_display', True):
+            self.display = DisplayDispatcher(self.display)
         self.storage = PlatformManager.create_storage()
         self.state_manager = StateManager(self.display)
         
@@ -92,6 +95,8 @@ class BaseTransferBox:
                 self.sound_manager.cleanup()
             except Exception as e:
                 logger.error(f"Sound manager cleanup error: {e}")
+            if isinstance(self.display, DisplayDispatcher):
+                self.display.flush(timeout=2.0)
 
     def run(self):
         """Main application loop"""
@@ -613,6 +613,7 @@ class WebUITransferBox(BaseTransferBox):
         self.display.show_status("Waiting for source drive...")
         initial_drives = self.storage.get_available_drives()
         source_drive = self.storage.wait_for_new_drive(initial_drives)
+        self.web_server.invalidate_drive_cache()
         
         if not source_drive or self.stop_event.is_set():
             return None
@@ -625,6 +626,7 @@ class WebUITransferBox(BaseTransferBox):
             self.storage.wait_for_drive_removal(source_drive)
         else:
             time.sleep(2)
+        self.web_server.invalidate_drive_cache()  # Drive gone, free space changed
         
         # Clear destination path after transfer completion to prevent automatic transfers
         self.destination_path = None
@@ -3,11 +3,15 @@
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any, Union
+from typing import Optional, Tuple, List, Dict, Any, Union, Deque, Iterator, Callable
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
 import time
 import stat
 import getpass
+import sqlite3
 
 from .config_manager import TransferConfig
 from .interfaces.display import DisplayInterface
@@ -15,31 +19,46 @@ from .interfaces.storage_inter import StorageInterface
 from .interfaces.types import TransferStatus, TransferProgress
 from .exceptions import FileTransferError, StorageError
 from .transfer_utils import (
-    get_transferable_files, calculate_transfer_totals,
+    get_transferable_files, calculate_transfer_totals, scan_source_files,
     create_destination_path, create_directory_structure,
     validate_source_path, verify_space_requirements
 )
 from .file_context import file_operation
-from .mhl_handler import initialize_mhl_file, add_file_to_mhl
+from .mhl_handler import initialize_mhl_file, open_mhl_writer, MHLWriter
 from .transfer_logger import TransferLogger, create_transfer_log
-from .progress_tracker import ProgressTracker
+from .progress_tracker import ProgressTracker, progress_rate_for
+from .buffer_pool import clear_buffer_pools
+from .checksum import hexdigests
+from .page_cache import flush_and_drop
+from .chunk_hashes import ChunkHasher, ChunkHashTree, repair_chunks, save_chunk_tree, verify_chunks
+from .verification import (
+    BackgroundVerifier, DeviceLimiter, PendingVerification, VerificationJournal,
+    find_journals, read_journal, rewrite_journal
+)
+from .ingest_index import IngestIndex, card_identity
+from .transfer_plan import TransferPlan, PlannedFile
+from .mount_table import SourcePresenceWatcher, is_source_present
 from .validation import PathValidator, ErrorMessages
 
 logger = logging.getLogger(__name__)
 
-def get_valid_media_files(source_path: Path, config) -> List[Path]:
+def iter_valid_media_files(source_path: Path, config) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
     """
-    Get a list of valid media files from the source path based on configuration.
+    Start scanning the source for files to transfer, based on configuration.
+    
+    The source is checked straight away; files are then yielded in sorted
+    path order as the scan finds them, with their stat results.
     
     Args:
         source_path: Source directory
         config: Configuration object
         
     Returns:
-        List of valid media file paths
+        Iterator of (file path, stat result or None) tuples
         
     Raises:
-        FileTransferError: If source path is invalid or inaccessible
+        FileTransferError: If source path is invalid or inaccessible, or,
+            while iterating, if the drive is removed during the scan
     """
     # Initialize parameters from config
     media_only = getattr(config, 'media_only_transfer', False)
@@ -58,50 +77,28 @@ def get_valid_media_files(source_path: Path, config) -> List[Path]:
         if not os.path.ismount(str(source_path)):
             logger.error(f"Source path is not mounted: {source_path}")
             raise FileTransferError(f"Source path is not mounted: {source_path}")
-        
-    # Get all files
-    files = []
-    
-    try:
-        if recursive:
-            # Recursively get all files (excluding hidden files and directories)
-            file_glob = source_path.glob('**/*')
-            files = []
-            
-            # Process files in chunks to check for drive removal between chunks
-            chunk_size = 100
-            file_chunk = []
-            
-            for i, f in enumerate(file_glob):
-                # Check every chunk_size files if the drive is still there
-                if i % chunk_size == 0 and i > 0:
-                    if not source_path.exists() or not os.path.ismount(str(source_path)):
-                        logger.error(f"Source drive removed during file scan: {source_path}")
-                        raise FileTransferError(f"Source drive removed during scan")
-                        
-                if f.is_file() and not any(p.startswith('.') for p in f.parts):
-                    files.append(f)
-        else:
-            # Get only files in the top directory
-            files = [f for f in source_path.iterdir() if f.is_file() and not f.name.startswith('.')]
-    except (FileNotFoundError, PermissionError, OSError) as e:
-        # Check if it's because the drive was removed
-        if not source_path.exists() or not os.path.ismount(str(source_path)):
-            logger.error(f"Source drive removed during file scan: {e}")
-            raise FileTransferError(f"Source drive removed during scan")
-        else:
-            logger.error(f"Error scanning files: {e}")
-            raise FileTransferError(f"Error scanning for files: {e}")
     
-    # Filter by media extensions if needed
-    if media_only and media_extensions:
-        files = [f for f in files if f.suffix.lower() in media_extensions]
+    extensions = media_extensions if media_only and media_extensions else None
+    return scan_source_files(source_path, extensions, recursive)
+
+
+def get_valid_media_files(source_path: Path, config) -> List[Path]:
+    """
+    Get a list of valid media files from the source path based on configuration.
     
-    # Log result
+    Args:
+        source_path: Source directory
+        config: Configuration object
+        
+    Returns:
+        List of valid media file paths, sorted
+        
+    Raises:
+        FileTransferError: If source path is invalid or inaccessible
+    """
+    files = [path for path, _ in iter_valid_media_files(source_path, config)]
     logger.info(f"Found {len(files)} valid files to transfer")
-    
-    # Sort files for consistent ordering
-    return sorted(files)
+    return files
 
 class TransferValidator:
     """Validates transfer preconditions and requirements"""
@@ -276,8 +273,68 @@ class TransferEnvironment:
             return None
 
 
+@dataclass
+class FileTransferResult:
+    """Outcome of transferring a single file, recorded after the copy finishes"""
+    file_path: Path
+    file_number: int
+    dest_path: Optional[Path] = None
+    file_size: int = 0
+    source_mtime_ns: int = 0
+    source_mode: int = 0
+    success: bool = False
+    checksum: Optional[str] = None
+    checksums: Dict[str, str] = field(default_factory=dict)  # Every digest computed, algorithm -> hex
+    chunk_tree: Optional[ChunkHashTree] = None  # Per-block hashes, for files big enough to have them
+    error_message: Optional[str] = None
+    source_removed: bool = False
+    transfer_error: bool = False  # Copy raised; reported once by the coordinating thread
+    progress_token: Optional[int] = None  # From ProgressTracker.start_file
+    duration: float = 0.0
+    messages: List[str] = field(default_factory=list)
+    pending_verification: bool = False  # Copied, checksum still to be verified
+    mirror_results: List["FileTransferResult"] = field(default_factory=list)  # One per mirror destination
+
+
+@dataclass
+class DestinationSession:
+    """Log, MHL and counters for one mirror destination of a transfer session"""
+    target_dir: Path
+    transfer_logger: TransferLogger
+    mhl_data: Optional[MHLWriter] = None
+    successful_files: int = 0
+    total_data_transferred: int = 0
+    failures: List[Path] = field(default_factory=list)
+    
+    def count(self, result: FileTransferResult) -> None:
+        """Add a recorded file to this destination's counters."""
+        if result.success:
+            self.successful_files += 1
+            self.total_data_transferred += result.file_size
+        else:
+            self.failures.append(result.file_path)
+
+
 class FileProcessor:
-    """Processes files for transfer"""
+    """
+    Processes files for transfer.
+    
+    Files are copied by a pool of ``max_transfer_threads`` workers. Results are
+    recorded (transfer log, MHL, per-file progress completion) on the calling
+    thread in source order, so the log and MHL read the same regardless of how
+    many files were in flight.
+    
+    With ``background_verification`` enabled, a copied file is verified on a
+    background worker while the next file is read from the card; it is only
+    recorded once its verification has finished.
+    
+    Mirror destinations passed to process_files are written from the same
+    source read. Each gets its own verification, MHL and transfer log.
+    
+    With ``skip_ingested_files`` and ``verify_transfers`` enabled, verified
+    copies are recorded in the ingest index, and files of a re-inserted card
+    that already have an intact copy at every destination are skipped.
+    """
     
     def __init__(self, display: DisplayInterface, storage: StorageInterface, 
                  config: TransferConfig, sound_manager=None, stop_event=None):
@@ -299,10 +356,175 @@ class FileProcessor:
         self.no_files_found = False
         self.stop_requested = False  # Track if stop was requested
         
-        # Create progress tracker
-        self.progress_tracker = ProgressTracker(display)
+        # Session counters, updated as results are recorded
+        self._successful_files = 0
+        self._total_data_transferred = 0
+        self._failures: List[Path] = []
+        
+        # Background verifier, active only while process_files runs
+        self._verifier: Optional[BackgroundVerifier] = None
+        self._verify_limiter = DeviceLimiter(getattr(config, 'verify_threads_per_device', 2))
+        self._journal: Optional[VerificationJournal] = None  # Set when the card is released early
+        self._source_released = False
+        self._source_removed_announced = False  # Error shown and sound played for this transfer
+        self._transfer_error_announced = False  # TRANSFER_ERROR shown for this transfer
+        
+        # Extra destinations written alongside target_dir
+        self._mirrors: List[DestinationSession] = []
         
-    def process_files(self, source_path: Path, target_dir: Path, log_file: Path = None) -> bool:
+        # Source drive watcher, active only while process_files runs
+        self._presence: Optional[SourcePresenceWatcher] = None
+        
+        # Ingest index state, active only while process_files runs
+        self._ingest_index: Optional[IngestIndex] = None
+        self._card_id: Optional[str] = None
+        self._source_root: Optional[Path] = None
+        self._destination_roots: List[Path] = []
+        self._skipped_files = 0
+        
+        # Create progress tracker, coalescing updates to the display's rate
+        self.progress_tracker = ProgressTracker(
+            display, progress_rate_for(display, getattr(config, 'progress_rate_hz', None)))
+    
+    def _get_worker_count(self) -> int:
+        """
+        Get the number of concurrent copy workers from configuration.
+        
+        Returns:
+            int: Number of worker threads (at least 1)
+        """
+        try:
+            return max(1, int(getattr(self.config, 'max_transfer_threads', 1) or 1))
+        except (TypeError, ValueError):
+            return 1
+    
+    def _use_background_verification(self) -> bool:
+        """Check whether verification should overlap with the next copy."""
+        return bool(getattr(self.config, 'verify_transfers', False) and
+                    getattr(self.config, 'background_verification', True))
+    
+    def _get_verify_worker_count(self) -> int:
+        """
+        Get the number of background verification workers from configuration.
+        
+        Returns:
+            int: Number of verification threads (at least 1)
+        """
+        try:
+            return max(1, int(getattr(self.config, 'verify_threads', 1) or 1))
+        except (TypeError, ValueError):
+            return 1
+    
+    def _create_file_operations(self):
+        """Create the FileOperations instance used for copying and verifying."""
+        from .file_operations import FileOperations
+        return FileOperations(self.display, self.storage, self.sound_manager,
+                              copy_mode=getattr(self.config, 'copy_mode', 'serial'),
+                              resume=getattr(self.config, 'resume_partial_transfers', False),
+                              cache_hints=getattr(self.config, 'page_cache_hints', True))
+    
+    def _open_ingest_index(self) -> Optional[IngestIndex]:
+        """
+        Open the ingest index if skipping already ingested files is enabled.
+        
+        Returns:
+            IngestIndex, or None if disabled or the index can't be opened
+        """
+        if not (getattr(self.config, 'verify_transfers', False) and
+                getattr(self.config, 'skip_ingested_files', False)):
+            return None
+        try:
+            return IngestIndex()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Ingest index unavailable, copying every file: {e}")
+            return None
+    
+    def _is_ingested(self, planned: PlannedFile, transfer_logger) -> bool:
+        """
+        Check whether a file already has a verified copy at every destination.
+        
+        Skipped files are counted and logged to every destination's log.
+        
+        Args:
+            planned: Planned file found on the source
+            transfer_logger: TransferLogger instance of the primary destination
+            
+        Returns:
+            bool: True if the file should be skipped
+        """
+        if not planned.mode:
+            # Not stat'ed; let the transfer find out what is wrong with it
+            return False
+        try:
+            rel_path = planned.path.relative_to(self._source_root).as_posix()
+            copies = [self._ingest_index.lookup(self._card_id, rel_path, planned.size,
+                                                planned.mtime_ns, root)
+                      for root in self._destination_roots]
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning(f"Ingest index lookup failed for {planned.path}: {e}")
+            return False
+        if not all(copies):
+            return False
+        self._skipped_files += 1
+        logger.info(f"Skipping already ingested file: {planned.path}")
+        for session_logger, copy in zip(self._session_loggers(transfer_logger), copies):
+            session_logger.log_message(f"Skipped (already ingested): {planned.path} -> {copy}")
+        return True
+    
+    def _index_destination(self, result: FileTransferResult, root: Path) -> None:
+        """Record a verified copy in the ingest index."""
+        if not (self._ingest_index and result.success and result.checksum):
+            return
+        try:
+            self._ingest_index.record(
+                self._card_id, result.file_path.relative_to(self._source_root).as_posix(),
+                result.file_size, result.source_mtime_ns, root, result.dest_path, result.checksum
+            )
+        except (ValueError, sqlite3.Error) as e:
+            logger.warning(f"Failed to record {result.file_path} in ingest index: {e}")
+    
+    def _is_source_present(self, source_path: Path, recheck: bool = False) -> bool:
+        """
+        Check whether the source drive is still present and mounted.
+        
+        While process_files runs this only reads the presence watcher's flag.
+        
+        Args:
+            source_path: Source drive mount point
+            recheck: Check the drive itself instead of trusting the flag, e.g.
+                to tell a pulled card from another error
+            
+        Returns:
+            bool: True if the source is present
+        """
+        if self._source_released:
+            # Unmounted on purpose once every file was read; not a removal
+            return True
+        watcher = self._presence
+        if watcher is not None and watcher.source_path == source_path:
+            return watcher.check() if recheck else watcher.present
+        return is_source_present(source_path)
+    
+    def _check_stop_requested(self) -> bool:
+        """
+        Check whether a graceful stop has been requested.
+        
+        Returns:
+            bool: True if the stop event is set
+        """
+        if not (self.stop_event and self.stop_event.is_set()):
+            return False
+        if not self.stop_requested:
+            # First time we detect stop request
+            self.stop_requested = True
+            logger.info(f"Transfer stop requested - will finish current file and stop gracefully")
+            self.display.show_status("Stop requested - finishing current file...")
+        return True
+        
+    def process_files(self, source_path: Path, target_dir: Path, log_file: Path = None,
+                      mirror_targets: Optional[List[Tuple[Path, Optional[Path]]]] = None,
+                      destination_roots: Optional[List[Path]] = None,
+                      on_source_released: Optional[Callable[[], None]] = None) -> bool:
         """
         Process all files from source to target directory.
         
@@ -310,9 +532,18 @@ class FileProcessor:
             source_path: Source path
             target_dir: Target directory
             log_file: Optional path to log file
+            mirror_targets: Optional (target_dir, log_file) pairs for extra
+                destinations that receive the same files from a single read
+            destination_roots: Optional roots identifying the primary and each
+                mirror destination in the ingest index, in that order. Defaults
+                to the target directories, which change between sessions when
+                date folders are enabled.
+            on_source_released: Optional callback, e.g. to unmount the card.
+                With release_card_before_verify set it runs as soon as every
+                file has been read, while destinations are still verifying.
             
         Returns:
-            bool: True if all files processed successfully
+            bool: True if all files processed successfully to every destination
         """
         # Reset no_files_found flag at start of processing
         self.no_files_found = False
@@ -321,10 +552,10 @@ class FileProcessor:
         transfer_logger = TransferLogger(log_file)
         
         # Initialize tracking variables
-        successful_files = 0
+        self._successful_files = 0
+        self._total_data_transferred = 0  # Track total bytes transferred for successful files
+        self._failures = []
         start_time = datetime.now()
-        failures = []
-        total_data_transferred = 0  # Track total bytes transferred for successful files
         
         # Set up MHL if enabled
         mhl_data = None
@@ -332,237 +563,604 @@ class FileProcessor:
             try:
                 timestamp = datetime.now().strftime(getattr(self.config, 'timestamp_format', "%Y%m%d_%H%M%S"))
                 logger.info(f"Creating MHL file for transfer with timestamp {timestamp}")
-                mhl_filename, tree, hashes = initialize_mhl_file(timestamp, target_dir)
-                mhl_data = (mhl_filename, tree, hashes)
-                logger.info(f"Successfully created MHL file: {mhl_filename}")
+                mhl_data = open_mhl_writer(timestamp, target_dir)
+                logger.info(f"Successfully created MHL file: {mhl_data.mhl_filename}")
             except Exception as e:
                 logger.error(f"Failed to create MHL file: {e}")
                 self.display.show_error("MHL Create Failed")
                 return False
+        
+        # Set up mirror destinations, each with its own log and MHL
+        self._mirrors = []
+        for mirror_dir, mirror_log in mirror_targets or []:
+            session = DestinationSession(target_dir=mirror_dir, transfer_logger=TransferLogger(mirror_log))
+            if mhl_data:
+                try:
+                    session.mhl_data = open_mhl_writer(timestamp, mirror_dir)
+                except Exception as e:
+                    logger.error(f"Failed to create MHL file in {mirror_dir}: {e}")
+                    self.display.show_error("MHL Create Failed")
+                    self._close_mhl_writers(mhl_data)
+                    return False
+            self._mirrors.append(session)
+        if self._mirrors:
+            logger.info(f"Mirroring transfer to {len(self._mirrors)} additional destination(s)")
             
         # Check if source path still exists before starting
-        if not source_path.exists() or not os.path.ismount(str(source_path)):
+        if not self._is_source_present(source_path):
             error_msg = f"Source drive removed before transfer could start: {source_path}"
             logger.error(error_msg)
             self.display.show_error(ErrorMessages.SOURCE_REMOVED)
             if self.sound_manager:
                 self.sound_manager.play_error()
+            self._close_mhl_writers(mhl_data)
             return False
         
-        # Get all valid files to transfer
+        # Scan the card on a background thread. Files stream into the plan,
+        # stat'ed once, and copying starts while the rest is still being listed.
         try:
-            files_to_transfer = get_valid_media_files(source_path, self.config)
-        except (FileNotFoundError, PermissionError, OSError) as e:
-            # These specific errors are likely caused by drive removal
+            plan = TransferPlan.stream(iter_valid_media_files(source_path, self.config))
+        except (FileTransferError, OSError) as e:
+            # These errors are likely caused by drive removal
             logger.error(f"Error getting files - drive may have been removed: {e}")
             self.display.show_error(ErrorMessages.SOURCE_REMOVED)
             if self.sound_manager:
                 self.sound_manager.play_error()
+            self._close_mhl_writers(mhl_data)
             return False
-            
-        total_files = len(files_to_transfer)
         
-        # Handle empty source directory before initializing any transfer state
-        if total_files == 0:
-            logger.warning(f"No files to transfer from {source_path}")
-            # Send error message to trigger web UI error alerts
-            self.display.show_error("No valid media files found")
-            self.display.show_status("No valid media files found")
-            if self.sound_manager:
-                self.sound_manager.play_error()
-            time.sleep(1)  # Brief pause
-            self.display.show_status("Please check files in Explorer")
-            time.sleep(1)  # Brief pause
-            self.display.show_status("Then safely eject the card")
-            transfer_logger.log_message("No files to transfer")
-            self.no_files_found = True  # Set the flag when no files are found
-            return False  # Return false to indicate no successful transfer
-        
-        # Calculate total size for progress tracking
-        total_size = 0
-        for file_path in files_to_transfer:
-            try:
-                total_size += file_path.stat().st_size
-            except (OSError, FileNotFoundError) as e:
-                # Check if source drive was removed
-                if not source_path.exists() or not os.path.ismount(str(source_path)):
-                    logger.error(f"Source drive removed during size calculation: {source_path}")
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
-                    return False
-                else:
-                    # Skip files that can't be accessed for other reasons
-                    logger.warning(f"Could not access file for size calculation: {file_path} - {e}")
+        # Files already verified at every destination are skipped as they are
+        # found; verified copies are recorded on this thread as results come in
+        self._skipped_files = 0
+        self._source_root = source_path
+        self._destination_roots = list(destination_roots or
+                                       [target_dir] + [s.target_dir for s in self._mirrors])
+        self._ingest_index = self._open_ingest_index()
+        if self._ingest_index:
+            self._card_id = card_identity(source_path)
+            if not self._card_id.startswith("uuid:"):
+                logger.warning(f"No filesystem UUID for {source_path}; matching ingested files "
+                               f"by volume name and capacity")
         
-        # Only initialize progress tracking if we have files to transfer
-        self.progress_tracker.start_transfer(total_files, total_size)
-        self.progress_tracker.set_source_drive(source_path)
-        self.progress_tracker.set_status(TransferStatus.COPYING)
+        worker_count = self._get_worker_count()
+        # Keep a bounded window of submitted files so a stop request or a
+        # drive removal never leaves a long queue of work behind it
+        window = worker_count * 2
+        if worker_count > 1:
+            logger.info(f"Transferring with {worker_count} concurrent workers")
         
-        # Process all files
+        # Process all files. Copies finish into `pending`; finished copies move
+        # to `recording` (through the verifier when verifying in background)
+        # and are recorded in source order once complete.
+        pending: Deque[Future] = deque()
+        recording: Deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="transfer")
+        if self._use_background_verification():
+            self._verifier = BackgroundVerifier(self._verify_result, self._get_verify_worker_count())
+        release_early = bool(on_source_released and self._verifier and
+                             getattr(self.config, 'release_card_before_verify', False))
+        self._source_released = False
+        self._source_removed_announced = False
+        self._transfer_error_announced = False
+        if release_early:
+            self._journal = self._open_journal()
+        self._presence = SourcePresenceWatcher(source_path).start()
         try:
-            for file_number, file_path in enumerate(files_to_transfer, 1):
-                # Check if stop has been requested before starting a new file
-                if self.stop_event and self.stop_event.is_set():
-                    if not self.stop_requested:
-                        # First time we detect stop request
-                        self.stop_requested = True
-                        logger.info(f"Transfer stop requested - will finish current file and stop gracefully")
-                        self.display.show_status("Stop requested - finishing current file...")
-                        
-                    # If we haven't started processing this file yet, stop here
-                    if file_number > 1:  # We've already processed at least one file
-                        logger.info(f"Transfer stopped gracefully - processed {successful_files}/{total_files} files")
-                        transfer_logger.log_message(f"Transfer stopped by user - {successful_files} files completed successfully")
-                        
-                        # Complete transfer with stopped=True for graceful stop
-                        self.progress_tracker.complete_transfer(successful=True, stopped=True)
-                        
-                        # Send stop status message
-                        self.display.show_status(f"Transfer stopped - {successful_files} files completed successfully")
-                        
-                        return True  # Return True for graceful stop
-                
-                # Check if source drive still exists before processing each file
-                if not source_path.exists() or not os.path.ismount(str(source_path)):
-                    error_msg = f"Source drive removed during transfer: {source_path}"
-                    logger.error(error_msg)
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
-                    # Mark transfer as incomplete
-                    self.progress_tracker.complete_transfer(successful=False)
-                    # Log the interruption
-                    transfer_logger.log_message(error_msg)
-                    return False
-                
-                # Get file size for this file
-                try:
-                    file_size = file_path.stat().st_size
-                except (OSError, FileNotFoundError) as e:
-                    # Check if source drive was removed
-                    if not source_path.exists() or not os.path.ismount(str(source_path)):
-                        error_msg = f"Source drive removed while getting file size: {file_path} - {e}"
+            stopped = False
+            source_removed = False
+            file_number = 0
+            skipped_size = 0
+            
+            try:
+                for index in plan.follow():
+                    planned = plan[index]
+                    if self._ingest_index and self._is_ingested(planned, transfer_logger):
+                        skipped_size += planned.size
+                        continue
+                    file_number += 1
+                    
+                    # Check if stop has been requested before starting a new file.
+                    # The first file is always started so a stop has something to finish.
+                    if file_number > 1 and self._check_stop_requested():
+                        stopped = True
+                        break
+                    
+                    # Check if source drive still exists before processing each file
+                    if not self._is_source_present(source_path):
+                        error_msg = f"Source drive removed during transfer: {source_path}"
                         logger.error(error_msg)
-                        transfer_logger.log_message(error_msg)
-                        self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                        if self.sound_manager:
-                            self.sound_manager.play_error()
-                        return False
+                        for session_logger in self._session_loggers(transfer_logger):
+                            session_logger.log_message(error_msg)
+                        source_removed = True
+                        self._announce_source_removed()
+                        break
+                    
+                    # Totals grow while the scan is still running
+                    planned_files = len(plan) - self._skipped_files
+                    planned_size = plan.total_size - skipped_size
+                    if file_number == 1:
+                        # Only initialize progress tracking once there is a file to transfer
+                        self.progress_tracker.start_transfer(planned_files, planned_size, self._skipped_files)
+                        self.progress_tracker.set_source_drive(source_path)
+                        self.progress_tracker.set_status(TransferStatus.COPYING)
                     else:
-                        error_msg = f"Could not get size for file: {file_path} - {e}"
-                        logger.warning(error_msg)
-                        transfer_logger.log_message(error_msg)
-                        file_size = 0
-                
-                # Calculate total transferred so far
-                total_transferred_so_far = 0
-                for idx, f in enumerate(files_to_transfer):
-                    if idx < file_number - 1 and f not in failures:
-                        try:
-                            total_transferred_so_far += f.stat().st_size
-                        except (OSError, FileNotFoundError):
-                            pass
-                
-                # Start tracking this file
-                self.progress_tracker.start_file(
-                    file_path=file_path,
-                    file_number=file_number,
-                    total_files=total_files,
-                    file_size=file_size,
-                    total_size=total_size,
-                    total_transferred=total_transferred_so_far
-                )
+                        self.progress_tracker.update_totals(planned_files, planned_size, self._skipped_files)
+                    
+                    pending.append(executor.submit(
+                        self._transfer_file,
+                        planned.path, source_path, target_dir,
+                        file_number, None, None, planned
+                    ))
+                    
+                    # Hand finished copies on in order while the window is full
+                    while len(pending) >= window:
+                        result = pending.popleft().result()
+                        self._queue_for_recording(result, recording)
+                        if result.source_removed:
+                            source_removed = True
+                            self._announce_source_removed()
+                            break
+                    # Copies may run ahead of verification, but only so far
+                    self._record_finished(recording, mhl_data, transfer_logger,
+                                          max_pending=window + 2 * self._get_verify_worker_count())
+                    if source_removed:
+                        break
+                        
+                    # Check if stop was requested after submitting this file
+                    if self._check_stop_requested():
+                        stopped = True
+                        break
+            except (FileTransferError, OSError) as e:
+                error_msg = f"Source drive removed during file scan: {e}"
+                logger.error(error_msg)
+                for session_logger in self._session_loggers(transfer_logger):
+                    session_logger.log_message(error_msg)
+                source_removed = True
+                self._announce_source_removed()
+            
+            total_files = len(plan) - self._skipped_files
+            if self._skipped_files:
+                logger.info(f"Skipped {self._skipped_files} already ingested file(s)")
+            
+            if stopped or source_removed:
+                # Stop scanning; files found so far are all that will be reported
+                plan.cancel()
+            elif file_number == 0:
+                if self._skipped_files:
+                    return self._finish_all_skipped(source_path, target_dir, transfer_logger, start_time)
+                return self._finish_no_files(source_path, transfer_logger)
+            else:
+                self.progress_tracker.update_totals(total_files, plan.total_size - skipped_size,
+                                                    self._skipped_files)
+            
+            if stopped or source_removed:
+                # Drop files that have not started yet; running files finish
+                for future in pending:
+                    future.cancel()
+            
+            # Drain remaining results in order, waiting for late verifications
+            while pending:
+                future = pending.popleft()
+                if future.cancelled():
+                    continue
+                result = future.result()
+                self._queue_for_recording(result, recording)
+                if result.source_removed:
+                    source_removed = True
+                    self._announce_source_removed()
+            if release_early and not (stopped or source_removed):
+                # Every source byte is read and hashed; only destinations are left
+                self._release_source(on_source_released)
+            self._record_finished(recording, mhl_data, transfer_logger, wait=True)
+            
+            if source_removed:
+                # Mark transfer as incomplete
+                self.progress_tracker.complete_transfer(successful=False)
+                return False
+            
+            successful_files = self._successful_files
+            
+            if stopped:
+                logger.info(f"Transfer stopped gracefully - processed {successful_files}/{total_files} files")
+                transfer_logger.log_message(f"Transfer stopped by user - {successful_files} files completed successfully")
+                for session in self._mirrors:
+                    session.transfer_logger.log_message(
+                        f"Transfer stopped by user - {session.successful_files} files completed successfully")
                 
-                try:
-                    success = self._process_single_file(
-                        file_path, 
-                        source_path, 
-                        target_dir,
-                        mhl_data,
-                        transfer_logger
-                    )
-                except (FileNotFoundError, PermissionError, OSError) as e:
-                    # These specific errors are likely caused by drive removal
-                    logger.error(f"Error processing file - drive may have been removed: {e}")
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
-                    # Mark transfer as incomplete
-                    self.progress_tracker.complete_transfer(successful=False)
-                    return False
+                # Complete transfer with stopped=True for graceful stop
+                self.progress_tracker.complete_transfer(successful=True, stopped=True)
                 
-                if success:
-                    successful_files += 1
-                    try:
-                        total_data_transferred += file_path.stat().st_size
-                    except Exception:
-                        pass
-                else:
-                    failures.append(file_path)
+                # Send stop status message
+                self.display.show_status(f"Transfer stopped - {successful_files} files completed successfully")
                 
-                # Check if stop was requested after completing this file
-                if self.stop_event and self.stop_event.is_set():
-                    logger.info(f"Transfer stopped gracefully after completing file - processed {successful_files}/{total_files} files")
-                    transfer_logger.log_message(f"Transfer stopped by user - {successful_files} files completed successfully")
-                    
-                    # Complete transfer with stopped=True for graceful stop
-                    self.progress_tracker.complete_transfer(successful=True, stopped=True)
-                    
-                    # Send stop status message
-                    self.display.show_status(f"Transfer stopped - {successful_files} files completed successfully")
-                    
-                    return True  # Return True for graceful stop
-                    
-                # No need to update progress here as complete_file is called in _process_single_file
+                return True  # Return True for graceful stop
             
             # Complete transfer
             end_time = datetime.now()
-            duration_seconds = (end_time - start_time).total_seconds()
-            average_file_size = int(total_data_transferred / successful_files) if successful_files > 0 else 0
-            average_speed = (total_data_transferred / duration_seconds / (1024*1024)) if duration_seconds > 0 else 0.0
-            transfer_logger.log_transfer_summary(
-                source_path=source_path,
-                destination_path=target_dir,
-                start_time=start_time,
-                end_time=end_time,
-                total_files=total_files,
-                successful_files=successful_files,
-                failures=failures,
-                total_data_transferred=total_data_transferred,
-                average_file_size=average_file_size,
-                average_speed=average_speed,
-                user=getpass.getuser()
-            )
+            self._log_summary(transfer_logger, source_path, target_dir, start_time, end_time,
+                              total_files, successful_files, self._failures,
+                              self._total_data_transferred)
+            for session in self._mirrors:
+                self._log_summary(session.transfer_logger, source_path, session.target_dir,
+                                  start_time, end_time, total_files, session.successful_files,
+                                  session.failures, session.total_data_transferred)
+            all_successful = successful_files == total_files and all(
+                session.successful_files == total_files for session in self._mirrors)
             
             # Finalize progress tracking
-            self.progress_tracker.complete_transfer(successful=successful_files == total_files)
+            self.progress_tracker.complete_transfer(successful=all_successful)
             
             # Play appropriate sound
             if self.sound_manager:
-                if successful_files == total_files:
+                if all_successful:
                     self.sound_manager.play_success()
                 else:
                     self.sound_manager.play_error()
             
-            return successful_files == total_files
+            return all_successful
             
         except Exception as e:
             logger.error(f"Error during file processing: {e}")
+            for future in list(pending) + list(recording):
+                future.cancel()
             
             # Check if it could be a drive removal error
-            if not source_path.exists() or not os.path.ismount(str(source_path)):
+            if not self._is_source_present(source_path, recheck=True):
                 logger.error(f"Source drive seems to have been removed during transfer: {source_path}")
-                self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-            else:
-                self.display.show_error(ErrorMessages.TRANSFER_ERROR)
-                
-            if self.sound_manager:
-                self.sound_manager.play_error()
+                self._announce_source_removed()
+            elif not self._source_removed_announced:
+                self._announce_transfer_error()
+                if self.sound_manager:
+                    self.sound_manager.play_error()
                 
             self.progress_tracker.complete_transfer(successful=False)
             return False
+        finally:
+            plan.cancel()
+            executor.shutdown(wait=True)
+            self._presence.stop()
+            self._presence = None
+            if self._verifier:
+                self._verifier.shutdown()
+                self._verifier = None
+            if self._journal:
+                self._journal.close()
+                self._journal = None
+            self._source_released = False
+            self._close_ingest_index()
+            self._close_mhl_writers(mhl_data)
+            # Hand idle copy/verify buffers back to the system between ingests
+            clear_buffer_pools()
+    
+    def _close_mhl_writers(self, mhl_data: Optional[MHLWriter]) -> None:
+        """
+        Finish the MHL files of this session, writing their last entries.
+        
+        Args:
+            mhl_data: MHL writer for the primary destination, if any
+        """
+        writers = [mhl_data] + [session.mhl_data for session in self._mirrors]
+        for writer in writers:
+            if writer is None:
+                continue
+            try:
+                writer.close()
+            except OSError as e:
+                logger.error(f"Failed to finish MHL file {writer.mhl_filename}: {e}")
+    
+    def _close_ingest_index(self) -> None:
+        """Close the ingest index opened for this session, if any."""
+        if self._ingest_index:
+            self._ingest_index.close()
+            self._ingest_index = None
+    
+    def _finish_all_skipped(self, source_path: Path, target_dir: Path, transfer_logger,
+                            start_time: datetime) -> bool:
+        """
+        Complete a session in which every file was already ingested.
+        
+        Returns:
+            bool: Always True; nothing needed copying
+        """
+        logger.info(f"All {self._skipped_files} files on {source_path} were already ingested")
+        end_time = datetime.now()
+        self._log_summary(transfer_logger, source_path, target_dir, start_time, end_time,
+                          0, 0, [], 0)
+        for session in self._mirrors:
+            self._log_summary(session.transfer_logger, source_path, session.target_dir,
+                              start_time, end_time, 0, 0, [], 0)
+        self.progress_tracker.start_transfer(0, 0, self._skipped_files)
+        self.progress_tracker.complete_transfer(successful=True)
+        self.display.show_status(f"All {self._skipped_files} files already ingested")
+        if self.sound_manager:
+            self.sound_manager.play_success()
+        return True
+    
+    def _finish_no_files(self, source_path: Path, transfer_logger) -> bool:
+        """
+        Report a source that has no files to transfer.
+        
+        Returns:
+            bool: Always False; there was nothing to transfer
+        """
+        logger.warning(f"No files to transfer from {source_path}")
+        # Send error message to trigger web UI error alerts
+        self.display.show_error("No valid media files found")
+        self.display.show_status("No valid media files found")
+        if self.sound_manager:
+            self.sound_manager.play_error()
+        time.sleep(1)  # Brief pause
+        self.display.show_status("Please check files in Explorer")
+        time.sleep(1)  # Brief pause
+        self.display.show_status("Then safely eject the card")
+        transfer_logger.log_message("No files to transfer")
+        self.no_files_found = True  # Set the flag when no files are found
+        return False  # Return false to indicate no successful transfer
+    
+    def _session_loggers(self, transfer_logger) -> List[TransferLogger]:
+        """Get the transfer loggers of the primary and every mirror destination."""
+        return [transfer_logger] + [session.transfer_logger for session in self._mirrors]
+    
+    def _log_summary(self, transfer_logger, source_path: Path, target_dir: Path,
+                     start_time: datetime, end_time: datetime, total_files: int,
+                     successful_files: int, failures: List[Path],
+                     total_data_transferred: int) -> None:
+        """Write the end-of-session summary for one destination."""
+        duration_seconds = (end_time - start_time).total_seconds()
+        average_file_size = int(total_data_transferred / successful_files) if successful_files > 0 else 0
+        average_speed = (total_data_transferred / duration_seconds / (1024*1024)) if duration_seconds > 0 else 0.0
+        transfer_logger.log_transfer_summary(
+            source_path=source_path,
+            destination_path=target_dir,
+            start_time=start_time,
+            end_time=end_time,
+            total_files=total_files,
+            successful_files=successful_files,
+            failures=failures,
+            total_data_transferred=total_data_transferred,
+            average_file_size=average_file_size,
+            average_speed=average_speed,
+            skipped_files=self._skipped_files,
+            user=getpass.getuser()
+        )
+    
+    def _open_journal(self) -> Optional[VerificationJournal]:
+        """Start the on-disk queue of copies awaiting verification, if possible."""
+        try:
+            return VerificationJournal.create(self._destination_roots[0])
+        except OSError as e:
+            logger.warning(f"Failed to create verification journal, continuing without: {e}")
+            return None
+    
+    def _journal_result(self, result: FileTransferResult) -> None:
+        """Persist every destination of a copy that still awaits verification."""
+        for target in [result] + result.mirror_results:
+            if not target.pending_verification:
+                continue
+            try:
+                self._journal.add(PendingVerification(target.dest_path, result.file_path,
+                                                      target.checksum, target.file_size))
+            except OSError as e:
+                logger.warning(f"Failed to journal {target.dest_path} for verification: {e}")
+    
+    def _release_source(self, on_source_released: Callable[[], None]) -> None:
+        """
+        Let go of the source once every file has been read.
+        
+        The presence watcher is stopped first so the unmount isn't taken for
+        a pulled card; verification then carries on from the destinations.
+        """
+        self._presence.stop()
+        self._source_released = True
+        logger.info("All source files read; releasing the source while verification finishes")
+        try:
+            on_source_released()
+        except Exception as e:
+            logger.warning(f"Error releasing source before verification: {e}")
+        self.progress_tracker.set_status(TransferStatus.CHECKSUMMING)
+    
+    def verify_journals(self, destination_root: Path) -> bool:
+        """
+        Finish verifications left behind by a session that didn't complete.
+        
+        Args:
+            destination_root: Destination whose journals to check
+            
+        Copies that fail stay in their journal, so they are reported again
+        until they are re-copied.
+        
+        Returns:
+            bool: True if every journaled copy verified (or there was nothing to do)
+        """
+        failed_copies = []
+        for journal_path in find_journals(destination_root):
+            try:
+                pending = read_journal(journal_path)
+            except OSError as e:
+                logger.warning(f"Failed to read verification journal {journal_path}: {e}")
+                continue
+            if pending:
+                logger.info(f"Verifying {len(pending)} copies left unverified in {journal_path}")
+                self.display.show_status(f"Verifying {len(pending)} earlier copies")
+            file_ops = self._create_file_operations()
+            failed = []
+            for item in pending:
+                try:
+                    verified = file_ops.verify_checksum(item.dest_path, item.checksum)
+                except Exception as e:
+                    logger.error(f"Error verifying {item.dest_path}: {e}")
+                    verified = False
+                if not verified:
+                    logger.error(f"Earlier copy failed verification: {item.dest_path} "
+                                 f"(source {item.source_path})")
+                    failed.append(item)
+            try:
+                rewrite_journal(journal_path, failed)
+            except OSError as e:
+                logger.warning(f"Failed to update verification journal {journal_path}: {e}")
+            failed_copies.extend(failed)
+        if failed_copies:
+            names = ", ".join(item.dest_path.name for item in failed_copies[:3])
+            if len(failed_copies) > 3:
+                names += f" (+{len(failed_copies) - 3} more)"
+            self.display.show_error(f"Earlier copy failed: {names}")
+        return not failed_copies
+    
+    def _queue_for_recording(self, result: FileTransferResult, recording: Deque[Future]) -> None:
+        """
+        Queue a finished copy for recording, verifying it in the background first if needed.
+        
+        Args:
+            result: Outcome of the copy
+            recording: Futures awaiting recording, in source order
+        """
+        needs_verification = any(target.pending_verification
+                                 for target in [result] + result.mirror_results)
+        if needs_verification and self._verifier:
+            if self._journal:
+                self._journal_result(result)
+            recording.append(self._verifier.submit(result))
+        else:
+            done: Future = Future()
+            done.set_result(result)
+            recording.append(done)
+    
+    def _record_finished(self, recording: Deque[Future], mhl_data, transfer_logger,
+                         wait: bool = False, max_pending: Optional[int] = None) -> None:
+        """
+        Record results from the front of the recording queue in source order.
+        
+        Args:
+            recording: Futures awaiting recording, in source order
+            mhl_data: Optional MHLWriter for the primary destination
+            transfer_logger: TransferLogger instance for logging transfer results
+            wait: Block until every queued result is recorded
+            max_pending: Block until at most this many results are still queued
+        """
+        while recording and (wait or recording[0].done()
+                             or (max_pending is not None and len(recording) > max_pending)):
+            future = recording.popleft()
+            if future.cancelled():
+                continue
+            self._record_result(future.result(), mhl_data, transfer_logger)
+    
+    def _fail_verification(self, result: FileTransferResult) -> None:
+        """Mark a result as failed because its destination checksum did not match."""
+        error_msg = f"Checksum verification failed for {result.dest_path}"
+        logger.error(error_msg)
+        result.messages.append(error_msg)
+        result.error_message = result.error_message or error_msg  # Keep a more specific reason
+        result.success = False
+    
+    def _verify_result(self, result: FileTransferResult) -> FileTransferResult:
+        """
+        Verify every destination of a copied file against its copy checksum.
+        
+        Runs on the background verifier, so like _transfer_file it only
+        collects messages on the results.
+        
+        Args:
+            result: Copied file with pending_verification set
+            
+        Returns:
+            The same result, with success reflecting the verification
+        """
+        for target in [result] + result.mirror_results:
+            if target.pending_verification:
+                self._verify_destination(target)
+        return result
+    
+    def _verify_destination(self, result: FileTransferResult) -> None:
+        """
+        Verify one destination copy, marking the result failed on mismatch.
+        
+        Runs on a verifier thread; at most verify_threads_per_device copies
+        on the same destination drive are read at once.
+        """
+        try:
+            file_ops = self._create_file_operations()
+            with self._verify_limiter.slot(os.stat(result.dest_path).st_dev):
+                verified = self._verify_copy(result, file_ops)
+            if not verified:
+                self._fail_verification(result)
+        except Exception as e:
+            error_msg = f"Error verifying {result.dest_path}: {e}"
+            logger.error(error_msg)
+            result.messages.append(error_msg)
+            result.error_message = error_msg
+            result.success = False
+        finally:
+            result.pending_verification = False
+    
+    def _create_chunk_hasher(self, hash_obj, file_size: int) -> Optional[ChunkHasher]:
+        """
+        Wrap the copy's hash to also record per-block hashes, for large files.
+        
+        Args:
+            hash_obj: Whole-file hash object for the copy
+            file_size: Size of the file about to be copied
+            
+        Returns:
+            ChunkHasher to copy with, or None if chunk hashing is disabled or
+            the file fits in a single block
+        """
+        chunk_size = getattr(self.config, 'chunk_hash_size_mb', 0) * 1024 * 1024
+        if not chunk_size or file_size <= chunk_size:
+            return None
+        return ChunkHasher(hash_obj, chunk_size)
+    
+    def _keep_chunk_tree(self, result: FileTransferResult, tree: ChunkHashTree) -> None:
+        """Attach a copy's chunk tree to its result and save it next to the copy."""
+        result.chunk_tree = tree
+        try:
+            save_chunk_tree(result.dest_path, tree)
+        except OSError as e:
+            logger.warning(f"Failed to save chunk hashes for {result.dest_path}: {e}")
+    
+    def _verify_copy(self, result: FileTransferResult, file_ops, progress_callback=None) -> bool:
+        """
+        Verify one destination copy against the hashes taken while copying.
+        
+        Copies with a chunk tree are checked block by block on several
+        threads; damaged blocks are then re-copied from the source instead
+        of failing the whole file. Other copies are re-hashed whole. With
+        drop_cache_before_verify the copy is first synced and evicted from
+        the page cache, so it is read back from the disk.
+        
+        Args:
+            result: Copied file with its checksum and optional chunk tree
+            file_ops: FileOperations instance to verify with
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            bool: True if the copy matches the source
+        """
+        if getattr(self.config, 'drop_cache_before_verify', False):
+            try:
+                flush_and_drop(result.dest_path)
+            except OSError as e:
+                logger.warning(f"Failed to drop cached pages of {result.dest_path}: {e}")
+        tree = result.chunk_tree
+        if tree is None:
+            return file_ops.verify_checksum(result.dest_path, result.checksum, progress_callback)
+        workers = min(getattr(self.config, 'verify_threads', 4),
+                      getattr(self.config, 'verify_threads_per_device', 2))
+        bad_blocks = verify_chunks(result.dest_path, tree, workers, progress_callback)
+        if not bad_blocks:
+            return True
+        if self._source_released:
+            # The card is unmounted, so there is nothing to re-copy from
+            message = (f"Source already released, {len(bad_blocks)} of {len(tree.leaves)} "
+                       f"blocks of {result.dest_path} bad")
+            logger.error(message)
+            result.messages.append(message)
+            result.error_message = message
+            return False
+        message = (f"{len(bad_blocks)} of {len(tree.leaves)} blocks of {result.dest_path} "
+                   f"failed verification; re-copying them from the source")
+        logger.warning(message)
+        result.messages.append(message)
+        return repair_chunks(result.file_path, result.dest_path, tree, bad_blocks)
     
     def _process_single_file(self, file_path: Path, source_root: Path, 
                            target_dir: Path, mhl_data, transfer_logger) -> bool:
@@ -573,39 +1171,106 @@ class FileProcessor:
             file_path: Path to file to transfer
             source_root: Root source directory
             target_dir: Target directory
-            mhl_data: Optional MHL data tuple
+            mhl_data: Optional MHLWriter for the primary destination
             transfer_logger: TransferLogger instance for logging transfer results
             
         Returns:
             True if file transferred successfully, False otherwise
         """
+        result = self._transfer_file(file_path, source_root, target_dir)
+        self._record_result(result, mhl_data, transfer_logger)
+        return result.success
+    
+    def _report_source_removed(self, result: FileTransferResult, error_msg: str) -> FileTransferResult:
+        """
+        Mark a result as failed because the source drive went away.
+        
+        Several workers can hit the same removal, so the user is told once,
+        by process_files, when it sees the first such result.
+        """
+        logger.error(error_msg)
+        result.messages.append(error_msg)
+        result.error_message = error_msg
+        result.source_removed = True
+        result.success = False
+        return result
+    
+    def _announce_source_removed(self) -> None:
+        """Show the source removed error and play the error sound, once per transfer."""
+        if self._source_removed_announced:
+            return
+        self._source_removed_announced = True
+        self.display.show_error(ErrorMessages.SOURCE_REMOVED)
+        if self.sound_manager:
+            self.sound_manager.play_error()
+    
+    def _announce_transfer_error(self) -> None:
+        """Show the transfer error message, once per transfer."""
+        if self._transfer_error_announced:
+            return
+        self._transfer_error_announced = True
+        self.display.show_error(ErrorMessages.TRANSFER_ERROR)
+    
+    def _transfer_file(self, file_path: Path, source_root: Path, target_dir: Path,
+                       file_number: Optional[int] = None, total_files: Optional[int] = None,
+                       total_size: Optional[int] = None,
+                       planned: Optional[PlannedFile] = None) -> FileTransferResult:
+        """
+        Copy, verify and apply metadata for a single file.
+        
+        Safe to run on a worker thread: nothing is written to the transfer log
+        or MHL here. Log messages are collected on the result and written by
+        _record_result in source order.
+        
+        Args:
+            file_path: Path to file to transfer
+            source_root: Root source directory
+            target_dir: Target directory
+            file_number: Position of the file in the transfer, if tracked
+            total_files: Total number of files in the transfer, if tracked
+            total_size: Total size of the transfer in bytes, if tracked
+            planned: Stat values from the transfer plan; the file is stat'ed
+                here if they are missing
+            
+        Returns:
+            FileTransferResult describing the outcome
+        """
+        result = FileTransferResult(file_path=file_path, file_number=file_number or 0)
+        start = time.time()
         try:
             # Check if source path still exists before starting
-            if not source_root.exists() or not os.path.ismount(str(source_root)):
-                error_msg = f"Source drive removed before processing file: {file_path}"
-                logger.error(error_msg)
-                transfer_logger.log_message(error_msg)
-                self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                if self.sound_manager:
-                    self.sound_manager.play_error()
-                return False
+            if not self._is_source_present(source_root):
+                return self._report_source_removed(
+                    result, f"Source drive removed before processing file: {file_path}")
                 
             # Check if file still exists
             if not file_path.exists():
                 # Check if this could be due to drive removal
-                if not source_root.exists() or not os.path.ismount(str(source_root)):
-                    error_msg = f"Source drive removed before processing file: {file_path}"
-                    logger.error(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
-                    return False
+                if not self._is_source_present(source_root, recheck=True):
+                    return self._report_source_removed(
+                        result, f"Source drive removed before processing file: {file_path}")
                 else:
                     error_msg = f"File disappeared before transfer: {file_path}"
                     logger.warning(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    return False
+                    result.messages.append(error_msg)
+                    result.error_message = error_msg
+                    return result
+            
+            # Use the planned stat values, or stat the file now
+            if planned is None or not planned.mode:
+                try:
+                    planned = PlannedFile.from_stat(file_path, file_path.stat())
+                except (OSError, FileNotFoundError) as e:
+                    # Check if source drive was removed
+                    if not self._is_source_present(source_root, recheck=True):
+                        return self._report_source_removed(
+                            result, f"Source drive removed while getting file size: {file_path} - {e}")
+                    else:
+                        error_msg = f"Could not get size for file: {file_path} - {e}"
+                        logger.warning(error_msg)
+                        result.messages.append(error_msg)
+                        planned = PlannedFile(file_path, 0, 0, None, 0)
+            file_size = planned.size
             
             # Calculate destination path
             rename_with_timestamp = getattr(self.config, 'rename_with_timestamp', False)
@@ -620,187 +1285,336 @@ class FileProcessor:
                 rename_with_timestamp=rename_with_timestamp,
                 preserve_original_filename=preserve_original_filename,
                 timestamp_format=timestamp_format,
-                filename_template=filename_template
+                filename_template=filename_template,
+                creation_time=planned.created
             )
+            result.dest_path = dest_path
+            result.mirror_results = [
+                FileTransferResult(
+                    file_path=file_path,
+                    file_number=result.file_number,
+                    dest_path=create_destination_path(
+                        file_path,
+                        session.target_dir,
+                        source_root,
+                        rename_with_timestamp=rename_with_timestamp,
+                        preserve_original_filename=preserve_original_filename,
+                        timestamp_format=timestamp_format,
+                        filename_template=filename_template,
+                        creation_time=planned.created
+                    ),
+                    file_size=file_size,
+                    source_mtime_ns=planned.mtime_ns,
+                    source_mode=planned.mode
+                )
+                for session in self._mirrors
+            ]
+            result.file_size = file_size
+            result.source_mtime_ns = planned.mtime_ns
+            result.source_mode = planned.mode
             
             # Ensure destination directory exists
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Get file size for progress tracking
-            try:
-                file_size = file_path.stat().st_size
-            except (OSError, FileNotFoundError) as e:
-                # Check if source drive was removed
-                if not source_root.exists() or not os.path.ismount(str(source_root)):
-                    error_msg = f"Source drive removed while getting file size: {file_path} - {e}"
-                    logger.error(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
-                    return False
-                else:
-                    error_msg = f"Could not get size for file: {file_path} - {e}"
-                    logger.warning(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    file_size = 0
-            
-            # Set status to copying
-            self.progress_tracker.set_status(TransferStatus.COPYING)
+            # Start tracking this file, or just set status to copying when the
+            # caller manages per-file tracking itself
+            if file_number is not None:
+                result.progress_token = self.progress_tracker.start_file(
+                    file_path=file_path,
+                    file_number=file_number,
+                    total_files=total_files,
+                    file_size=file_size,
+                    total_size=total_size
+                )
+            else:
+                self.progress_tracker.set_status(TransferStatus.COPYING)
             
-            # Create progress callback for this file
-            progress_callback = self.progress_tracker.create_progress_callback()
+            # Create progress callbacks for this file
+            copy_callback = self.progress_tracker.create_progress_callback(
+                TransferStatus.COPYING, result.progress_token)
+            verify_callback = self.progress_tracker.create_progress_callback(
+                TransferStatus.CHECKSUMMING, result.progress_token)
             
             # Transfer the file
-            from .file_operations import FileOperations, TEMP_FILE_EXTENSION
-            file_ops = FileOperations(self.display, self.storage, self.sound_manager)
-            
-            # Use copy_file_with_hash for checksumming
-            xxh64_hash = None
-            success = False
-            metadata_copied = False
+            file_ops = self._create_file_operations()
             
             try:
-                if hasattr(self.config, 'verify_transfers') and self.config.verify_transfers:
+                if self._mirrors:
+                    # One source read feeds every destination
+                    success = self._copy_to_all_destinations(result, file_ops, copy_callback, verify_callback)
+                elif hasattr(self.config, 'verify_transfers') and self.config.verify_transfers:
                     from .checksum import ChecksumCalculator
                     calculator = ChecksumCalculator(self.display)
-                    xxh64_hash = calculator.create_hash()
+                    hash_obj = calculator.create_hash(getattr(self.config, 'checksum_algorithms', None))
+                    chunk_hasher = self._create_chunk_hasher(hash_obj, file_size)
                     success, checksum = file_ops.copy_file_with_hash(
-                        file_path, dest_path, xxh64_hash, progress_callback
+                        file_path, dest_path, chunk_hasher or hash_obj, copy_callback
                     )
                     
                     if success:
-                        # Set status to checksumming
-                        self.progress_tracker.set_status(TransferStatus.CHECKSUMMING)
-                        
-                        # Verify the checksum
-                        self.progress_tracker.bytes_transferred = 0  # Reset for checksum progress
-                        verify_result = file_ops.verify_checksum(
-                            dest_path, checksum, progress_callback
-                        )
-                        
-                        if not verify_result:
-                            error_msg = f"Checksum verification failed for {dest_path}"
-                            logger.error(error_msg)
-                            transfer_logger.log_message(error_msg)
-                            success = False
+                        result.checksum = checksum
+                        result.checksums = hexdigests(hash_obj)
+                        if chunk_hasher:
+                            self._keep_chunk_tree(result, chunk_hasher.tree())
+                        if self._verifier:
+                            # Verified in the background while the next file copies
+                            result.pending_verification = True
+                        else:
+                            # Set status to checksumming
+                            self.progress_tracker.set_status(TransferStatus.CHECKSUMMING)
+                            
+                            # Verify the checksum
+                            verify_result = self._verify_copy(result, file_ops, verify_callback)
+                            
+                            if not verify_result:
+                                self._fail_verification(result)
+                                success = False
                 else:
                     # Simple copy without checksumming
-                    success = file_ops.copy_file(file_path, dest_path, progress_callback=progress_callback)
+                    success = file_ops.copy_file(file_path, dest_path, progress_callback=copy_callback)
             except Exception as e:
                 # Check if source drive was removed
-                if not source_root.exists() or not os.path.ismount(str(source_root)):
-                    error_msg = f"Source drive removed during file transfer: {e}"
-                    logger.error(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                    if self.sound_manager:
-                        self.sound_manager.play_error()
+                if not self._is_source_present(source_root, recheck=True):
+                    self._report_source_removed(result, f"Source drive removed during file transfer: {e}")
                 else:
                     error_msg = f"Error during file transfer: {e}"
                     logger.error(error_msg)
-                    transfer_logger.log_message(error_msg)
-                    self.display.show_error(ErrorMessages.TRANSFER_ERROR)
+                    result.messages.append(error_msg)
+                    result.error_message = error_msg
+                    result.transfer_error = True
                 
                 success = False
+                for mirror in result.mirror_results:
+                    mirror.success = False
+                    mirror.pending_verification = False
+                    mirror.error_message = result.error_message
+            
+            result.success = success
             
             # --- METADATA COPY LOGIC ---
             # After a successful file copy, always copy metadata from source to destination
-            if success:
+            copied = [target.dest_path for target in [result] + result.mirror_results if target.success]
+            if copied:
                 try:
                     src_metadata = file_ops.get_metadata(file_path)
                     if src_metadata:
-                        apply_result = file_ops.apply_metadata(dest_path, src_metadata)
-                        if not apply_result:
-                            logger.warning(f"Failed to apply metadata to {dest_path}")
-                        else:
-                            metadata_copied = True
+                        for copied_path in copied:
+                            apply_result = file_ops.apply_metadata(copied_path, src_metadata)
+                            if not apply_result:
+                                logger.warning(f"Failed to apply metadata to {copied_path}")
                     else:
                         logger.warning(f"No metadata retrieved from {file_path}")
                 except Exception as meta_exc:
                     logger.error(f"Exception during metadata copy for {file_path} -> {dest_path}: {meta_exc}")
-
-            # --- MHL FILE ADDITION LOGIC ---
-            if success and mhl_data:
-                # Add to MHL if needed - only if we have a checksum (verify_transfers was enabled)
-                if 'checksum' in locals() and checksum:
-                    try:
-                        mhl_filename, tree, hashes = mhl_data
-                        logger.info(f"Adding file to MHL: {dest_path}")
-                        add_file_to_mhl(mhl_filename, tree, hashes, dest_path, checksum, file_size)
-                        logger.info(f"Successfully added file to MHL: {dest_path}")
-                    except Exception as mhl_err:
-                        logger.error(f"Failed to add file to MHL: {mhl_err}")
-                        transfer_logger.log_message(f"Failed to add file to MHL: {mhl_err}")
-                        # Continue without stopping the transfer
-                else:
-                    logger.warning(f"Skipping MHL entry for {dest_path} - no checksum available")
-
-            # --- Prepare logging fields ---
-            ext = file_path.suffix
-            try:
-                src_mtime = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime('%Y-%m-%d %H:%M:%S')
-            except Exception:
-                src_mtime = None
-            try:
-                dst_mtime = datetime.fromtimestamp(os.path.getmtime(dest_path)).strftime('%Y-%m-%d %H:%M:%S') if dest_path.exists() else None
-            except Exception:
-                dst_mtime = None
-            try:
-                src_perm = stat.filemode(os.stat(file_path).st_mode)
-            except Exception:
-                src_perm = None
-            try:
-                dst_perm = stat.filemode(os.stat(dest_path).st_mode) if dest_path.exists() else None
-            except Exception:
-                dst_perm = None
-            user = getpass.getuser()
-            # Duration and retries tracking
-            # For now, set duration to 0.0 and retries to 0 (unless you have retry logic)
-            duration = 0.0
-            retries = 0
-            # xxhash/checksum
-            src_xxhash = checksum if success and 'checksum' in locals() else None
-            dst_xxhash = checksum if success and 'checksum' in locals() else None
-            error_message = None if success else error_msg if 'error_msg' in locals() else None
-            
-            # Log the transfer
-            transfer_logger.log_file_transfer(
-                source_file=file_path,
-                dest_file=dest_path,
-                success=success,
-                file_size=file_size,
-                duration=duration,
-                src_xxhash=src_xxhash,
-                dst_xxhash=dst_xxhash,
-                retries=retries,
-                ext=ext,
-                src_mtime=src_mtime,
-                dst_mtime=dst_mtime,
-                user=user,
-                src_perm=src_perm,
-                dst_perm=dst_perm,
-                error_message=error_message
-            )
-            
-            # Mark the file as complete in progress tracker
-            self.progress_tracker.complete_file(success=success)
             
-            return success
+            return result
         except Exception as e:
             # Check if it's a drive removal error
-            if not source_root.exists() or not os.path.ismount(str(source_root)):
-                error_msg = f"Source drive removed during file processing: {e}"
-                logger.error(error_msg)
-                transfer_logger.log_message(error_msg)
-                self.display.show_error(ErrorMessages.SOURCE_REMOVED)
-                if self.sound_manager:
-                    self.sound_manager.play_error()
+            if not self._is_source_present(source_root, recheck=True):
+                self._report_source_removed(result, f"Source drive removed during file processing: {e}")
             else:
                 error_msg = f"Error processing file {file_path}: {e}"
                 logger.error(error_msg)
-                transfer_logger.log_message(error_msg)
-                self.display.show_error(ErrorMessages.TRANSFER_ERROR)
+                result.messages.append(error_msg)
+                result.error_message = error_msg
+                result.transfer_error = True
                 
+            result.success = False
             self.progress_tracker.set_status(TransferStatus.ERROR)
-            return False 
\ No newline at end of file
+            return result
+        finally:
+            result.duration = time.time() - start
+            for mirror in result.mirror_results:
+                mirror.duration = result.duration
+    
+    def _copy_to_all_destinations(self, result: FileTransferResult, file_ops,
+                                  copy_callback, verify_callback) -> bool:
+        """
+        Copy a file to the primary and every mirror destination from one read.
+        
+        Verification, when enabled, checks each destination against the
+        single source checksum, in the background if a verifier is active.
+        
+        Args:
+            result: Result for the primary destination, with mirror_results set
+            file_ops: FileOperations instance to copy with
+            copy_callback: Progress callback for the copy
+            verify_callback: Progress callback for inline verification
+            
+        Returns:
+            bool: True if the primary destination copy succeeded
+        """
+        verify = getattr(self.config, 'verify_transfers', False)
+        hash_obj = None
+        if verify:
+            from .checksum import ChecksumCalculator
+            hash_obj = ChecksumCalculator(self.display).create_hash(
+                getattr(self.config, 'checksum_algorithms', None))
+        chunk_hasher = self._create_chunk_hasher(hash_obj, result.file_size) if verify else None
+        
+        targets = [result] + result.mirror_results
+        successes, checksum = file_ops.copy_file_to_destinations(
+            result.file_path, [target.dest_path for target in targets], chunk_hasher or hash_obj, copy_callback
+        )
+        
+        checksums = hexdigests(hash_obj) if checksum else {}
+        for target, copied in zip(targets, successes):
+            target.success = copied
+            if not copied:
+                error_msg = f"Failed to copy {result.file_path} to {target.dest_path}"
+                logger.error(error_msg)
+                target.messages.append(error_msg)
+                target.error_message = error_msg
+            elif verify:
+                target.checksum = checksum
+                target.checksums = dict(checksums)
+                if chunk_hasher:
+                    self._keep_chunk_tree(target, chunk_hasher.tree())
+                if self._verifier:
+                    target.pending_verification = True
+                else:
+                    self.progress_tracker.set_status(TransferStatus.CHECKSUMMING)
+                    if not self._verify_copy(target, file_ops, verify_callback):
+                        self._fail_verification(target)
+        return result.success
+    
+    def _record_result(self, result: FileTransferResult, mhl_data, transfer_logger) -> None:
+        """
+        Record a finished file in the MHL, transfer log and session counters.
+        
+        Always called from the thread running process_files, in source order.
+        
+        Args:
+            result: Outcome of the file transfer
+            mhl_data: Optional MHLWriter for the primary destination
+            transfer_logger: TransferLogger instance for logging transfer results
+        """
+        self._record_mirrors(result)
+        if self._journal:
+            for target in [result] + result.mirror_results:
+                if target.dest_path:
+                    self._journal.done(target.dest_path)
+        
+        for message in result.messages:
+            transfer_logger.log_message(message)
+        if result.transfer_error:
+            self._announce_transfer_error()
+        
+        if result.dest_path is None:
+            # File never got as far as a destination; nothing else to record
+            self._failures.append(result.file_path)
+            return
+        
+        self._log_destination(result, mhl_data, transfer_logger)
+        if self._destination_roots:
+            self._index_destination(result, self._destination_roots[0])
+        
+        if result.success:
+            self._successful_files += 1
+            self._total_data_transferred += result.file_size
+        else:
+            self._failures.append(result.file_path)
+        
+        # Mark the file as complete in progress tracker
+        all_copied = result.success and all(mirror.success for mirror in result.mirror_results)
+        self.progress_tracker.complete_file(success=all_copied, file_token=result.progress_token)
+    
+    def _record_mirrors(self, result: FileTransferResult) -> None:
+        """Record a finished file in every mirror destination's log, MHL and counters."""
+        for index, session in enumerate(self._mirrors):
+            if index >= len(result.mirror_results):
+                # Failed before destinations were assigned; log why in every destination
+                for message in result.messages:
+                    session.transfer_logger.log_message(message)
+                session.failures.append(result.file_path)
+                continue
+            mirror = result.mirror_results[index]
+            for message in mirror.messages:
+                session.transfer_logger.log_message(message)
+            self._log_destination(mirror, session.mhl_data, session.transfer_logger)
+            if index + 1 < len(self._destination_roots):
+                self._index_destination(mirror, self._destination_roots[index + 1])
+            session.count(mirror)
+    
+    def _log_destination(self, result: FileTransferResult, mhl_data, transfer_logger) -> None:
+        """
+        Add one destination copy to its MHL and transfer log.
+        
+        Args:
+            result: Outcome of the copy to this destination
+            mhl_data: Optional MHLWriter for this destination
+            transfer_logger: TransferLogger for this destination
+        """
+        file_path = result.file_path
+        dest_path = result.dest_path
+        success = result.success
+        checksum = result.checksum
+        
+        try:
+            dst_stat = os.stat(dest_path)
+        except Exception:
+            dst_stat = None
+        
+        # --- MHL FILE ADDITION LOGIC ---
+        if success and mhl_data:
+            # Add to MHL if needed - only if we have a checksum (verify_transfers was enabled)
+            if checksum:
+                try:
+                    logger.info(f"Adding file to MHL: {dest_path}")
+                    mhl_data.add(dest_path, checksum, result.file_size,
+                                 mtime=dst_stat.st_mtime if dst_stat else None,
+                                 extra_hashes=result.checksums)
+                    logger.info(f"Successfully added file to MHL: {dest_path}")
+                except Exception as mhl_err:
+                    logger.error(f"Failed to add file to MHL: {mhl_err}")
+                    transfer_logger.log_message(f"Failed to add file to MHL: {mhl_err}")
+                    # Continue without stopping the transfer
+            else:
+                logger.warning(f"Skipping MHL entry for {dest_path} - no checksum available")
+
+        # --- Prepare logging fields ---
+        ext = file_path.suffix
+        src_mtime = src_perm = None
+        if result.source_mode:
+            # Captured when the file was planned; no need to go back to the card
+            src_mtime = datetime.fromtimestamp(result.source_mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+            src_perm = stat.filemode(result.source_mode)
+        else:
+            try:
+                src_stat = os.stat(file_path)
+                src_mtime = datetime.fromtimestamp(src_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                src_perm = stat.filemode(src_stat.st_mode)
+            except Exception:
+                pass
+        if dst_stat:
+            dst_mtime = datetime.fromtimestamp(dst_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            dst_perm = stat.filemode(dst_stat.st_mode)
+        else:
+            dst_mtime = dst_perm = None
+        user = getpass.getuser()
+        # Retries tracking - no retry logic yet
+        retries = 0
+        # xxhash/checksum
+        src_xxhash = checksum if success else None
+        dst_xxhash = checksum if success else None
+        error_message = None if success else result.error_message
+        
+        # Log the transfer
+        transfer_logger.log_file_transfer(
+            source_file=file_path,
+            dest_file=dest_path,
+            success=success,
+            file_size=result.file_size,
+            duration=result.duration,
+            src_xxhash=src_xxhash,
+            dst_xxhash=dst_xxhash,
+            retries=retries,
+            ext=ext,
+            src_mtime=src_mtime,
+            dst_mtime=dst_mtime,
+            user=user,
+            src_perm=src_perm,
+            dst_perm=dst_perm,
+            error_message=error_message,
+            checksums=result.checksums if success else None
+        )
@@ -56,9 +56,11 @@ class TransferLogger:
             logger.error(f"Failed to start transfer log: {e}")
             return self.start_time
     
-    def log_success(self, src_path: Path, dst_path: Path, file_size: int, duration: float, src_xxhash: str, dst_xxhash: str, retries: int, ext: str, src_mtime: str, dst_mtime: str, user: str, src_perm: str, dst_perm: str) -> None:
+    def log_success(self, src_path: Path, dst_path: Path, file_size: int, duration: float, src_xxhash: str, dst_xxhash: str, retries: int, ext: str, src_mtime: str, dst_mtime: str, user: str, src_perm: str, dst_perm: str, checksums: Optional[Dict[str, str]] = None) -> None:
         """
         Log successful file transfer with detailed info (multi-line, indented, no user).
+        
+        Digests in checksums other than xxh64 are logged after the other fields.
         """
         if not self._ensure_log_open():
             return
@@ -77,6 +79,9 @@ class TransferLogger:
                 f"    src_perm: {src_perm}\n"
                 f"    dst_perm: {dst_perm}"
             )
+            for algorithm, digest in (checksums or {}).items():
+                if algorithm != "xxh64":
+                    log_entry += f"\n    {algorithm}: {digest}"
             self._write_line(log_entry)
             logger.info(f"Transferred: {src_path}")
         except Exception as e:
@@ -239,7 +244,7 @@ class TransferLogger:
         except Exception as e:
             logger.error(f"Error logging error message: {e}")
     
-    def log_file_transfer(self, source_file: Path, dest_file: Path, success: bool, file_size: int, duration: float, src_xxhash: str, dst_xxhash: str, retries: int, ext: str, src_mtime: str, dst_mtime: str, user: str, src_perm: str, dst_perm: str, error_message: str = None) -> None:
+    def log_file_transfer(self, source_file: Path, dest_file: Path, success: bool, file_size: int, duration: float, src_xxhash: str, dst_xxhash: str, retries: int, ext: str, src_mtime: str, dst_mtime: str, user: str, src_perm: str, dst_perm: str, error_message: str = None, checksums: Optional[Dict[str, str]] = None) -> None:
         """
         Log a file transfer result with all new fields.
         """
@@ -257,7 +262,8 @@ class TransferLogger:
                 dst_mtime=dst_mtime,
                 user=user,
                 src_perm=src_perm,
-                dst_perm=dst_perm
+                dst_perm=dst_perm,
+                checksums=checksums
             )
         else:
             self.log_failure(
@@ -20,10 +20,12 @@ class TransferOperation:
         self.file_transfer = file_transfer
         self.sound_manager = sound_manager
         self.source_removed_error_shown = False
+        self._card_released = False  # Unmounted before verification finished
         
     def execute_transfer(self, source_drive, destination_path):
         """Execute the transfer operation with proper error handling"""
         error_occurred = False
+        self._card_released = False
         
         # Prepare for transfer
         self.display.show_status(f"Preparing transfer...")
@@ -34,7 +36,8 @@ class TransferOperation:
             success = self.file_transfer.copy_sd_to_dump(
                 source_drive,
                 destination_path,
-                log_file
+                log_file,
+                on_source_released=lambda: self._release_card(source_drive)
             )
             
             if success:
@@ -47,9 +50,28 @@ class TransferOperation:
             
         return error_occurred
     
+    def _release_card(self, source_drive):
+        """
+        Unmount the card as soon as every file has been read and hashed.
+        
+        Destinations are still being verified; the final sound and status
+        follow once verification completes.
+        """
+        logger.info(f"All files read, unmounting source drive before verification: {source_drive}")
+        try:
+            if self.storage.unmount_drive(source_drive):
+                self._card_released = True
+                self.display.show_status("Safe to remove card - verifying")
+            else:
+                logger.warning("Early unmount failed; the card will be released after verification")
+        except Exception as e:
+            logger.warning(f"Early unmount failed: {e}")
+    
     def _handle_successful_transfer(self, source_drive):
         """Handle successful transfer completion"""
         self.display.show_status("Transfer complete")
+        if self._card_released:
+            return False
         logger.info(f"Unmounting source drive: {source_drive}")
         if self.storage.unmount_drive(source_drive):
             self.display.show_status("Safe to remove card")
@@ -60,6 +82,11 @@ class TransferOperation:
     
     def _handle_failed_transfer(self, source_drive):
         """Handle failed transfer"""
+        if self._card_released:
+            # Every file was read; what failed was verifying a destination
+            self.display.show_error("Transfer failed")
+            return True
+        
         if not source_drive.exists() or not os.path.ismount(str(source_drive)):
             if not self.source_removed_error_shown:
                 self.display.show_error(ErrorMessages.SOURCE_REMOVED)
@@ -84,7 +111,9 @@ class TransferOperation:
         """Handle transfer error"""
         logger.error(f"Error during transfer: {error}", exc_info=True)
         
-        if not source_drive.exists() or not os.path.ismount(str(source_drive)):
+        if self._card_released:
+            self.display.show_error(ErrorMessages.TRANSFER_ERROR)
+        elif not source_drive.exists() or not os.path.ismount(str(source_drive)):
             if not self.source_removed_error_shown:
                 self.display.show_error(ErrorMessages.SOURCE_REMOVED)
                 self.source_removed_error_shown = True
@@ -0,0 +1,190 @@
+# src/core/transfer_plan.py
+
+import logging
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PlannedFile:
+    """Stat values captured for one file when the transfer was planned"""
+    __slots__ = ("path", "size", "mtime_ns", "created", "mode")
+
+    def __init__(self, path: Path, size: int, mtime_ns: int, created: Optional[float], mode: int):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.created = created  # Earliest of ctime/mtime/atime, used for timestamp renames
+        self.mode = mode
+
+    @classmethod
+    def from_stat(cls, path: Path, st: os.stat_result) -> "PlannedFile":
+        """Build a planned file from a stat result."""
+        return cls(path, st.st_size, st.st_mtime_ns,
+                   min(st.st_ctime, st.st_mtime, st.st_atime), st.st_mode)
+
+    def __repr__(self) -> str:
+        return f"PlannedFile({self.path!s}, size={self.size})"
+
+
+class TransferPlan:
+    """
+    Files of a transfer with their stat values, gathered once at scan time.
+
+    Sizes, mtimes, creation times and modes are kept in compact typed arrays
+    alongside the path list, so a card with tens of thousands of files is
+    stat'ed exactly once and the rest of the pipeline reads the plan instead
+    of going back to the card.
+
+    A plan can also be filled by a scan running on a background thread
+    (see stream), so transfers start on the first files while the rest of
+    the card is still being listed.
+    """
+    __slots__ = ("paths", "sizes", "mtimes_ns", "created", "modes", "stat_failures",
+                 "_total_size", "_condition", "_finished", "_cancelled", "_error")
+
+    def __init__(self):
+        self.paths: List[Path] = []
+        self.sizes = array('q')
+        self.mtimes_ns = array('q')
+        self.created = array('d')
+        self.modes = array('L')
+        self.stat_failures = 0  # Files that could not be stat'ed while planning
+        self._total_size = 0  # Kept as files are added; read once per file during a transfer
+        self._condition = threading.Condition()
+        self._finished = True
+        self._cancelled = False
+        self._error: Optional[BaseException] = None
+
+    @classmethod
+    def from_files(cls, files: Iterable[Path]) -> "TransferPlan":
+        """
+        Build a plan by stat'ing every file once.
+
+        Files that can't be stat'ed stay in the plan with a size of 0 and are
+        counted in stat_failures, so the caller can tell a removed card from
+        a single unreadable file.
+
+        Args:
+            files: Files to transfer, in transfer order
+
+        Returns:
+            TransferPlan: Plan covering every file
+        """
+        plan = cls()
+        for file_path in files:
+            try:
+                st = file_path.stat()
+            except OSError as e:
+                logger.warning(f"Could not access file for size calculation: {file_path} - {e}")
+                st = None
+            plan.add(file_path, st)
+        return plan
+
+    @classmethod
+    def stream(cls, entries: Iterable[Tuple[Path, Optional[os.stat_result]]]) -> "TransferPlan":
+        """
+        Fill a plan from a scan running on a background thread.
+
+        Args:
+            entries: (path, stat result or None) tuples, e.g. from scan_source_files
+
+        Returns:
+            TransferPlan: Plan that grows as the scan proceeds; read it with follow()
+        """
+        plan = cls()
+        plan._finished = False
+        threading.Thread(target=plan._fill, args=(entries,), name="card-scan", daemon=True).start()
+        return plan
+
+    def _fill(self, entries: Iterable[Tuple[Path, Optional[os.stat_result]]]) -> None:
+        """Add scanned entries until the scan ends or the plan is cancelled."""
+        try:
+            for path, st in entries:
+                with self._condition:
+                    if self._cancelled:
+                        break
+                    self.add(path, st)
+                    self._condition.notify_all()
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the plan is complete, i.e. its scan has ended."""
+        with self._condition:
+            return self._finished
+
+    def follow(self) -> Iterator[int]:
+        """
+        Yield the index of every entry, waiting for a running scan to add more.
+
+        Yields:
+            int: Index of the next planned file
+
+        Raises:
+            Exception: The error that ended the scan, once the entries found
+                before it have been yielded
+        """
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self.paths) and not self._finished:
+                    self._condition.wait()
+                if index >= len(self.paths):
+                    break
+            yield index
+            index += 1
+        if self._error is not None:
+            raise self._error
+
+    def cancel(self) -> None:
+        """Stop a running scan from adding further entries."""
+        with self._condition:
+            self._cancelled = True
+
+    def add(self, path: Path, st: Optional[os.stat_result]) -> None:
+        """
+        Append a file to the plan.
+
+        Args:
+            path: File path
+            st: Stat result for the file, or None if it could not be stat'ed
+        """
+        self.paths.append(path)
+        if st is None:
+            self.stat_failures += 1
+            self.sizes.append(0)
+            self.mtimes_ns.append(0)
+            self.created.append(0.0)
+            self.modes.append(0)
+            return
+        self.sizes.append(st.st_size)
+        self._total_size += st.st_size
+        self.mtimes_ns.append(st.st_mtime_ns)
+        self.created.append(min(st.st_ctime, st.st_mtime, st.st_atime))
+        self.modes.append(st.st_mode)
+
+    @property
+    def total_size(self) -> int:
+        """Total size of all planned files in bytes."""
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> PlannedFile:
+        return PlannedFile(self.paths[index], self.sizes[index], self.mtimes_ns[index],
+                           self.created[index], self.modes[index])
+
+    def __iter__(self) -> Iterator[PlannedFile]:
+        for index in range(len(self.paths)):
+            yield self[index]
@@ -5,13 +5,103 @@ import os
 import platform
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterable, Iterator, FrozenSet
 import sys
 
 from .exceptions import FileTransferError, StorageError
 
 logger = logging.getLogger(__name__)
 
+# Directories never worth descending into on a camera card
+IGNORED_DIRECTORIES = frozenset({"System Volume Information"})
+
+
+def normalize_extensions(extensions: Iterable[str]) -> FrozenSet[str]:
+    """
+    Build a lookup set of lowercase extensions, each with a leading dot.
+    
+    Args:
+        extensions: Extensions such as '.MOV', 'mp4' or '.wav'
+        
+    Returns:
+        FrozenSet[str]: Normalized extensions
+    """
+    return frozenset(ext.lower() if ext.startswith('.') else f'.{ext.lower()}'
+                     for ext in extensions if ext)
+
+
+def scan_source_files(source_path: Path, extensions: Optional[Iterable[str]] = None,
+                      recursive: bool = True) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
+    """
+    Walk a source with os.scandir, yielding files as they are found.
+    
+    Hidden entries and ignored system directories are pruned at the
+    directory level, so nothing below them is ever listed. Each directory is
+    visited in name order and descended into where it falls in that order,
+    which yields files in the same order as sorting the full path list,
+    without waiting for the whole walk.
+    The stat result comes from the DirEntry, which is free on Windows and
+    one call per file elsewhere.
+    
+    Args:
+        source_path: Root directory to walk
+        extensions: Only yield files with these extensions; all files if None
+        recursive: Descend into subdirectories
+        
+    Yields:
+        Tuple of (file path, stat result or None if the file could not be stat'ed)
+        
+    Raises:
+        FileTransferError: If the source disappears during the walk
+    """
+    wanted = normalize_extensions(extensions) if extensions is not None else None
+    root = str(source_path)
+    
+    def list_directory(directory: str) -> Optional[List[os.DirEntry]]:
+        try:
+            with os.scandir(directory) as it:
+                return sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            if not os.path.isdir(root):
+                logger.error(f"Source drive removed during file scan: {e}")
+                raise FileTransferError("Source drive removed during scan", source=source_path)
+            if directory == root:
+                raise FileTransferError(f"Error scanning for files: {e}", source=source_path)
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            return None
+    
+    # Depth-first over per-directory iterators, descending into a directory
+    # as soon as it comes up in name order
+    stack = [iter(list_directory(root))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        name = entry.name
+        if name.startswith('.'):
+            continue
+        try:
+            if entry.is_dir():
+                if recursive and name not in IGNORED_DIRECTORIES:
+                    listing = list_directory(entry.path)
+                    if listing:
+                        stack.append(iter(listing))
+                continue
+            if not entry.is_file():
+                continue
+        except OSError as e:
+            logger.warning(f"Skipping unreadable entry {entry.path}: {e}")
+            continue
+        if wanted is not None and os.path.splitext(name)[1].lower() not in wanted:
+            continue
+        try:
+            st = entry.stat()
+        except OSError as e:
+            logger.warning(f"Could not stat {entry.path}: {e}")
+            st = None
+        yield Path(entry.path), st
+
 
 def get_transferable_files(source_path: Path, media_only: bool = False, 
                         media_extensions: List[str] = None) -> List[Path]:
@@ -29,10 +119,6 @@ def get_transferable_files(source_path: Path, media_only: bool = False,
     Raises:
         FileTransferError: If source path is invalid or inaccessible
     """
-    files_to_transfer = []
-    ignored_files = 0
-    permission_errors = 0
-    
     if not source_path.is_dir():
         raise FileTransferError(f"Source path is not a directory: {source_path}", source=source_path)
         
@@ -47,37 +133,15 @@ def get_transferable_files(source_path: Path, media_only: bool = False,
         ]
     
     try:
-        for path in source_path.rglob('*'):
-            # Skip directories and hidden files
-            if path.is_dir() or path.name.startswith('.'):
-                continue
-                
-            # Skip system directories
-            if 'System Volume Information' in str(path):
-                ignored_files += 1
-                continue
-                
-            # Apply media filter if configured
-            if media_only:
-                if any(path.name.lower().endswith(ext) for ext in media_extensions):
-                    files_to_transfer.append(path)
-                else:
-                    ignored_files += 1
-            else:
-                files_to_transfer.append(path)
-                
-    except PermissionError as e:
-        permission_errors += 1
-        logger.warning(f"Permission denied: {e}")
+        files_to_transfer = [path for path, _ in scan_source_files(
+            source_path, media_extensions if media_only else None)]
+    except FileTransferError:
+        raise
     except Exception as e:
         logger.error(f"Error scanning for files: {e}")
         raise FileTransferError(f"Error scanning for files: {e}", source=source_path)
     
-    # Log summary statistics
-    logger.info(f"Found {len(files_to_transfer)} files to transfer, ignored {ignored_files} files")
-    if permission_errors > 0:
-        logger.warning(f"Encountered {permission_errors} permission errors during scan")
-    
+    logger.info(f"Found {len(files_to_transfer)} files to transfer")
     return files_to_transfer
 
 
@@ -119,7 +183,8 @@ def create_destination_path(source_path: Path, target_dir: Path, source_root: Pa
                          rename_with_timestamp: bool = False,
                          preserve_original_filename: bool = True,
                          timestamp_format: str = "%Y%m%d_%H%M%S",
-                         filename_template: str = "{original}_{timestamp}") -> Path:
+                         filename_template: str = "{original}_{timestamp}",
+                         creation_time: Optional[float] = None) -> Path:
     """
     Create the destination path for a file, maintaining directory structure if needed.
     
@@ -131,6 +196,8 @@ def create_destination_path(source_path: Path, target_dir: Path, source_root: Pa
         preserve_original_filename: Whether to preserve original filename
         timestamp_format: Format for timestamp
         filename_template: Template for filename with timestamp
+        creation_time: Creation time to use for the timestamp, if already
+            known; otherwise the source file is stat'ed
         
     Returns:
         Destination file path
@@ -143,13 +210,14 @@ def create_destination_path(source_path: Path, target_dir: Path, source_root: Pa
         # Get the new filename according to configuration
         if rename_with_timestamp:
             # Get file creation time
-            stat_info = source_path.stat()
-            possible_times = [
-                stat_info.st_ctime,  # Creation time (Windows) / Status change time (Unix)
-                stat_info.st_mtime,  # Modification time
-                stat_info.st_atime   # Access time
-            ]
-            creation_time = min(possible_times)
+            if creation_time is None:
+                stat_info = source_path.stat()
+                possible_times = [
+                    stat_info.st_ctime,  # Creation time (Windows) / Status change time (Unix)
+                    stat_info.st_mtime,  # Modification time
+                    stat_info.st_atime   # Access time
+                ]
+                creation_time = min(possible_times)
             
             # Format timestamp
             timestamp = datetime.fromtimestamp(creation_time).strftime(timestamp_format)
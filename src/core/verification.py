@@ -0,0 +1,240 @@
+# src/core/verification.py
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Set, TypeVar
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIRECTORY = ".transferbox"  # Under each destination root
+JOURNAL_PATTERN = "verify-queue-*.jsonl"
+
+T = TypeVar("T")
+
+
+class BackgroundVerifier:
+    """
+    Runs destination checksum verification off the copy path.
+
+    Verification of a copied file re-reads the destination only, so it can
+    run while the next file is still being read from the card. Jobs run on a
+    small worker pool and hand back their result through a Future.
+    """
+
+    def __init__(self, verify_func: Callable[[T], T], max_workers: int = 1):
+        """
+        Initialize the verifier.
+
+        Args:
+            verify_func: Function that verifies one item and returns it updated
+            max_workers: Number of verification threads
+        """
+        self.verify_func = verify_func
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="verify")
+
+    def submit(self, item: T) -> "Future[T]":
+        """
+        Queue an item for verification.
+
+        Args:
+            item: Item to pass to verify_func
+
+        Returns:
+            Future resolving to the verified item
+        """
+        return self._executor.submit(self.verify_func, item)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """
+        Stop the verifier, waiting for running verifications to finish.
+
+        Args:
+            cancel_pending: Drop queued verifications that have not started
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+
+
+class DeviceLimiter:
+    """
+    Caps how many verifications read from the same storage device at once.
+
+    Several readers on one SSD RAID keep its bandwidth busy, while the same
+    number on a single spinning disk only makes it seek. Files are grouped by
+    st_dev, so each device gets its own limit however many workers there are.
+    """
+
+    def __init__(self, per_device: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            per_device: Concurrent readers allowed per device
+        """
+        self.per_device = max(1, per_device)
+        self._semaphores: Dict[int, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, device: int) -> Iterator[None]:
+        """
+        Hold one of the device's reader slots for the duration of the block.
+
+        Args:
+            device: Device id (st_dev) of the file being read
+        """
+        with self._lock:
+            semaphore = self._semaphores.get(device)
+            if semaphore is None:
+                semaphore = self._semaphores[device] = threading.Semaphore(self.per_device)
+        with semaphore:
+            yield
+
+
+class PendingVerification(NamedTuple):
+    """A copy whose checksum still has to be verified"""
+    dest_path: Path
+    source_path: Path
+    checksum: str
+    file_size: int
+
+
+class VerificationJournal:
+    """
+    On-disk queue of copies still awaiting verification.
+
+    When the card is released before verification finishes, the checksums
+    taken from the source only exist in memory until each copy is verified.
+    Every queued copy is appended here first and marked done once verified,
+    so a crash or power cut leaves a journal that a later session can finish.
+    The journal is deleted when nothing is left pending.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file to append to
+        """
+        self.path = path
+        self._file = None
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, destination_root: Path) -> "VerificationJournal":
+        """
+        Start a new journal under a destination root.
+
+        Raises:
+            OSError: If the journal can't be created
+        """
+        directory = destination_root / JOURNAL_DIRECTORY
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"verify-queue-{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        return cls(directory / name).open()
+
+    def open(self) -> "VerificationJournal":
+        """Open the journal for appending."""
+        self._file = open(self.path, 'a', encoding='utf-8')
+        return self
+
+    def _append(self, record: Dict) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def add(self, item: PendingVerification) -> None:
+        """Record a copy that still has to be verified."""
+        with self._lock:
+            self._append({"dest": str(item.dest_path), "source": str(item.source_path),
+                          "xxh64": item.checksum, "size": item.file_size})
+            self._pending.add(str(item.dest_path))
+
+    def done(self, dest_path: Path) -> None:
+        """Record that a copy has been verified, whatever the outcome."""
+        with self._lock:
+            if str(dest_path) in self._pending:
+                self._append({"done": str(dest_path)})
+                self._pending.discard(str(dest_path))
+
+    def close(self) -> None:
+        """Close the journal, deleting it if nothing is left pending."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+            if not self._pending:
+                try:
+                    self.path.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to remove verification journal {self.path}: {e}")
+
+
+def read_journal(path: Path) -> List[PendingVerification]:
+    """
+    Read the copies a journal still lists as unverified.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        List[PendingVerification]: Unverified copies in the order queued;
+            a torn last line is ignored
+    """
+    pending: Dict[str, PendingVerification] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                if "done" in record:
+                    pending.pop(record["done"], None)
+                else:
+                    pending[record["dest"]] = PendingVerification(
+                        Path(record["dest"]), Path(record["source"]), record["xxh64"], int(record["size"]))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping unreadable line in verification journal {path}")
+    return list(pending.values())
+
+
+def rewrite_journal(path: Path, pending: List[PendingVerification]) -> None:
+    """
+    Replace a journal with the copies that are still unverified.
+
+    The journal is deleted when nothing is left.
+
+    Args:
+        path: Journal file
+        pending: Copies to keep listed
+
+    Raises:
+        OSError: If the journal can't be written or removed
+    """
+    if not pending:
+        path.unlink()
+        return
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for item in pending:
+            f.write(json.dumps({"dest": str(item.dest_path), "source": str(item.source_path),
+                                "xxh64": item.checksum, "size": item.file_size}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def find_journals(destination_root: Path) -> List[Path]:
+    """Find journals left behind under a destination root, oldest first."""
+    directory = destination_root / JOURNAL_DIRECTORY
+    try:
+        return sorted(directory.glob(JOURNAL_PATTERN))
+    except OSError:
+        return []
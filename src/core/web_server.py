@@ -1,11 +1,13 @@
 import asyncio
+import functools
 import json
 import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 
 import uvicorn
 from fastapi import FastAPI, WebSocket, HTTPException
@@ -16,13 +18,16 @@ from starlette.websockets import WebSocketDisconnect
 from pydantic import BaseModel
 
 from src.core.websocket_display import WebSocketDisplay
-from src.core.utils import validate_path
+from src.core.validation import PathValidator
 from src.core.path_utils import sanitize_path, is_plausible_user_path
 from src.core.config_manager import ConfigManager
 from src import __version__, __author__, __project_name__, __description__, __license__
 
 logger = logging.getLogger(__name__)
 
+IO_WORKERS = 4  # Threads running blocking storage, validation and config calls for the API
+DRIVE_CACHE_TTL = 5.0  # Seconds drive info is reused before drives are queried again
+
 class PathValidationRequest(BaseModel):
     path: str
 
@@ -69,6 +74,80 @@ class AvailableDrivesResponse(BaseModel):
     drives: List[DriveInfo]
     message: Optional[str] = None
 
+class MHLVerificationResponse(BaseModel):
+    success: bool
+    report: Optional[Dict[str, Any]] = None
+    message: Optional[str] = None
+
+class DriveInfoCache:
+    """
+    Short-lived cache of the drive list served by /api/drives.
+    
+    Building the list runs df/diskutil for every drive, so several clients
+    polling at once would each start their own subprocesses. Within the TTL
+    every caller gets the same list; once it expires, one caller refreshes
+    it while the others wait for that result. The drive watcher calls
+    invalidate() when a drive appears or goes away.
+    """
+    
+    def __init__(self, ttl: float = DRIVE_CACHE_TTL):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds a loaded list stays fresh, 0 to reload every time
+        """
+        self.ttl = ttl
+        self._state_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # One refresh at a time
+        self._drives: Optional[List[Any]] = None
+        self._loaded_at = 0.0
+        self._generation = 0  # Bumped by invalidate() so an older refresh isn't kept
+    
+    def peek(self) -> Optional[List[Any]]:
+        """
+        Get the cached list without loading it.
+        
+        Returns:
+            The drive list, or None if nothing fresh is cached
+        """
+        with self._state_lock:
+            if self._drives is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._drives
+        return None
+    
+    def get(self, loader: Callable[[], List[Any]]) -> List[Any]:
+        """
+        Get the drive list, loading it if the cached one is stale.
+        
+        Args:
+            loader: Blocking function that builds the list
+            
+        Returns:
+            The drive list
+        """
+        drives = self.peek()
+        if drives is not None:
+            return drives
+        with self._refresh_lock:
+            drives = self.peek()
+            if drives is not None:
+                return drives  # Refreshed by another caller while this one waited
+            with self._state_lock:
+                generation = self._generation
+            drives = loader()
+            with self._state_lock:
+                if generation == self._generation:
+                    self._drives = drives
+                    self._loaded_at = time.monotonic()
+            return drives
+    
+    def invalidate(self) -> None:
+        """Forget the cached list, e.g. after a drive was inserted or removed."""
+        with self._state_lock:
+            self._drives = None
+            self._generation += 1
+
 class WebServer:
     """FastAPI web server for TransferBox web UI"""
     
@@ -80,6 +159,12 @@ class WebServer:
         self.server = None
         self.loop = None
         
+        # Blocking calls made by API handlers run here, keeping the event loop
+        # free to stream progress over the WebSocket
+        self._executor: Optional[ThreadPoolExecutor] = self._create_executor()
+        config = getattr(transfer_box_app, 'config', None)
+        self.drive_cache = DriveInfoCache(getattr(config, 'drive_cache_ttl', DRIVE_CACHE_TTL))
+        
         # Configure CORS
         self.app.add_middleware(
             CORSMiddleware,
@@ -91,6 +176,178 @@ class WebServer:
         
         self._setup_routes()
     
+    @staticmethod
+    def _create_executor() -> ThreadPoolExecutor:
+        """Create the thread pool for blocking API calls"""
+        return ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="web-io")
+    
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """
+        Run a blocking call on the I/O thread pool.
+        
+        Args:
+            func: Function to call
+            *args: Arguments for it
+            
+        Returns:
+            What the function returned
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+    
+    def _get_config_manager(self) -> ConfigManager:
+        """Get the app's config manager, or load a new one"""
+        if hasattr(self.transfer_box_app, 'config_manager') and self.transfer_box_app.config_manager:
+            return self.transfer_box_app.config_manager
+        config_manager = ConfigManager()
+        config_manager.load_config()
+        return config_manager
+    
+    def _get_storage(self):
+        """Get the app's storage, or create a new one"""
+        if hasattr(self.transfer_box_app, 'storage') and self.transfer_box_app.storage:
+            return self.transfer_box_app.storage
+        from src.core.platform_manager import PlatformManager
+        return PlatformManager.create_storage()
+    
+    def _check_destination_path(self, path: str) -> PathValidationResponse:
+        """
+        Validate a destination path; touches the filesystem, so it blocks.
+        
+        Args:
+            path: Path entered by the user
+            
+        Returns:
+            PathValidationResponse: Validation result
+        """
+        path = path.strip()
+        
+        if not path:
+            return PathValidationResponse(
+                is_valid=False,
+                error_message="Path cannot be empty"
+            )
+        
+        is_plausible, plausible_error = is_plausible_user_path(path)
+        if not is_plausible:
+            return PathValidationResponse(
+                is_valid=False,
+                error_message=plausible_error
+            )
+        
+        try:
+            sanitized = sanitize_path(path)
+        except Exception as e:
+            return PathValidationResponse(
+                is_valid=False,
+                error_message=f"Path sanitization failed: {str(e)}"
+            )
+        
+        # Same checks as a transfer makes, without creating the directory yet
+        result = PathValidator.validate_destination(sanitized, auto_create=False)
+        if not result.is_valid:
+            return PathValidationResponse(
+                is_valid=False,
+                error_message=result.error_message
+            )
+        return PathValidationResponse(
+            is_valid=True,
+            sanitized_path=str(result.sanitized_path)
+        )
+    
+    def _check_mhl_path(self, path: str) -> Path:
+        """
+        Sanitize and validate an MHL path sent by a client; touches the filesystem.
+        
+        Args:
+            path: Path entered by the user
+            
+        Returns:
+            Path: The MHL to verify
+            
+        Raises:
+            ValueError: If the path isn't an existing .mhl file
+        """
+        try:
+            mhl_path = sanitize_path(os.path.expanduser(path.strip()))
+        except Exception as e:
+            raise ValueError(f"Path sanitization failed: {str(e)}")
+        result = PathValidator.validate_source(mhl_path, check_mounted=False)
+        if not result.is_valid:
+            raise ValueError(result.error_message)
+        mhl_path = result.sanitized_path
+        if mhl_path.suffix.lower() != ".mhl" or not mhl_path.is_file():
+            raise ValueError(f"Not an MHL file: {path}")
+        return mhl_path
+    
+    def _collect_drives(self) -> List[DriveInfo]:
+        """
+        Query every available drive; runs df/diskutil, so it blocks.
+        
+        Returns:
+            List[DriveInfo]: Details of each drive
+        """
+        storage = self._get_storage()
+        
+        # Get available drives from storage interface
+        available_drives = storage.get_available_drives()
+        drives_info = []
+        
+        for drive_path in available_drives:
+            try:
+                # Get drive information
+                drive_info = storage.get_drive_info(drive_path)
+                is_mounted = storage.is_drive_mounted(drive_path)
+                
+                # Calculate GB values for frontend display
+                total_gb = drive_info['total'] / (1024 ** 3)
+                free_gb = drive_info['free'] / (1024 ** 3) 
+                used_gb = drive_info['used'] / (1024 ** 3)
+                
+                # Get drive type if available (Windows specific)
+                drive_type = None
+                is_removable = None
+                if hasattr(storage, 'get_drive_type'):
+                    drive_type = storage.get_drive_type(drive_path)
+                    is_removable = drive_type == "REMOVABLE"
+                
+                # Extract drive name (last part of path)
+                drive_name = drive_path.name if drive_path.name else str(drive_path)
+                
+                drives_info.append(DriveInfo(
+                    path=str(drive_path),
+                    name=drive_name,
+                    total_space=drive_info['total'],
+                    free_space=drive_info['free'],
+                    used_space=drive_info['used'],
+                    total_space_gb=round(total_gb, 2),
+                    free_space_gb=round(free_gb, 2),
+                    used_space_gb=round(used_gb, 2),
+                    drive_type=drive_type,
+                    is_mounted=is_mounted,
+                    is_removable=is_removable
+                ))
+                
+            except Exception as drive_error:
+                logger.warning(f"Error getting info for drive {drive_path}: {drive_error}")
+                # Add basic info even if detailed info fails
+                drives_info.append(DriveInfo(
+                    path=str(drive_path),
+                    name=drive_path.name if drive_path.name else str(drive_path),
+                    total_space=0,
+                    free_space=0,
+                    used_space=0,
+                    total_space_gb=0.0,
+                    free_space_gb=0.0,
+                    used_space_gb=0.0,
+                    drive_type="UNKNOWN",
+                    is_mounted=False,
+                    is_removable=None
+                ))
+        
+        logger.debug(f"Retrieved {len(drives_info)} available drives")
+        return drives_info
+    
     def _setup_routes(self):
         """Setup FastAPI routes and endpoints"""
         
@@ -154,38 +411,7 @@ class WebServer:
         async def validate_destination_path(request: PathValidationRequest):
             """Validate destination path for file transfers"""
             try:
-                path = request.path.strip()
-                
-                if not path:
-                    return PathValidationResponse(
-                        is_valid=False,
-                        error_message="Path cannot be empty"
-                    )
-                
-                # Use existing validation logic
-                is_valid_path = validate_path(path)
-                is_plausible, plausible_error = is_plausible_user_path(path)
-                is_valid = is_valid_path and is_plausible
-                
-                if is_valid:
-                    try:
-                        sanitized = sanitize_path(path)
-                        return PathValidationResponse(
-                            is_valid=True,
-                            sanitized_path=str(sanitized)
-                        )
-                    except Exception as e:
-                        return PathValidationResponse(
-                            is_valid=False,
-                            error_message=f"Path sanitization failed: {str(e)}"
-                        )
-                else:
-                    error_msg = plausible_error if plausible_error else "Invalid or inaccessible path"
-                    return PathValidationResponse(
-                        is_valid=False,
-                        error_message=error_msg
-                    )
-                    
+                return await self._run_blocking(self._check_destination_path, request.path)
             except Exception as e:
                 logger.error(f"Path validation error: {e}")
                 return PathValidationResponse(
@@ -260,15 +486,9 @@ class WebServer:
         async def get_config():
             """Get current configuration"""
             try:
-                # Access config through the transfer box app
-                if hasattr(self.transfer_box_app, 'config_manager') and self.transfer_box_app.config_manager:
-                    config = self.transfer_box_app.config_manager.config
-                    config_dict = config.to_dict() if config else {}
-                else:
-                    # Fallback: create a new config manager
-                    config_manager = ConfigManager()
-                    config = config_manager.load_config()
-                    config_dict = config.to_dict()
+                # A fallback config manager reads the config file
+                config = (await self._run_blocking(self._get_config_manager)).config
+                config_dict = config.to_dict() if config else {}
                 
                 return ConfigResponse(
                     success=True,
@@ -283,17 +503,12 @@ class WebServer:
         async def update_config(request: ConfigUpdateRequest):
             """Update configuration"""
             try:
-                # Access config manager through the transfer box app
-                if hasattr(self.transfer_box_app, 'config_manager') and self.transfer_box_app.config_manager:
-                    config_manager = self.transfer_box_app.config_manager
-                else:
-                    # Fallback: create a new config manager
-                    config_manager = ConfigManager()
-                    config_manager.load_config()
+                config_manager = await self._run_blocking(self._get_config_manager)
                 
-                # Update the configuration
-                updated_config = config_manager.update_config(request.config)
+                # Update the configuration; saving it writes the config file
+                updated_config = await self._run_blocking(config_manager.update_config, request.config)
                 config_dict = updated_config.to_dict()
+                self.drive_cache.ttl = getattr(updated_config, 'drive_cache_ttl', self.drive_cache.ttl)
                 
                 logger.info("Configuration updated successfully")
                 
@@ -330,71 +545,11 @@ class WebServer:
         async def get_available_drives():
             """Get available drives with detailed information"""
             try:
-                # Access storage through the transfer box app
-                if hasattr(self.transfer_box_app, 'storage') and self.transfer_box_app.storage:
-                    storage = self.transfer_box_app.storage
-                else:
-                    # Fallback: create a new storage instance
-                    from src.core.platform_manager import PlatformManager
-                    storage = PlatformManager.create_storage()
-                
-                # Get available drives from storage interface
-                available_drives = storage.get_available_drives()
-                drives_info = []
-                
-                for drive_path in available_drives:
-                    try:
-                        # Get drive information
-                        drive_info = storage.get_drive_info(drive_path)
-                        is_mounted = storage.is_drive_mounted(drive_path)
-                        
-                        # Calculate GB values for frontend display
-                        total_gb = drive_info['total'] / (1024 ** 3)
-                        free_gb = drive_info['free'] / (1024 ** 3) 
-                        used_gb = drive_info['used'] / (1024 ** 3)
-                        
-                        # Get drive type if available (Windows specific)
-                        drive_type = None
-                        is_removable = None
-                        if hasattr(storage, 'get_drive_type'):
-                            drive_type = storage.get_drive_type(drive_path)
-                            is_removable = drive_type == "REMOVABLE"
-                        
-                        # Extract drive name (last part of path)
-                        drive_name = drive_path.name if drive_path.name else str(drive_path)
-                        
-                        drives_info.append(DriveInfo(
-                            path=str(drive_path),
-                            name=drive_name,
-                            total_space=drive_info['total'],
-                            free_space=drive_info['free'],
-                            used_space=drive_info['used'],
-                            total_space_gb=round(total_gb, 2),
-                            free_space_gb=round(free_gb, 2),
-                            used_space_gb=round(used_gb, 2),
-                            drive_type=drive_type,
-                            is_mounted=is_mounted,
-                            is_removable=is_removable
-                        ))
-                        
-                    except Exception as drive_error:
-                        logger.warning(f"Error getting info for drive {drive_path}: {drive_error}")
-                        # Add basic info even if detailed info fails
-                        drives_info.append(DriveInfo(
-                            path=str(drive_path),
-                            name=drive_path.name if drive_path.name else str(drive_path),
-                            total_space=0,
-                            free_space=0,
-                            used_space=0,
-                            total_space_gb=0.0,
-                            free_space_gb=0.0,
-                            used_space_gb=0.0,
-                            drive_type="UNKNOWN",
-                            is_mounted=False,
-                            is_removable=None
-                        ))
-                
-                logger.debug(f"Retrieved {len(drives_info)} available drives")
+                # Polling clients share one cached list; only a stale cache
+                # queries the drives, and that happens off the event loop
+                drives_info = self.drive_cache.peek()
+                if drives_info is None:
+                    drives_info = await self._run_blocking(self.drive_cache.get, self._collect_drives)
                 
                 return AvailableDrivesResponse(
                     success=True,
@@ -406,6 +561,41 @@ class WebServer:
                 logger.error(f"Drive retrieval error: {e}")
                 raise HTTPException(status_code=500, detail=f"Failed to get drives: {str(e)}")
 
+        @self.app.post("/api/verify-mhl", response_model=MHLVerificationResponse)
+        async def verify_mhl(request: PathValidationRequest):
+            """
+            Re-hash every file listed in an existing MHL, with progress over the WebSocket.
+            
+            Only files inside the MHL's directory are opened.
+            """
+            from src.core.mhl_verifier import MHLVerifier
+            
+            try:
+                mhl_path = await self._run_blocking(self._check_mhl_path, request.path)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            try:
+                # A fallback config manager reads the config file
+                config = (await self._run_blocking(self._get_config_manager)).config
+                verifier = MHLVerifier(
+                    self.websocket_display,
+                    max_workers=getattr(config, 'verify_threads', 4),
+                    per_device=getattr(config, 'verify_threads_per_device', 2),
+                    stop_event=getattr(self.transfer_box_app, 'transfer_stop_event', None)
+                )
+                # Hashing runs on the I/O pool so progress keeps streaming
+                report = await self._run_blocking(verifier.verify, mhl_path)
+                
+                return MHLVerificationResponse(
+                    success=report.success,
+                    report=report.to_dict(),
+                    message=report.summary_lines()[0]
+                )
+            except Exception as e:
+                logger.error(f"MHL verification error: {e}")
+                raise HTTPException(status_code=500, detail=f"Failed to verify MHL: {str(e)}")
+
         @self.app.post("/api/stop-transfer")
         async def stop_transfer():
             """Stop the current transfer operation"""
@@ -510,6 +700,8 @@ class WebServer:
         """Start the FastAPI server in a separate thread"""
         self.server_started = False
         self.server_error = None
+        if self._executor is None:
+            self._executor = self._create_executor()  # Shut down by an earlier stop_server
         
         def run_server():
             # Create new event loop for this thread
@@ -553,6 +745,10 @@ class WebServer:
             logger.info("FastAPI server started successfully")
             return True
     
+    def invalidate_drive_cache(self):
+        """Make the next /api/drives request query the drives again"""
+        self.drive_cache.invalidate()
+    
     def stop_server(self):
         """Stop the FastAPI server"""
         if self.server:
@@ -568,4 +764,8 @@ class WebServer:
                 logger.debug("Skipping thread join - called from within server thread")
             else:
                 self.server_thread.join(timeout=5)
-                logger.info("FastAPI server stopped") 
\ No newline at end of file
+                logger.info("FastAPI server stopped")
+        
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None 
\ No newline at end of file
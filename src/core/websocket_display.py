@@ -1,7 +1,8 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Set, Optional
+from collections import deque
+from typing import Dict, Any, Deque, Set, Optional, Tuple
 from threading import Thread, Lock
 from dataclasses import asdict
 
@@ -10,56 +11,173 @@ from src.core.interfaces.types import TransferProgress, TransferStatus
 
 logger = logging.getLogger(__name__)
 
+MAX_PENDING_MESSAGES = 32  # Messages queued per client before it counts as stuck
+SEND_TIMEOUT = 5.0  # Seconds a single send may take before the client is evicted
+
+
+def _enqueue(queue: Deque[Tuple[str, str]], message_type: str, text: str, max_pending: int) -> bool:
+    """
+    Queue a serialized message, replacing a progress message not yet sent.
+    
+    Args:
+        queue: Queue of (message_type, text) pairs
+        message_type: Type of the message
+        text: Serialized message
+        max_pending: Messages the queue may hold
+        
+    Returns:
+        bool: False if the queue is full of messages that can't be dropped
+    """
+    if message_type == "progress" and queue and queue[-1][0] == "progress":
+        queue[-1] = (message_type, text)
+        return True
+    if len(queue) >= max_pending:
+        for index, (queued_type, _) in enumerate(queue):
+            if queued_type == "progress":
+                del queue[index]
+                break
+        else:
+            return False
+    queue.append((message_type, text))
+    return True
+
+
+class _ClientChannel:
+    """
+    Outgoing queue and sender task for one WebSocket client.
+    
+    Lives on the event loop. Each client is sent to by its own task, so a
+    slow browser only delays itself; one that can't keep up is evicted.
+    """
+    
+    def __init__(self, websocket, on_evict, max_pending: int = MAX_PENDING_MESSAGES,
+                 send_timeout: float = SEND_TIMEOUT):
+        self.websocket = websocket
+        self.on_evict = on_evict
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+        self._queue: Deque[Tuple[str, str]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def put(self, message_type: str, text: str) -> None:
+        """Queue a message for sending. Must be called on the event loop."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if not _enqueue(self._queue, message_type, text, self.max_pending):
+            self._evict(f"{len(self._queue)} messages waiting")
+            return
+        self._wakeup.set()
+    
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._queue:
+                _, text = self._queue.popleft()
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(text), self.send_timeout)
+                except asyncio.TimeoutError:
+                    self._evict(f"send took over {self.send_timeout:.0f}s")
+                    return
+                except Exception as e:
+                    self._evict(str(e))
+                    return
+    
+    def _evict(self, reason: str) -> None:
+        logger.warning(f"Disconnecting stuck WebSocket client: {reason}")
+        self.on_evict(self.websocket)
+        asyncio.get_running_loop().create_task(self._close_websocket())
+    
+    async def _close_websocket(self) -> None:
+        try:
+            await asyncio.wait_for(self.websocket.close(code=1011), self.send_timeout)
+        except Exception as e:
+            logger.debug(f"Closing evicted WebSocket client failed: {e}")
+    
+    def close(self) -> None:
+        """Stop the sender task."""
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+
 class WebSocketDisplay(DisplayInterface):
-    """WebSocket-based display implementation for web UI"""
+    """
+    WebSocket-based display implementation for web UI
     
-    def __init__(self):
+    Every message is serialized once and queued per client; progress that
+    hasn't gone out yet is replaced by newer progress. Calls from transfer
+    threads go through one coalescing outbox drained on the event loop.
+    """
+    
+    progress_sink = "web"
+    
+    def __init__(self, max_pending: int = MAX_PENDING_MESSAGES, send_timeout: float = SEND_TIMEOUT):
         self.websocket_lock = Lock()
         self.connected_clients: Set[Any] = set()  # WebSocket connections
         self.current_status: str = ""
         self.current_progress: Optional[TransferProgress] = None
         self.error_messages: list = []
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+        self._channels: Dict[Any, _ClientChannel] = {}
+        self._outbox: Deque[Tuple[str, str]] = deque()  # Serialized messages from other threads
+        self._outbox_lock = Lock()
+        self._drain_scheduled = False
         
     def add_websocket_client(self, websocket):
         """Add a WebSocket client connection"""
         with self.websocket_lock:
             self.connected_clients.add(websocket)
+            self._channels[websocket] = _ClientChannel(
+                websocket, self.remove_websocket_client, self.max_pending, self.send_timeout)
             logger.debug(f"WebSocket client connected. Total clients: {len(self.connected_clients)}")
             
     def remove_websocket_client(self, websocket):
         """Remove a WebSocket client connection"""
         with self.websocket_lock:
             self.connected_clients.discard(websocket)
+            channel = self._channels.pop(websocket, None)
             logger.debug(f"WebSocket client disconnected. Total clients: {len(self.connected_clients)}")
+        if channel:
+            channel.close()
     
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
         """Set the event loop for async operations"""
         self._loop = loop
     
+    @staticmethod
+    def _serialize(message_type: str, data: Dict[str, Any], timestamp: float) -> str:
+        return json.dumps({
+            "type": message_type,
+            "data": data,
+            "timestamp": str(timestamp)
+        })
+    
+    def _fan_out(self, message_type: str, text: str) -> None:
+        """Queue a serialized message for every client. Must be called on the event loop."""
+        with self.websocket_lock:
+            channels = list(self._channels.values())
+        for channel in channels:
+            channel.put(message_type, text)
+    
     async def broadcast_message(self, message_type: str, data: Dict[str, Any]):
         """Broadcast a message to all connected WebSocket clients"""
         if not self.connected_clients:
             logger.debug(f"No WebSocket clients connected to receive {message_type}")
             return
-            
-        message = {
-            "type": message_type,
-            "data": data,
-            "timestamp": str(asyncio.get_event_loop().time())
-        }
-        
-        # Create a copy of clients to avoid modification during iteration
-        clients_copy = self.connected_clients.copy()
-        
-        # Send to all connected clients
-        for client in clients_copy:
-            try:
-                await client.send_text(json.dumps(message))
-            except Exception as e:
-                logger.warning(f"Failed to send message to WebSocket client: {e}")
-                # Remove the failed client
-                self.remove_websocket_client(client)
+        self._fan_out(message_type, self._serialize(message_type, data, asyncio.get_running_loop().time()))
+    
+    def _drain_outbox(self) -> None:
+        """Hand messages queued by other threads to the clients."""
+        with self._outbox_lock:
+            messages = list(self._outbox)
+            self._outbox.clear()
+            self._drain_scheduled = False
+        for message_type, text in messages:
+            self._fan_out(message_type, text)
     
     def _send_async_message(self, message_type: str, data: Dict[str, Any]):
         """Send message asynchronously from a sync context"""
@@ -74,10 +192,22 @@ class WebSocketDisplay(DisplayInterface):
                                   f"sending update to {len(self.connected_clients)} clients")
                         self._last_status = data.get("status")
             
-            asyncio.run_coroutine_threadsafe(
-                self.broadcast_message(message_type, data),
-                self._loop
-            )
+            if not self.connected_clients:
+                return
+            text = self._serialize(message_type, data, self._loop.time())
+            with self._outbox_lock:
+                if not _enqueue(self._outbox, message_type, text, self.max_pending):
+                    self._outbox.popleft()  # The loop is stalled; keep the newest messages
+                    self._outbox.append((message_type, text))
+                if self._drain_scheduled:
+                    return
+                self._drain_scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._drain_outbox)
+            except RuntimeError:
+                # Loop closed in the meantime
+                with self._outbox_lock:
+                    self._drain_scheduled = False
         else:
             # Log at debug level since this is expected during startup
             logger.debug(f"Event loop not available for {message_type} message")
@@ -21,6 +21,8 @@ class RaspberryPiDisplay(DisplayInterface):
     LCD display and LED indicators
     """
     
+    progress_sink = "lcd"
+    
     def __init__(self):
         self.display_lock = Lock()
         self._setup_display()
@@ -80,9 +82,10 @@ class RaspberryPiDisplay(DisplayInterface):
         """Update both LCD display and LED indicators with transfer progress"""
         with self.display_lock:
             try:
-                # Don't clear display every time, only when the filename changes
-                if progress.current_file != self._current_file:
-                    lcd_display.clear()
+                # Redraw the filename only when it changes; the framebuffer
+                # sends just the cells that differ from what is shown
+                file_changed = progress.current_file != self._current_file
+                if file_changed:
                     self._current_file = progress.current_file
                     
                     # Show current file name on top line (truncated if needed)
@@ -103,7 +106,7 @@ class RaspberryPiDisplay(DisplayInterface):
                         truncated = filename
                         
                     try:
-                        lcd_display.write(0, 0, truncated)
+                        lcd_display.draw(0, 0, truncated.ljust(16))
                     except Exception as e:
                         error_msg = f"Failed to display filename: {str(e)}"
                         logger.error(error_msg)
@@ -125,7 +128,8 @@ class RaspberryPiDisplay(DisplayInterface):
                 # Combine number and progress bar
                 bottom_line = f"{file_text} {progress_bar}"
                 try:
-                    lcd_display.write(0, 1, bottom_line)
+                    lcd_display.draw(0, 1, bottom_line.ljust(16))
+                    lcd_display.refresh(force=file_changed)
                 except Exception as e:
                     error_msg = f"Failed to display progress bar: {str(e)}"
                     logger.error(error_msg)
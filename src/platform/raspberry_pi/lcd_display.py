@@ -5,20 +5,35 @@ import smbus
 import time
 import subprocess
 import logging
-from typing import Optional
+import threading
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+LCD_COLUMNS = 16
+LCD_ROWS = 2
+LCD_MAX_REFRESH_HZ = 10.0  # Rate limit for refresh(force=False), e.g. progress bars
+
 class LCDDisplay:
-    """Hardware interface for 16x2 LCD display via I2C"""
+    """
+    Hardware interface for 16x2 LCD display via I2C
     
-    def __init__(self, i2c_bus: int = 1, address: int = 0x3f):
+    Text is drawn into an in-memory framebuffer; refreshing compares it with
+    what the LCD is showing and sends only the cells that changed, setting
+    the cursor only where the changed cells aren't contiguous. Each byte
+    sent costs four I2C writes and 4 ms of sleeps, so a progress bar that
+    grows by one cell costs one byte instead of a whole line.
+    """
+    
+    def __init__(self, i2c_bus: int = 1, address: int = 0x3f,
+                 max_refresh_hz: float = LCD_MAX_REFRESH_HZ):
         """
         Initialize LCD display.
         
         Args:
             i2c_bus: I2C bus number
             address: I2C device address
+            max_refresh_hz: Maximum rate of unforced refreshes
             
         Raises:
             HardwareError: If SMBus initialization fails
@@ -33,8 +48,23 @@ class LCDDisplay:
             )
         self.BLEN = 1
         self.LCD_ADDR = address
-        self.line_content = ["", ""]  # Track current content of each line
         self.i2c_bus_number = i2c_bus
+        self.min_refresh_interval = 1.0 / max_refresh_hz if max_refresh_hz > 0 else 0.0
+        self._frame = self._blank_frame()  # What should be shown
+        self._shown = self._blank_frame()  # What the LCD is showing
+        self._cursor: Optional[int] = None  # DDRAM address the next data byte goes to, if known
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()  # Shared by the display and the button menu
+    
+    @staticmethod
+    def _blank_frame() -> List[List[str]]:
+        return [[" "] * LCD_COLUMNS for _ in range(LCD_ROWS)]
+    
+    @property
+    def line_content(self) -> List[str]:
+        """Current framebuffer content of each line."""
+        with self._lock:
+            return ["".join(row) for row in self._frame]
 
     def write_word(self, addr: int, data: int) -> None:
         """Write a word to the LCD controller."""
@@ -162,13 +192,75 @@ class LCDDisplay:
 
     def clear(self) -> None:
         """Clear the LCD display."""
-        self.send_command(0x01)
-        self.line_content = ["", ""]
+        with self._lock:
+            self._cursor = None
+            self.send_command(0x01)
+            self._frame = self._blank_frame()
+            self._shown = self._blank_frame()
+            self._cursor = 0x00  # Clearing homes the cursor
+
+    def draw(self, x: int, y: int, string: str) -> None:
+        """
+        Draw text into the framebuffer without sending it.
+        
+        Args:
+            x: Column position (0-15)
+            y: Row position (0-1)
+            string: Text to draw; whatever doesn't fit on the line is cut off
+        """
+        x = max(0, min(LCD_COLUMNS - 1, x))
+        y = max(0, min(LCD_ROWS - 1, y))
+        with self._lock:
+            for offset, char in enumerate(string[:LCD_COLUMNS - x]):
+                self._frame[y][x + offset] = char
+
+    def refresh(self, force: bool = True) -> bool:
+        """
+        Send the framebuffer cells that differ from what the LCD shows.
+        
+        Args:
+            force: Refresh even if the last refresh was within the rate limit;
+                skipped cells are sent with the next refresh
+            
+        Returns:
+            bool: True if the LCD is up to date
+            
+        Raises:
+            DisplayError: If writing to LCD fails
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.min_refresh_interval:
+                return False
+            self._last_refresh = now
+            try:
+                for y in range(LCD_ROWS):
+                    for x in range(LCD_COLUMNS):
+                        char = self._frame[y][x]
+                        if self._shown[y][x] == char:
+                            continue
+                        addr = 0x40 * y + x
+                        if self._cursor != addr:
+                            self._cursor = None
+                            self.send_command(0x80 | addr)
+                        self._cursor = None
+                        self.send_data(ord(char))
+                        self._shown[y][x] = char
+                        self._cursor = addr + 1
+            except Exception as e:
+                raise DisplayError(
+                    f"Failed to write text to LCD: {str(e)}",
+                    display_type="lcd",
+                    error_type="write"
+                )
+            return True
 
     def write(self, x: int, y: int, string: str) -> None:
         """
         Write text to the LCD at specified position.
         
+        Only characters that differ from what is already shown are sent.
+        
         Args:
             x: Column position (0-15)
             y: Row position (0-1)
@@ -177,30 +269,9 @@ class LCDDisplay:
         Raises:
             DisplayError: If writing to LCD fails
         """
-        try:
-            x = max(0, min(15, x))
-            y = max(0, min(1, y))
-            
-            addr = 0x80 + 0x40 * y + x
-            self.send_command(addr)
-            
-            # Update line content tracking: overwrite from x onward up to width
-            new_content = string[: max(0, 16 - x)]
-            line = list((self.line_content[y] + " " * 16)[:16])
-            for idx, ch in enumerate(new_content):
-                if x + idx < 16:
-                    line[x + idx] = ch
-            self.line_content[y] = "".join(line)
-
-            for char in new_content:
-                self.send_data(ord(char))
-                
-        except Exception as e:
-            raise DisplayError(
-                f"Failed to write text to LCD: {str(e)}",
-                display_type="lcd",
-                error_type="write"
-            )
+        with self._lock:
+            self.draw(x, y, string)
+            self.refresh()
 
     def set_backlight(self, state: bool) -> None:
         """
@@ -239,7 +310,8 @@ class LCDDisplay:
         if abs(progress - last_progress) >= 10:
             lcd_progress = int(progress / 10)
             progress_bar = '#' * lcd_progress + ' ' * (10 - lcd_progress)
-            self.write(0, 1, f"{file_number}/{file_count} {progress_bar}")
+            self.draw(0, 1, f"{file_number}/{file_count} {progress_bar}")
+            self.refresh(force=False)
             return progress
         return last_progress
 
@@ -12,6 +12,10 @@ from xattr import xattr
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 from src.core.path_utils import sanitize_path, get_safe_path
+from src.core.mount_table import (
+    MOUNTINFO_PATH, MOUNT_EVENT_FALLBACK_INTERVAL, MountEntry, MountTableCache, MountTableMonitor
+)
+from src.core.statx import birth_time
 from src.core.interfaces.storage_inter import StorageInterface
 from src.platform.raspberry_pi.led_control import LEDControl, set_led_state
 from src.core.exceptions import StorageError, FileTransferError, ChecksumError
@@ -25,35 +29,57 @@ class RaspberryPiStorage(StorageInterface):
     mounting, and management specific to the Raspberry Pi hardware setup.
     """
     
-    def __init__(self):
+    def __init__(self, mountinfo_path: Path = Path(MOUNTINFO_PATH)):
+        """
+        Initialize storage.
+        
+        Args:
+            mountinfo_path: Mount table to read drives from; a file in
+                mountinfo format can stand in for the kernel's
+        """
+        self.mountinfo_path = mountinfo_path
         self.dump_drive_mountpoint = None
+        # Mount table cached until the kernel reports a mount or unmount
+        self._mounts = MountTableCache(mountinfo_path)
+        self._dump_drive_mounts: Optional[List[MountEntry]] = None
         self._update_dump_drive_mountpoint()
 
+    def _read_mount_table(self) -> List[MountEntry]:
+        """Read the mount table in-process, from cache unless it has changed."""
+        return self._mounts.entries()
+
     def _update_dump_drive_mountpoint(self) -> None:
         """Update the current DUMP_DRIVE mountpoint."""
+        try:
+            mounts = self._read_mount_table()
+        except OSError as e:
+            logger.error(f"Error checking mounts: {e}")
+            mounts = []
+        
+        # Nothing to do if the mount table is unchanged since the last lookup
+        if mounts and mounts is self._dump_drive_mounts:
+            return
+        self._dump_drive_mounts = mounts
+        
         username = os.getenv("USER")
         possible_mountpoints = [
             Path(f'/media/{username}/DUMP_DRIVE'),
             Path(f'/media/{username}/DUMP_DRIVE1')
         ]
+        mount_points = [entry.mount_point for entry in mounts]
         
         for mountpoint in possible_mountpoints:
-            if mountpoint.is_mount():
+            if mountpoint in mount_points:
                 self.dump_drive_mountpoint = mountpoint
                 logger.info(f"DUMP_DRIVE found at {mountpoint}")
                 return
 
         # If not found in expected locations, search all mounted drives
-        try:
-            mount_output = subprocess.check_output(['mount'], text=True)
-            for line in mount_output.split('\n'):
-                if 'DUMP_DRIVE' in line:
-                    mountpoint = Path(line.split()[2])
-                    self.dump_drive_mountpoint = mountpoint
-                    logger.info(f"DUMP_DRIVE found at {mountpoint}")
-                    return
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error checking mounts: {e}")
+        for mountpoint in mount_points:
+            if 'DUMP_DRIVE' in mountpoint.name:
+                self.dump_drive_mountpoint = mountpoint
+                logger.info(f"DUMP_DRIVE found at {mountpoint}")
+                return
 
         logger.warning("DUMP_DRIVE not found")
         self.dump_drive_mountpoint = None
@@ -69,7 +95,7 @@ class RaspberryPiStorage(StorageInterface):
             StorageError: If there is an error accessing or listing drives
         """
         try:
-            return self.get_mounted_drives_lsblk()
+            return self.get_mounted_drives()
         except Exception as e:
             logger.error(f"Error getting available drives: {e}")
             raise StorageError(
@@ -308,6 +334,10 @@ class RaspberryPiStorage(StorageInterface):
         Wait for a new drive with improved path handling.
         Ensures proper handling of paths with spaces and special characters.
         
+        Blocks on mount table change notifications rather than polling, so a
+        card is picked up as soon as it is mounted and no CPU is used while
+        waiting.
+        
         Args:
             initial_drives: List of initially mounted drives
             
@@ -318,51 +348,21 @@ class RaspberryPiStorage(StorageInterface):
             StorageError: If there is an error detecting or accessing new drives
         """
         try:
-            while True:
-                time.sleep(2)
-                current_drives = self.get_mounted_drives_lsblk()
-                
-                # Convert all paths to strings for comparison
-                initial_paths = {str(d) for d in initial_drives}
-                current_paths = {str(d) for d in current_drives}
-                
-                # Find new drives
-                new_paths = current_paths - initial_paths
-                
-                for new_path in new_paths:
-                    path = Path(new_path)
-                    if "/media/" in str(path):
-                        # Verify the path is actually accessible
-                        try:
-                            # Use sanitize_path for proper path handling
-                            safe_path = sanitize_path(str(path))
-                            # Basic accessibility check
-                            if safe_path.exists() and os.access(safe_path, os.R_OK):
-                                logger.info(f"New drive detected and verified: {safe_path}")
-                                return safe_path
-                            else:
-                                logger.warning(f"Drive detected but not accessible: {safe_path}")
-                                raise StorageError(
-                                    f"New drive detected but not accessible: {safe_path}",
-                                    path=safe_path,
-                                    error_type="permission",
-                                    recovery_steps=[
-                                        "Check drive permissions",
-                                        "Verify drive is properly mounted",
-                                        "Check filesystem health"
-                                    ]
-                                )
-                        except StorageError:
-                            raise
-                        except Exception as e:
-                            logger.error(f"Error verifying drive access: {path}, {e}")
-                            raise StorageError(
-                                f"Error verifying new drive: {str(e)}",
-                                path=path,
-                                error_type="mount"
-                            )
-                            
-                time.sleep(1)  # Short sleep to prevent busy-waiting
+            # Convert all paths to strings for comparison
+            initial_paths = {str(d) for d in initial_drives}
+            with MountTableMonitor(self.mountinfo_path) as monitor:
+                while True:
+                    current_paths = {str(d) for d in self._drives_from_mounts(monitor.mounts())}
+                    
+                    # Find new drives
+                    new_paths = current_paths - initial_paths
+                    
+                    for new_path in sorted(new_paths):
+                        path = Path(new_path)
+                        if "/media/" in str(path):
+                            return self._verify_new_drive(path)
+                    
+                    monitor.wait_for_change()
                 
         except StorageError:
             raise
@@ -373,6 +373,47 @@ class RaspberryPiStorage(StorageInterface):
                 error_type="unknown"
             )
 
+    def _verify_new_drive(self, path: Path) -> Path:
+        """
+        Verify that a newly mounted drive is accessible.
+        
+        Args:
+            path: Mount point of the new drive
+            
+        Returns:
+            Sanitized path of the drive
+            
+        Raises:
+            StorageError: If the drive can't be accessed
+        """
+        try:
+            # Use sanitize_path for proper path handling
+            safe_path = sanitize_path(str(path))
+            # Basic accessibility check
+            if safe_path.exists() and os.access(safe_path, os.R_OK):
+                logger.info(f"New drive detected and verified: {safe_path}")
+                return safe_path
+            logger.warning(f"Drive detected but not accessible: {safe_path}")
+            raise StorageError(
+                f"New drive detected but not accessible: {safe_path}",
+                path=safe_path,
+                error_type="permission",
+                recovery_steps=[
+                    "Check drive permissions",
+                    "Verify drive is properly mounted",
+                    "Check filesystem health"
+                ]
+            )
+        except StorageError:
+            raise
+        except Exception as e:
+            logger.error(f"Error verifying drive access: {path}, {e}")
+            raise StorageError(
+                f"Error verifying new drive: {str(e)}",
+                path=path,
+                error_type="mount"
+            )
+
     def has_enough_space(self, path: Path, required_size: int) -> bool:
         """
         Check if a drive has enough free space.
@@ -391,6 +432,33 @@ class RaspberryPiStorage(StorageInterface):
             logger.error(f"Error checking available space: {e}")
             return False
 
+    def get_mounted_drives(self) -> List[Path]:
+        """
+        Get list of mounted block device drives from the mount table.
+        Falls back to lsblk if the mount table can't be read.
+        
+        Returns:
+            List of Paths to mounted drives
+        """
+        try:
+            return self._drives_from_mounts(self._read_mount_table())
+        except OSError as e:
+            logger.warning(f"Could not read mount table, using lsblk: {e}")
+            return self.get_mounted_drives_lsblk()
+
+    def _drives_from_mounts(self, mounts: List[MountEntry]) -> List[Path]:
+        """Select the mount points of block devices from mount table entries."""
+        mounted_drives = []
+        for entry in mounts:
+            if not entry.source.startswith('/dev/'):
+                continue
+            # Convert to Path using our sanitize_path function
+            path = sanitize_path(str(entry.mount_point))
+            if path.exists():
+                mounted_drives.append(path)
+                logger.debug(f"Found mounted drive: {path}")
+        return mounted_drives
+
     def get_mounted_drives_lsblk(self) -> List[Path]:
         """
         Get list of mounted drives using lsblk command with improved path handling.
@@ -587,17 +655,8 @@ class RaspberryPiStorage(StorageInterface):
             return False
     
     def _get_creation_time(self, path: Path) -> Optional[float]:
-        """Get creation time using platform-specific methods."""
-        try:
-            # Try using statx if available (Linux 4.11+)
-            statx_output = subprocess.check_output(
-                ['stat', '--format=%W', str(path)],
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            return float(statx_output.strip())
-        except (subprocess.CalledProcessError, ValueError):
-            return None
+        """Get creation time in-process using statx (Linux 4.11+)."""
+        return birth_time(path)
     
     def _set_creation_time(self, path: Path, timestamp: float) -> bool:
         """Set creation time if possible."""
@@ -615,21 +674,9 @@ class RaspberryPiStorage(StorageInterface):
             
     def _get_exfat_attributes(self, path: Path) -> Dict[str, Any]:
         """Get exFAT-specific attributes using exfatprogs tools."""
-        try:
-            result = subprocess.run(
-                ['exfatfsck', '--verbose', str(path)],
-                capture_output=True,
-                text=True
-            )
-            
-            attrs = {}
-            # Parse output for exFAT-specific attributes
-            # This is a placeholder - actual parsing would depend on tool output
-            return attrs
-            
-        except FileNotFoundError:
-            logger.debug("exfatprogs tools not installed")
-            return {}
+        # This is a placeholder - no exfatprogs output is parsed yet, so the
+        # tools aren't run per file until there is something to read from them
+        return {}
             
     def _set_exfat_attributes(self, path: Path, metadata: Dict[str, Any]) -> None:
         """Set exFAT-specific attributes using exfatprogs tools."""
@@ -669,10 +716,10 @@ class RaspberryPiStorage(StorageInterface):
         
     def _get_filesystem_type(self, path: Path) -> str:
         """
-        Determine the filesystem type of a given path using findmnt command.
+        Determine the filesystem type of a given path from the mount table.
         
-        This method uses the findmnt command which is more reliable than df -T
-        for getting filesystem types, especially for removable media.
+        The mount table is cached until it changes, so this is a lookup in
+        memory rather than a findmnt process per file.
         
         Args:
             path: Path to check filesystem type
@@ -681,29 +728,11 @@ class RaspberryPiStorage(StorageInterface):
             String representing filesystem type (e.g., 'exfat', 'ext4', etc.)
         """
         try:
-            # Use findmnt to get filesystem type
-            result = subprocess.run(
-                ['findmnt', '-no', 'FSTYPE', str(path)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Get the filesystem type and convert to lowercase
-            fs_type = result.stdout.strip().lower()
-            logger.debug(f"Filesystem type for {path}: {fs_type}")
-            return fs_type
-            
-        except subprocess.CalledProcessError:
-            # If findmnt fails, try using stat
-            try:
-                stat_info = os.statvfs(path)
-                logger.debug(f"Using statvfs fallback for {path}")
-                # Return a generic filesystem type
-                return 'unknown'
-            except Exception as e:
-                logger.error(f"Error getting filesystem type using statvfs: {e}")
+            entry = self._mounts.find(path)
+            if entry is None:
+                logger.debug(f"No mount found for {path}")
                 return 'unknown'
+            return entry.fstype.lower()
         except Exception as e:
             logger.error(f"Error getting filesystem type for {path}: {e}")
             return 'unknown'
@@ -712,8 +741,8 @@ class RaspberryPiStorage(StorageInterface):
         """
         Wait for a drive to be unmounted or removed.
         
-        This method continuously checks if the drive is still mounted
-        and accessible, waiting until it's removed or unmounted.
+        The drive is re-checked each time the mount table changes, with
+        an occasional check in between as a safety net.
         
         Args:
             path: Path to the drive to monitor
@@ -724,31 +753,31 @@ class RaspberryPiStorage(StorageInterface):
             logger.info(f"Waiting for removal of drive: {path}")
             
             # Keep checking until the drive is gone
-            while True:
-                try:
-                    # First check if path still exists
-                    if not path.exists():
-                        logger.info(f"Drive path no longer exists: {path}")
-                        break
-                        
-                    # Then check if it's still mounted
-                    if not path.is_mount():
-                        logger.info(f"Drive is no longer mounted: {path}")
-                        break
+            with MountTableMonitor(self.mountinfo_path) as monitor:
+                while True:
+                    try:
+                        # First check if path still exists
+                        if not path.exists():
+                            logger.info(f"Drive path no longer exists: {path}")
+                            break
+                            
+                        # Then check if it's still mounted
+                        if not path.is_mount():
+                            logger.info(f"Drive is no longer mounted: {path}")
+                            break
+                            
+                        monitor.wait_for_change(MOUNT_EVENT_FALLBACK_INTERVAL)
                         
-                    # Short sleep to prevent excessive CPU usage
-                    time.sleep(1)
-                    
-                except PermissionError:
-                    # If we get permission error, drive might be in process of unmounting
-                    logger.debug(f"Permission error checking {path}, might be unmounting")
-                    time.sleep(1)
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error checking drive status: {e}")
-                    # Wait a bit longer if we hit an error
-                    time.sleep(2)
-                    continue
+                    except PermissionError:
+                        # If we get permission error, drive might be in process of unmounting
+                        logger.debug(f"Permission error checking {path}, might be unmounting")
+                        time.sleep(1)
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Error checking drive status: {e}")
+                        # Wait a bit longer if we hit an error
+                        time.sleep(2)
+                        continue
                     
             logger.info(f"Confirmed drive removal: {path}")
             
@@ -120,4 +120,28 @@ def test_run_benchmark_cli(monkeypatch):
     sys.modules['src.core.interfaces.local_storage'] = local_storage_mod
     monkeypatch.setattr(benchmark.TransferBenchmark, 'run_benchmarks', lambda self: {'1MB': []})
     result = benchmark.run_benchmark_cli()
-    assert result == 0 
\ No newline at end of file
+    assert result == 0 
+def test_compare_copy_modes():
+    results = [
+        benchmark.BenchmarkResult(1024, 10.0, 1024, 0.1, 0.01, 0.01, 0.12, copy_mode="serial"),
+        benchmark.BenchmarkResult(1024, 15.0, 1024, 0.1, 0.01, 0.01, 0.12, copy_mode="pipelined"),
+    ]
+    comparison = benchmark.TransferBenchmark.compare_copy_modes(results)
+    assert comparison[1024]["pipelined"] == pytest.approx(1.5)
+    assert comparison[1024]["serial"] == pytest.approx(1.0)
+
+def test_run_single_benchmark_reports_peak_allocation(tmp_path):
+    cfg = benchmark.BenchmarkConfig(output_dir=tmp_path, buffer_sizes=[4096])
+    tb = benchmark.TransferBenchmark(mock.Mock(), mock.Mock(), config=mock.Mock(), benchmark_config=cfg)
+    test_file = tb.source_dir / "peak.bin"
+    test_file.write_bytes(b"x" * 65536)
+    result = tb.run_single_benchmark(4096, test_file)
+    assert result.success
+    assert result.peak_allocation > 0
+
+def test_benchmark_mhl_writer(tmp_path):
+    result = benchmark.benchmark_mhl_writer(500, work_dir=tmp_path)
+    assert result['entries'] == 500
+    assert result['file_size'] > 0
+    assert result['entries_per_second'] > 0
+    assert len(list(tmp_path.glob("*.mhl"))) == 1
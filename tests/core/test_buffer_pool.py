@@ -0,0 +1,47 @@
+import io
+import threading
+import pytest
+from src.core.buffer_pool import BufferPool, get_buffer_pool, iter_chunks
+
+
+def test_pool_reuses_released_buffers():
+    pool = BufferPool(16, max_buffers=2)
+    buf = pool.acquire()
+    pool.release(buf)
+    assert pool.acquire() is buf
+    assert pool.allocated == 1
+
+
+def test_pool_blocks_when_exhausted():
+    pool = BufferPool(16, max_buffers=1)
+    first = pool.acquire()
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    waiter.join(timeout=0.2)
+    assert waiter.is_alive() and not acquired
+    pool.release(first)
+    waiter.join(timeout=2)
+    assert acquired == [first]
+    assert pool.allocated == 1
+
+
+def test_pool_clear_drops_idle_buffers():
+    pool = BufferPool(16, max_buffers=4)
+    buffers = [pool.acquire() for _ in range(3)]
+    for buf in buffers:
+        pool.release(buf)
+    assert pool.clear() == 3
+    assert pool.allocated == 0
+
+
+def test_iter_chunks_reads_whole_stream_and_returns_buffer():
+    data = bytes(range(256)) * 10
+    pool = get_buffer_pool(100)
+    chunks = [bytes(chunk) for chunk in iter_chunks(io.BytesIO(data), 100)]
+    assert b"".join(chunks) == data
+    assert all(len(chunk) == 100 for chunk in chunks[:-1])
+    # The buffer went back to the pool, so the next acquire reuses it
+    allocated = pool.allocated
+    pool.release(pool.acquire())
+    assert pool.allocated == allocated
@@ -1,7 +1,8 @@
+import hashlib
 import pytest
 import xxhash
 from pathlib import Path
-from src.core.checksum import ChecksumCalculator
+from src.core.checksum import ChecksumCalculator, MultiHasher, hexdigests
 
 
 def create_temp_file(tmp_path, content: bytes) -> Path:
@@ -71,4 +72,34 @@ def test_calculate_file_checksum_display_error_handling(tmp_path, mocker):
     calc = ChecksumCalculator(mock_display)
     result = calc.calculate_file_checksum(file_path)
     assert result == xxhash.xxh64(content).hexdigest()
-    mock_display.show_error.assert_not_called() 
\ No newline at end of file
+    mock_display.show_error.assert_not_called()
+
+
+def test_multi_hasher_matches_individual_algorithms():
+    content = b"multi" * 500_000  # Large enough to hash on worker threads
+    hasher = MultiHasher(["sha1", "MD5", "md5", "crc32"])
+    hasher.update(content[:10])
+    hasher.update(content[10:])
+    assert hasher.algorithms == ["xxh64", "sha1", "md5"]
+    assert hasher.hexdigest() == xxhash.xxh64(content).hexdigest()
+    assert hexdigests(hasher) == {
+        "xxh64": xxhash.xxh64(content).hexdigest(),
+        "sha1": hashlib.sha1(content).hexdigest(),
+        "md5": hashlib.md5(content).hexdigest(),
+    }
+    hasher.reset()
+    assert hasher.hexdigests()["md5"] == hashlib.md5().hexdigest()
+
+
+def test_create_hash_defaults_to_xxh64(mock_display_interface):
+    calc = ChecksumCalculator(mock_display_interface)
+    assert isinstance(calc.create_hash(), xxhash.xxh64)
+    assert isinstance(calc.create_hash(["xxh64"]), xxhash.xxh64)
+    assert isinstance(calc.create_hash(["xxh128"]), MultiHasher)
+
+
+def test_compute_checksum_other_algorithm(tmp_path, mock_display_interface):
+    content = b"compute with md5"
+    file_path = create_temp_file(tmp_path, content)
+    calc = ChecksumCalculator(mock_display_interface)
+    assert calc.compute_checksum(file_path, algorithm="md5") == hashlib.md5(content).hexdigest()
@@ -0,0 +1,92 @@
+import os
+from unittest import mock
+
+import pytest
+import xxhash
+from src.core.buffer_pool import get_buffer_pool
+from src.core.chunk_hashes import (
+    ChunkHasher, ChunkHashTree, ChunkTreeError, chunk_tree_path, load_chunk_tree,
+    repair_chunks, save_chunk_tree, verify_chunks
+)
+
+CHUNK = 64 * 1024
+
+def _tree_for(data, chunk_size=CHUNK):
+    hasher = ChunkHasher(xxhash.xxh64(), chunk_size)
+    for i in range(0, len(data), 10_000):  # Updates that straddle block boundaries
+        hasher.update(data[i:i + 10_000])
+    return hasher
+
+def test_chunk_hasher_builds_tree_and_keeps_whole_file_hash():
+    data = os.urandom(CHUNK * 3 + 123)
+    hasher = _tree_for(data)
+    tree = hasher.tree()
+    assert hasher.hexdigest() == xxhash.xxh64(data).hexdigest()
+    assert tree.file_size == len(data)
+    assert tree.leaves == [xxhash.xxh3_64_intdigest(data[i:i + CHUNK]) for i in range(0, len(data), CHUNK)]
+    hasher.reset()
+    assert hasher.tree().file_size == 0
+
+def test_chunk_tree_roundtrip_and_corruption(tmp_path):
+    target = tmp_path / "clip.mov"
+    tree = _tree_for(os.urandom(CHUNK * 2)).tree()
+    sidecar = save_chunk_tree(target, tree)
+    assert sidecar == chunk_tree_path(target) == tmp_path / ".clip.mov.tbchunks"
+    assert load_chunk_tree(target) == tree
+    damaged = bytearray(sidecar.read_bytes())
+    damaged[30] ^= 0xFF
+    with pytest.raises(ChunkTreeError):
+        ChunkHashTree.from_bytes(bytes(damaged))
+    sidecar.write_bytes(bytes(damaged))
+    assert load_chunk_tree(target) is None
+    assert load_chunk_tree(tmp_path / "missing.mov") is None
+
+def test_verify_chunks_localizes_and_repairs_damage(tmp_path):
+    data = os.urandom(CHUNK * 4 + 7)
+    src = tmp_path / "src.mov"
+    dst = tmp_path / "dst.mov"
+    src.write_bytes(data)
+    damaged = bytearray(data)
+    damaged[CHUNK + 5] ^= 0xFF
+    damaged[CHUNK * 4 + 1] ^= 0xFF
+    dst.write_bytes(bytes(damaged))
+    os.utime(dst, ns=(1_000_000_000, 1_000_000_000))
+    tree = _tree_for(data).tree()
+    progress = []
+
+    assert verify_chunks(dst, tree, max_workers=3,
+                         progress_callback=lambda done, total: progress.append(done)) == [1, 4]
+    assert max(progress) == len(data)
+    assert repair_chunks(src, dst, tree, [1, 4])
+    assert dst.read_bytes() == data
+    assert dst.stat().st_mtime_ns == 1_000_000_000
+    assert verify_chunks(dst, tree) == []
+
+def test_repair_refuses_changed_source(tmp_path):
+    data = os.urandom(CHUNK * 2)
+    tree = _tree_for(data).tree()
+    src = tmp_path / "src.mov"
+    dst = tmp_path / "dst.mov"
+    src.write_bytes(b"\0" * len(data))
+    dst.write_bytes(data[:CHUNK] + b"\1" * CHUNK)
+    assert not repair_chunks(src, dst, tree, [1])
+    dst.write_bytes(data[:CHUNK])
+    assert verify_chunks(dst, tree) == [0, 1]
+
+def test_repair_syncs_and_drops_copy_before_rehashing(tmp_path):
+    data = os.urandom(CHUNK * 3)
+    tree = _tree_for(data).tree()
+    src = tmp_path / "src.mov"
+    dst = tmp_path / "dst.mov"
+    src.write_bytes(data)
+    dst.write_bytes(b"\1" * len(data))
+    calls = []
+    real_fsync = os.fsync
+    with mock.patch("src.core.chunk_hashes.os.fsync", side_effect=lambda fd: (calls.append("fsync"), real_fsync(fd))), \
+         mock.patch("src.core.chunk_hashes.drop_pages",
+                    side_effect=lambda fd, offset, length: calls.append(("drop", offset, length))), \
+         mock.patch("src.core.chunk_hashes.get_buffer_pool", wraps=get_buffer_pool) as pools:
+        assert repair_chunks(src, dst, tree, [0, 2])
+    assert calls == ["fsync", ("drop", 0, CHUNK), ("drop", CHUNK * 2, CHUNK)]
+    assert mock.call(CHUNK) in pools.call_args_list
+    assert dst.read_bytes()[:CHUNK] == data[:CHUNK]
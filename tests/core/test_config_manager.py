@@ -182,4 +182,35 @@ def test_config_backup_and_preserve_values(tmp_path, monkeypatch):
     assert config.rename_with_timestamp is True
     assert config.sound_volume == 99
     # Invalid value replaced with default
-    assert config.buffer_size == 4096 
\ No newline at end of file
+    assert config.buffer_size == 4096 
+def test_checksum_algorithms_validator():
+    assert TransferConfig().checksum_algorithms == ["xxh64"]
+    assert TransferConfig(checksum_algorithms=["MD5", "bogus", "sha1", "md5"]).checksum_algorithms == [
+        "xxh64", "md5", "sha1"]
+
+def test_chunk_hash_size_validator():
+    assert TransferConfig().chunk_hash_size_mb == 0
+    assert TransferConfig(chunk_hash_size_mb=-5).chunk_hash_size_mb == 0
+    assert TransferConfig(chunk_hash_size_mb=4096).chunk_hash_size_mb == 1024
+
+def test_page_cache_defaults():
+    config = TransferConfig()
+    assert config.page_cache_hints is True
+    assert config.drop_cache_before_verify is False
+
+def test_skip_ingested_files_is_opt_in():
+    assert TransferConfig().skip_ingested_files is False
+
+def test_progress_rate_validator():
+    assert TransferConfig().progress_rate_hz == {"web": 10.0, "lcd": 4.0, "terminal": 20.0}
+    assert TransferConfig(progress_rate_hz={"LCD": -1, "web": 500}).progress_rate_hz == {"lcd": 0.0, "web": 60.0}
+
+def test_drive_cache_ttl_validator():
+    assert TransferConfig().drive_cache_ttl == 5.0
+    assert TransferConfig(drive_cache_ttl=-3).drive_cache_ttl == 0.0
+    assert TransferConfig(drive_cache_ttl=600).drive_cache_ttl == 60.0
+
+def test_copy_mode_validator():
+    assert TransferConfig(copy_mode="Pipelined").copy_mode == "pipelined"
+    assert TransferConfig(copy_mode="bogus").copy_mode == "serial"
+    assert TransferConfig(copy_mode="kernel").copy_mode == "kernel"
@@ -0,0 +1,75 @@
+import threading
+import time
+from unittest.mock import Mock
+from src.core.display_dispatcher import DisplayDispatcher
+
+class SlowDisplay:
+    progress_sink = "lcd"
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def show_status(self, message, line=0):
+        self.release.wait(5)
+        self.calls.append(("status", message))
+
+    def show_progress(self, progress):
+        self.calls.append(("progress", progress))
+
+    def show_error(self, message):
+        self.calls.append(("error", message))
+
+    def clear(self, preserve_errors=False):
+        self.calls.append(("clear", preserve_errors))
+
+    def send_destination_reset(self):
+        return list(self.calls)
+
+def test_updates_do_not_wait_for_the_display():
+    display = SlowDisplay()
+    dispatcher = DisplayDispatcher(display)
+    started = time.monotonic()
+    dispatcher.show_status("Copying")
+    for i in range(100):
+        dispatcher.show_progress(i)
+    dispatcher.show_error("Read error")
+    dispatcher.clear(preserve_errors=True)
+    assert time.monotonic() - started < 1
+    assert dispatcher.progress_sink == "lcd"
+    display.release.set()
+    assert dispatcher.flush(timeout=5)
+    assert display.calls[0] == ("status", "Copying")
+    assert display.calls[-3:] == [("progress", 99), ("error", "Read error"), ("clear", True)]
+    assert len(display.calls) < 100
+
+def test_other_methods_run_after_queued_updates():
+    display = SlowDisplay()
+    dispatcher = DisplayDispatcher(display)
+    dispatcher.show_status("Ready")
+    threading.Timer(0.1, display.release.set).start()
+    assert dispatcher.send_destination_reset() == [("status", "Ready")]
+
+def test_full_queue_drops_progress_before_messages():
+    display = SlowDisplay()
+    dispatcher = DisplayDispatcher(display, max_pending=3)
+    dispatcher.show_status("first")  # Blocks the renderer
+    time.sleep(0.1)
+    dispatcher.show_progress(1)
+    dispatcher.show_error("a")
+    dispatcher.show_error("b")
+    dispatcher.show_error("c")
+    display.release.set()
+    dispatcher.close()
+    assert display.calls == [("status", "first"), ("error", "a"), ("error", "b"), ("error", "c")]
+    dispatcher.show_error("after close")
+    assert display.calls[-1] == ("error", "after close")
+
+def test_display_errors_are_contained():
+    display = Mock()
+    display.show_status.side_effect = RuntimeError("I2C")
+    dispatcher = DisplayDispatcher(display)
+    dispatcher.show_status("x")
+    dispatcher.show_error("y")
+    assert dispatcher.flush(timeout=5)
+    display.show_error.assert_called_once_with("y")
@@ -65,7 +65,7 @@ def test_verify_checksum_success(tmp_file, dummy_display, monkeypatch):
     ops = FileOperations(display=dummy_display)
     # Patch ChecksumCalculator
     class FakeCalculator:
-        def __init__(self, display): pass
+        def __init__(self, display, cache_hints=True): pass
         def verify_checksum(self, file_path, expected, progress_callback=None):
             return expected == "ok"
     fake_checksum_mod = type(sys)("fake_checksum_mod")
@@ -78,7 +78,7 @@ def test_verify_checksum_success(tmp_file, dummy_display, monkeypatch):
 def test_verify_checksum_checksumerror(tmp_file, dummy_display, monkeypatch):
     ops = FileOperations(display=dummy_display)
     class FakeCalculator:
-        def __init__(self, display): pass
+        def __init__(self, display, cache_hints=True): pass
         def verify_checksum(self, file_path, expected, progress_callback=None):
             raise ChecksumError("fail")
     fake_checksum_mod = type(sys)("fake_checksum_mod")
@@ -160,4 +160,167 @@ def test_copy_file_ioerror(tmp_file, tmp_path, monkeypatch):
     dst = tmp_path / "out.txt"
     # Patch open to raise OSError
     with mock.patch("builtins.open", side_effect=OSError("fail")):
-        assert ops.copy_file(tmp_file, dst) is None 
\ No newline at end of file
+        assert ops.copy_file(tmp_file, dst) is None 
+# --- pipelined copy engine ---
+def test_copy_file_with_hash_pipelined_matches_serial(tmp_path):
+    import xxhash
+    from src.core.file_operations import COPY_MODE_PIPELINED, COPY_MODE_SERIAL, safe_copy_file
+    src = tmp_path / "clip.bin"
+    src.write_bytes(bytes(range(256)) * 4096)
+    progress = []
+    ops = FileOperations(copy_mode=COPY_MODE_PIPELINED)
+    success, checksum = ops.copy_file_with_hash(
+        src, tmp_path / "piped.bin", xxhash.xxh64(), lambda done, total: progress.append(done))
+    serial_ok, serial_checksum = safe_copy_file(
+        src, tmp_path / "serial.bin", chunk_size=4096, hash_obj=xxhash.xxh64(), copy_mode=COPY_MODE_SERIAL)
+    assert success and serial_ok
+    assert checksum == serial_checksum == xxhash.xxh64(src.read_bytes()).hexdigest()
+    assert (tmp_path / "piped.bin").read_bytes() == src.read_bytes()
+    assert progress[-1] == src.stat().st_size
+
+def test_copy_stream_pipelined_propagates_writer_error(tmp_path):
+    import io
+    from src.core.file_operations import copy_stream, COPY_MODE_PIPELINED
+    class FailingWriter(io.BytesIO):
+        def write(self, data):
+            raise OSError("disk full")
+    with pytest.raises(OSError, match="disk full"):
+        copy_stream(io.BytesIO(b"x" * 10000), FailingWriter(), chunk_size=100,
+                    copy_mode=COPY_MODE_PIPELINED)
+
+# --- kernel copy path ---
+def test_copy_file_with_hash_kernel_mode(tmp_path):
+    import xxhash
+    from src.core.file_operations import COPY_MODE_KERNEL
+    src = tmp_path / "clip.bin"
+    src.write_bytes(bytes(range(256)) * 40000)
+    progress = []
+    ops = FileOperations(copy_mode=COPY_MODE_KERNEL)
+    success, checksum = ops.copy_file_with_hash(
+        src, tmp_path / "kernel.bin", xxhash.xxh64(), lambda done, total: progress.append(done))
+    assert success
+    assert checksum == xxhash.xxh64(src.read_bytes()).hexdigest()
+    assert (tmp_path / "kernel.bin").read_bytes() == src.read_bytes()
+    assert not list(tmp_path.glob(f"*{TEMP_FILE_EXTENSION}"))
+    assert progress[-1] == src.stat().st_size
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="kernel copy is Linux only")
+def test_copy_stream_kernel_falls_back_when_unsupported(tmp_path, monkeypatch):
+    import errno
+    import os
+    import xxhash
+    from src.core.file_operations import copy_stream, COPY_MODE_KERNEL
+    def unsupported(*args, **kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+    src = tmp_path / "clip.bin"
+    src.write_bytes(b"abc" * 10000)
+    hash_obj = xxhash.xxh64()
+    with open(src, "rb") as fin, open(tmp_path / "out.bin", "wb") as fout:
+        copied = copy_stream(fin, fout, hash_obj, chunk_size=4096, copy_mode=COPY_MODE_KERNEL)
+    assert copied == src.stat().st_size
+    assert (tmp_path / "out.bin").read_bytes() == src.read_bytes()
+    assert hash_obj.hexdigest() == xxhash.xxh64(src.read_bytes()).hexdigest()
+
+# --- multi-destination fan-out ---
+def test_fan_out_stream_failing_destination_does_not_stop_others(tmp_path):
+    import io
+    import xxhash
+    from src.core.file_operations import fan_out_stream
+    class FailingWriter(io.BytesIO):
+        def write(self, data):
+            raise OSError("disk full")
+    data = bytes(range(256)) * 100
+    good_a, bad, good_b = io.BytesIO(), FailingWriter(), io.BytesIO()
+    hash_obj = xxhash.xxh64()
+    progress = []
+    errors = fan_out_stream(io.BytesIO(data), [good_a, bad, good_b], hash_obj, chunk_size=1000,
+                            file_size=len(data), progress_callback=lambda done, total: progress.append(done))
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], OSError)
+    assert good_a.getvalue() == good_b.getvalue() == data
+    assert hash_obj.hexdigest() == xxhash.xxh64(data).hexdigest()
+    assert progress[-1] == len(data)
+
+def test_copy_file_to_destinations(tmp_path):
+    import xxhash
+    src = tmp_path / "clip.bin"
+    src.write_bytes(b"frame" * 5000)
+    dsts = [tmp_path / "a" / "clip.bin", tmp_path / "b" / "clip.bin"]
+    ops = FileOperations()
+    successes, checksum = ops.copy_file_to_destinations(src, dsts, xxhash.xxh64())
+    assert successes == [True, True]
+    assert checksum == xxhash.xxh64(src.read_bytes()).hexdigest()
+    assert all(dst.read_bytes() == src.read_bytes() for dst in dsts)
+    assert not list(tmp_path.rglob(f"*{TEMP_FILE_EXTENSION}"))
+
+def test_copy_file_to_destinations_warns_once_that_resume_is_unsupported(tmp_path, caplog):
+    src = tmp_path / "clip.bin"
+    src.write_bytes(b"frame" * 100)
+    ops = FileOperations(resume=True)
+    with caplog.at_level("WARNING", logger="src.core.file_operations"):
+        for name in ("one", "two"):
+            ops.copy_file_to_destinations(src, [tmp_path / name / "a.bin", tmp_path / name / "b.bin"])
+    assert [r.message for r in caplog.records].count(
+        "Resuming partial transfers is not supported with mirror destinations; "
+        "interrupted copies will start over") == 1
+    assert not list(tmp_path.rglob("*.ckpt"))
+
+# --- resumable transfers ---
+def test_copy_file_with_hash_resumes_checkpointed_partial(tmp_path):
+    import xxhash
+    from src.core.resume import ResumeCheckpoint, save_checkpoint, checkpoint_path
+    src = tmp_path / "clip.bin"
+    data = bytes(range(256)) * 100
+    src.write_bytes(data)
+    dst = tmp_path / "clip_copy.bin"
+    temp = dst.with_suffix(dst.suffix + TEMP_FILE_EXTENSION)
+    temp.write_bytes(data[:2500])
+    checkpoint = ResumeCheckpoint.for_source(src, interval=1000)
+    checkpoint.chunk_hashes = [xxhash.xxh64(data[i:i + 1000]).hexdigest() for i in (0, 1000)]
+    save_checkpoint(temp, checkpoint)
+    progress = []
+    ops = FileOperations(resume=True)
+    success, checksum = ops.copy_file_with_hash(
+        src, dst, xxhash.xxh64(), lambda done, total: progress.append(done))
+    assert success
+    assert checksum == xxhash.xxh64(data).hexdigest()
+    assert dst.read_bytes() == data
+    assert progress[0] > 2000 and progress[-1] == len(data)
+    assert not temp.exists() and not checkpoint_path(temp).exists()
+
+def test_copy_file_with_hash_keeps_partial_when_resuming(tmp_path, monkeypatch):
+    import xxhash
+    import src.core.file_operations as file_operations
+    def interrupted(*args, **kwargs):
+        raise OSError("card removed")
+    monkeypatch.setattr(file_operations, "copy_stream", interrupted)
+    src = tmp_path / "clip.bin"
+    src.write_bytes(b"x" * 1000)
+    dst = tmp_path / "clip_copy.bin"
+    ops = FileOperations(resume=True)
+    assert ops.copy_file_with_hash(src, dst, xxhash.xxh64()) == (False, None)
+    assert dst.with_suffix(dst.suffix + TEMP_FILE_EXTENSION).exists()
+
+def test_copy_file_with_hash_without_cache_hints(tmp_path, monkeypatch):
+    import xxhash
+    from src.core import file_operations
+    monkeypatch.setattr(file_operations, "CacheTrimmer", mock.Mock(side_effect=AssertionError))
+    src = tmp_path / "clip.mov"
+    src.write_bytes(b"frame" * 1000)
+    ops = FileOperations(cache_hints=False)
+    ok, checksum = ops.copy_file_with_hash(src, tmp_path / "out" / "clip.mov", xxhash.xxh64())
+    assert ok and checksum == xxhash.xxh64(b"frame" * 1000).hexdigest()
+
+@pytest.mark.parametrize("cache_hints", [True, False])
+def test_verify_checksum_read_drops_pages(tmp_path, monkeypatch, cache_hints):
+    import xxhash
+    from src.core import page_cache
+    drop_pages = mock.Mock()
+    monkeypatch.setattr(page_cache, "drop_pages", drop_pages)
+    copy = tmp_path / "clip.mov"
+    copy.write_bytes(b"frame" * 1000)
+    ops = FileOperations(cache_hints=cache_hints)
+    assert ops.verify_checksum(copy, xxhash.xxh64(b"frame" * 1000).hexdigest()) is True
+    assert drop_pages.called is cache_hints
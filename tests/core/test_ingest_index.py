@@ -0,0 +1,44 @@
+import pytest
+from src.core.ingest_index import IngestIndex, card_identity
+
+@pytest.fixture
+def index(tmp_path):
+    index = IngestIndex(tmp_path / "index.db")
+    yield index
+    index.close()
+
+def test_lookup_finds_recorded_copy(index, tmp_path):
+    copy = tmp_path / "dest" / "clip.mov"
+    copy.parent.mkdir()
+    copy.write_bytes(b"x" * 100)
+    index.record("card", "DCIM/clip.mov", 100, 123, tmp_path / "dest", copy, "abc")
+    assert index.lookup("card", "DCIM/clip.mov", 100, 123, tmp_path / "dest") == copy
+
+def test_lookup_misses_changed_source_or_other_destination(index, tmp_path):
+    copy = tmp_path / "clip.mov"
+    copy.write_bytes(b"x" * 100)
+    index.record("card", "clip.mov", 100, 123, tmp_path, copy, "abc")
+    assert index.lookup("card", "clip.mov", 100, 456, tmp_path) is None
+    assert index.lookup("other", "clip.mov", 100, 123, tmp_path) is None
+    assert index.lookup("card", "clip.mov", 100, 123, tmp_path / "elsewhere") is None
+
+def test_lookup_misses_deleted_or_truncated_copy(index, tmp_path):
+    copy = tmp_path / "clip.mov"
+    copy.write_bytes(b"x" * 50)
+    index.record("card", "clip.mov", 100, 123, tmp_path, copy, "abc")
+    assert index.lookup("card", "clip.mov", 100, 123, tmp_path) is None
+    copy.unlink()
+    assert index.lookup("card", "clip.mov", 100, 123, tmp_path) is None
+
+def test_index_persists_between_sessions(tmp_path):
+    copy = tmp_path / "clip.mov"
+    copy.write_bytes(b"x" * 10)
+    first = IngestIndex(tmp_path / "index.db")
+    first.record("card", "clip.mov", 10, 1, tmp_path, copy, "abc")
+    first.close()
+    second = IngestIndex(tmp_path / "index.db")
+    assert second.lookup("card", "clip.mov", 10, 1, tmp_path) == copy
+    second.close()
+
+def test_card_identity_is_stable(tmp_path):
+    assert card_identity(tmp_path) == card_identity(tmp_path)
@@ -2,6 +2,7 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from unittest import mock
 import xml.etree.ElementTree as ET
 from src.core import mhl_handler
 import os
@@ -107,4 +108,70 @@ def test_add_file_to_mhl_nonpositive_size(temp_dir, temp_file):
     with pytest.raises(ValueError):
         mhl_handler.add_file_to_mhl(mhl_path, tree, hashes, temp_file, "abc", 0)
     with pytest.raises(ValueError):
-        mhl_handler.add_file_to_mhl(mhl_path, tree, hashes, temp_file, "abc", -1) 
\ No newline at end of file
+        mhl_handler.add_file_to_mhl(mhl_path, tree, hashes, temp_file, "abc", -1) 
+
+def test_add_file_to_mhl_leaves_syncing_to_caller(temp_dir, temp_file):
+    mhl_path, tree, hashes = mhl_handler.initialize_mhl_file("testdir", temp_dir)
+    with mock.patch("src.core.mhl_handler.os.fsync") as fsync:
+        for checksum in ("abc", "def", "123"):
+            mhl_handler.add_file_to_mhl(mhl_path, tree, hashes, temp_file, checksum, 1)
+        fsync.assert_not_called()
+        mhl_handler.sync_mhl_file(mhl_path)
+    assert fsync.call_count == 1
+    assert len(ET.parse(mhl_path).getroot().findall("mhl:hashes/mhl:hash", {"mhl": "urn:ASC:MHL:v2.0"})) == 3
+# --- Tests for MHLWriter ---
+NS = {"mhl": "urn:ASC:MHL:v2.0"}
+
+def _hashes(mhl_path):
+    return ET.parse(mhl_path).getroot().findall("mhl:hashes/mhl:hash", NS)
+
+def _hash_paths(mhl_path):
+    return [h.find("mhl:path", NS).text for h in _hashes(mhl_path)]
+
+def test_mhl_writer_streams_valid_document(temp_dir):
+    mhl_path, _, _ = mhl_handler.initialize_mhl_file("testdir", temp_dir)
+    with mhl_handler.MHLWriter(mhl_path, flush_entries=2) as writer:
+        for i in range(5):
+            writer.add(temp_dir / "A001" / f"clip{i}.mov", f"{i:016x}", 100 + i, mtime=0.0)
+            # Every flush leaves a complete document behind
+            if i == 2:
+                assert _hash_paths(mhl_path) == [str(Path("A001") / f"clip{n}.mov") for n in range(2)]
+    hashes = _hashes(mhl_path)
+    assert len(hashes) == 5
+    assert hashes[4].find("mhl:path", NS).get("size") == "104"
+    assert hashes[4].find("mhl:xxh64", NS).text == f"{4:016x}"
+    assert hashes[4].find("mhl:xxh64", NS).get("action") == "original"
+
+def test_mhl_writer_appends_to_existing_file(temp_dir, temp_file):
+    mhl_path, tree, hashes = mhl_handler.initialize_mhl_file("testdir", temp_dir)
+    mhl_handler.add_file_to_mhl(mhl_path, tree, hashes, temp_file, "abc", 1)
+    with mhl_handler.MHLWriter(mhl_path) as writer:
+        writer.add(temp_file, "def", 1)
+    assert len(_hash_paths(mhl_path)) == 2
+
+def test_mhl_writer_rejects_foreign_file(temp_dir):
+    other = temp_dir / "other.mhl"
+    other.write_text("<hashlist></hashlist>")
+    with pytest.raises(OSError):
+        mhl_handler.MHLWriter(other)
+
+def test_mhl_writer_invalid_entry(temp_dir, temp_file):
+    writer = mhl_handler.open_mhl_writer("testdir", temp_dir)
+    try:
+        with pytest.raises(ValueError):
+            writer.add(temp_file, "", 1)
+        with pytest.raises(ValueError):
+            writer.add(temp_file, "abc", 0)
+    finally:
+        writer.close()
+    assert _hash_paths(writer.mhl_filename) == []
+
+def test_mhl_writer_records_extra_hashes(temp_dir):
+    mhl_path, _, _ = mhl_handler.initialize_mhl_file("testdir", temp_dir)
+    with mhl_handler.MHLWriter(mhl_path) as writer:
+        writer.add(temp_dir / "clip.mov", "abc", 10, mtime=0.0,
+                   extra_hashes={"xxh64": "abc", "md5": "d41d8cd9", "sha1": "da39a3ee"})
+    entry = _hashes(mhl_path)[0]
+    assert [child.tag.split("}")[1] for child in entry] == ["path", "xxh64", "md5", "sha1"]
+    assert entry.find("mhl:md5", NS).text == "d41d8cd9"
+    assert entry.find("mhl:sha1", NS).get("action") == "original"
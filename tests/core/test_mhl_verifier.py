@@ -0,0 +1,119 @@
+import hashlib
+import threading
+import time
+import xxhash
+from pathlib import Path
+from unittest import mock
+from src.core.mhl_handler import open_mhl_writer
+from src.core.mhl_verifier import (
+    MHLVerifier, count_mhl_entries, iter_mhl_entries,
+    STATUS_FAILED, STATUS_MISSING, STATUS_OUTSIDE, STATUS_SIZE_MISMATCH
+)
+from src.core.verification import DeviceLimiter
+
+def _make_card(tmp_path, count=5):
+    files = []
+    for i in range(count):
+        path = tmp_path / "A001" / f"clip{i}.mov"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(bytes([i]) * (1000 + i))
+        files.append(path)
+    with open_mhl_writer("session", tmp_path) as writer:
+        for path in files:
+            writer.add(path, xxhash.xxh64(path.read_bytes()).hexdigest(), path.stat().st_size)
+    return writer.mhl_filename, files
+
+def test_iter_mhl_entries_streams_every_entry(tmp_path):
+    mhl_path, files = _make_card(tmp_path)
+    entries = list(iter_mhl_entries(mhl_path))
+    assert [e.path for e in entries] == files
+    assert entries[2].size == 1002
+    assert entries[2].hashes["xxh64"] == xxhash.xxh64(files[2].read_bytes()).hexdigest()
+    assert count_mhl_entries(mhl_path) == (5, sum(1000 + i for i in range(5)))
+
+def test_verify_passes_intact_files(tmp_path):
+    mhl_path, files = _make_card(tmp_path)
+    display = mock.Mock()
+    report = MHLVerifier(display, max_workers=3).verify(mhl_path)
+    assert report.success
+    assert report.passed_files == report.total_files == 5
+    assert display.show_progress.call_count == 5
+    # Progress is reported in manifest order
+    names = [c.args[0].current_file for c in display.show_progress.call_args_list]
+    assert names == [f.name for f in files]
+    display.show_error.assert_not_called()
+
+def test_verify_reports_each_failure(tmp_path):
+    mhl_path, files = _make_card(tmp_path)
+    files[0].write_bytes(b"\xff" * 1000)  # same size, different content
+    files[1].unlink()
+    files[2].write_bytes(b"short")
+    display = mock.Mock()
+    report = MHLVerifier(display).verify(mhl_path)
+    assert not report.success
+    assert report.passed_files == 2
+    assert [(f.path, f.status) for f in report.failures] == [
+        (files[0], STATUS_FAILED), (files[1], STATUS_MISSING), (files[2], STATUS_SIZE_MISMATCH)]
+    assert report.to_dict()["failed_files"] == 3
+    display.show_error.assert_called_once()
+
+def test_verify_stops_on_event(tmp_path):
+    mhl_path, _ = _make_card(tmp_path)
+    stop = threading.Event()
+    stop.set()
+    report = MHLVerifier(mock.Mock(), stop_event=stop).verify(mhl_path)
+    assert report.stopped
+    assert not report.success
+    assert report.checked_files == 0
+
+def test_device_limiter_caps_concurrency_per_device():
+    limiter = DeviceLimiter(2)
+    active = {1: 0, 2: 0}
+    peak = {1: 0, 2: 0}
+    lock = threading.Lock()
+
+    def work(device):
+        with limiter.slot(device):
+            with lock:
+                active[device] += 1
+                peak[device] = max(peak[device], active[device])
+            time.sleep(0.02)
+            with lock:
+                active[device] -= 1
+
+    threads = [threading.Thread(target=work, args=(1 + i % 2,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == {1: 2, 2: 2}
+
+def test_verify_uses_other_supported_hash(tmp_path):
+    path = tmp_path / "clip.mov"
+    path.write_bytes(b"md5 only")
+    (tmp_path / "legacy.mhl").write_text(
+        '<?xml version="1.0"?><hashlist version="2.0" xmlns="urn:ASC:MHL:v2.0"><hashes>'
+        f'<hash><path size="8">clip.mov</path><md5>{hashlib.md5(b"md5 only").hexdigest()}</md5></hash>'
+        '</hashes></hashlist>')
+    report = MHLVerifier(mock.Mock()).verify(tmp_path / "legacy.mhl")
+    assert report.success
+
+def test_verify_refuses_files_outside_mhl_directory(tmp_path):
+    secret = tmp_path / "secret.bin"
+    secret.write_bytes(b"private")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    clip = dest / "clip.mov"
+    clip.write_bytes(b"frame")
+    with open_mhl_writer("session", dest) as writer:
+        writer.add(clip, xxhash.xxh64(b"frame").hexdigest(), 5)
+        writer.add(dest / "secret.bin", xxhash.xxh64(b"private").hexdigest(), 7)
+    mhl_path = writer.mhl_filename
+    mhl_path.write_text(mhl_path.read_text().replace(">secret.bin<", ">../secret.bin<"))
+    verifier = MHLVerifier(mock.Mock())
+    with mock.patch.object(verifier.checksum_calculator, 'compute_checksum',
+                           wraps=verifier.checksum_calculator.compute_checksum) as compute:
+        report = verifier.verify(mhl_path)
+    assert report.passed_files == 1
+    assert [(f.path.name, f.status) for f in report.failures] == [("secret.bin", STATUS_OUTSIDE)]
+    assert [c.args[0] for c in compute.call_args_list] == [clip]
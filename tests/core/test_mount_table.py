@@ -0,0 +1,115 @@
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+from src.core.mount_table import (
+    MountTableCache, MountTableMonitor, SourcePresenceWatcher, is_source_present, parse_mountinfo
+)
+
+ROOT_LINE = b"22 1 179:2 / / rw,relatime shared:1 - ext4 /dev/mmcblk0p2 rw\n"
+PROC_LINE = b"23 22 0:21 / /proc rw,nosuid - proc proc rw\n"
+CARD_LINE = b"98 22 8:1 / /media/pi/EOS\\040DIGITAL rw,nosuid shared:50 master:3 - exfat /dev/sda1 rw\n"
+
+def test_is_source_present_requires_mount(tmp_path):
+    with patch('os.path.ismount', return_value=False):
+        assert not is_source_present(tmp_path)
+    with patch('os.path.ismount', return_value=True):
+        assert is_source_present(tmp_path)
+    assert not is_source_present(tmp_path / "missing")
+
+def test_check_latches_removal(tmp_path):
+    watcher = SourcePresenceWatcher(tmp_path)
+    with patch('src.core.mount_table.is_source_present', return_value=True):
+        assert watcher.check()
+        assert watcher.present
+    with patch('src.core.mount_table.is_source_present', return_value=False):
+        assert not watcher.check()
+    # Once removed, the source stays removed for this watcher
+    with patch('src.core.mount_table.is_source_present', return_value=True):
+        assert not watcher.check()
+        assert not watcher.present
+
+def test_start_on_missing_source_does_not_start_thread(tmp_path):
+    watcher = SourcePresenceWatcher(tmp_path / "missing").start()
+    assert watcher.removed.is_set()
+    assert watcher._thread is None
+    watcher.stop()
+
+def test_polling_detects_removal(tmp_path):
+    present = [True]
+    with patch('src.core.mount_table.is_source_present', side_effect=lambda p: present[0]), \
+         patch('src.core.mount_table.mount_events_available', return_value=False):
+        watcher = SourcePresenceWatcher(tmp_path, poll_interval=0.01).start()
+        try:
+            assert watcher.present
+            present[0] = False
+            assert watcher.removed.wait(2)
+        finally:
+            watcher.stop()
+
+def test_stop_returns_promptly(tmp_path):
+    with patch('src.core.mount_table.is_source_present', return_value=True):
+        watcher = SourcePresenceWatcher(tmp_path).start()
+        time.sleep(0.05)
+        started = time.monotonic()
+        watcher.stop()
+    assert time.monotonic() - started < 1.0
+    assert watcher._thread is None
+
+def test_parse_mountinfo_unescapes_and_skips_malformed():
+    entries = parse_mountinfo(ROOT_LINE + PROC_LINE + b"garbage\n" + CARD_LINE)
+    assert [e.mount_point for e in entries] == [Path("/"), Path("/proc"), Path("/media/pi/EOS DIGITAL")]
+    assert entries[2].source == "/dev/sda1"
+    assert entries[2].fstype == "exfat"
+
+def test_monitor_reads_fake_mountinfo(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_bytes(ROOT_LINE + PROC_LINE)
+    with MountTableMonitor(mountinfo) as monitor:
+        assert not monitor.kernel_events
+        assert [e.mount_point for e in monitor.mounts()] == [Path("/"), Path("/proc")]
+        assert monitor.wait_for_change(0.05) is False
+
+def test_monitor_wakes_on_change(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_bytes(ROOT_LINE)
+    with MountTableMonitor(mountinfo, poll_interval=0.01) as monitor:
+        monitor.mounts()
+        timer = threading.Timer(0.05, lambda: mountinfo.write_bytes(ROOT_LINE + CARD_LINE))
+        timer.start()
+        started = time.monotonic()
+        assert monitor.wait_for_change(5) is True
+        assert time.monotonic() - started < 0.2
+        assert monitor.mounts()[-1].mount_point == Path("/media/pi/EOS DIGITAL")
+
+def test_monitor_interrupt(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_bytes(ROOT_LINE)
+    with MountTableMonitor(mountinfo) as monitor:
+        threading.Timer(0.05, monitor.interrupt).start()
+        assert monitor.wait_for_change() is False
+
+def test_cache_finds_innermost_mount(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_bytes(ROOT_LINE + PROC_LINE + CARD_LINE)
+    cache = MountTableCache(mountinfo)
+    try:
+        assert cache.find("/media/pi/EOS DIGITAL/DCIM/IMG_0001.CR3").fstype == "exfat"
+        assert cache.find("/media/pi/EOS DIGITAL").source == "/dev/sda1"
+        assert cache.find("/media/pi/EOS").mount_point == Path("/")
+    finally:
+        cache.close()
+
+def test_cache_rereads_only_after_change(tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_bytes(ROOT_LINE)
+    cache = MountTableCache(mountinfo)
+    try:
+        first = cache.entries()
+        assert cache.entries() is first
+        mountinfo.write_bytes(ROOT_LINE + CARD_LINE)
+        second = cache.entries()
+        assert second is not first
+        assert len(second) == 2
+    finally:
+        cache.close()
@@ -0,0 +1,55 @@
+import os
+import pytest
+from src.core import page_cache
+from src.core.page_cache import CacheTrimmer, flush_and_drop, page_cache_size, sequential_read
+
+@pytest.fixture
+def advice(monkeypatch):
+    calls = []
+    monkeypatch.setattr(page_cache, "_advise",
+                        lambda fd, offset, length, name: calls.append((offset, length, name)))
+    return calls
+
+def test_cache_trimmer_evicts_the_window_before_last(tmp_path, advice):
+    src_path = tmp_path / "clip.mov"
+    src_path.write_bytes(b"x" * 100)
+    progress = []
+    with open(src_path, "rb") as src, open(tmp_path / "copy.mov", "wb") as dst:
+        trimmer = CacheTrimmer(src, [dst], lambda done, total: progress.append(done), window=10)
+        assert [name for _, _, name in advice] == ["POSIX_FADV_SEQUENTIAL", "POSIX_FADV_WILLNEED"]
+        advice.clear()
+        for done in (5, 10, 15, 20, 30):
+            trimmer(done, 30)
+        assert advice == [(0, 10, "POSIX_FADV_DONTNEED"),
+                          (0, 20, "POSIX_FADV_DONTNEED"),
+                          (10, 20, "POSIX_FADV_DONTNEED")]
+        advice.clear()
+        trimmer.finish()
+    assert progress == [5, 10, 15, 20, 30]
+    assert advice == [(0, 0, "POSIX_FADV_DONTNEED")] * 2
+
+def test_sequential_read_can_be_disabled(tmp_path, advice):
+    path = tmp_path / "clip.mov"
+    path.write_bytes(b"data")
+    with open(path, "rb") as f, sequential_read(f, enabled=False):
+        assert f.read() == b"data"
+    assert advice == []
+    with open(path, "rb") as f, sequential_read(f):
+        f.read()
+    assert advice[-1] == (0, 0, "POSIX_FADV_DONTNEED")
+
+def test_flush_and_drop_keeps_contents(tmp_path):
+    path = tmp_path / "clip.mov"
+    data = os.urandom(1024 * 1024)
+    path.write_bytes(data)
+    flush_and_drop(path)
+    assert path.read_bytes() == data
+    with pytest.raises(OSError):
+        flush_and_drop(tmp_path / "missing.mov")
+
+def test_page_cache_size():
+    size = page_cache_size()
+    if os.path.exists("/proc/meminfo"):
+        assert size > 0
+    else:
+        assert size is None
@@ -28,6 +28,7 @@ def test_start_transfer(tracker, mock_display):
     assert tracker.total_size == 1000
     assert tracker.file_number == 0
     assert tracker.overall_progress == 0.0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_start_file(tracker, mock_display):
@@ -39,6 +40,7 @@ def test_start_file(tracker, mock_display):
     assert tracker.total_bytes == 200
     assert tracker.total_transferred == 100
     assert tracker.status == TransferStatus.COPYING
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_update_progress_bytes(tracker, mock_display, monkeypatch):
@@ -49,17 +51,20 @@ def test_update_progress_bytes(tracker, mock_display, monkeypatch):
     assert tracker.bytes_transferred == 25
     assert 0 < tracker.current_file_progress < 1
     assert tracker.overall_progress > 0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_update_progress_files_processed(tracker, mock_display):
     tracker.start_transfer(2, 100)
     tracker.update_progress(files_processed=1)
     assert tracker.file_number == 1
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_set_status(tracker, mock_display):
     tracker.set_status(TransferStatus.ERROR)
     assert tracker.status == TransferStatus.ERROR
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_complete_file_success(tracker, mock_display):
@@ -69,6 +74,7 @@ def test_complete_file_success(tracker, mock_display):
     assert tracker.status == TransferStatus.SUCCESS
     assert tracker.current_file_progress == 1.0
     assert tracker.overall_progress > 0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_complete_file_error(tracker, mock_display):
@@ -77,6 +83,7 @@ def test_complete_file_error(tracker, mock_display):
     tracker.complete_file(success=False)
     assert tracker.status == TransferStatus.ERROR
     assert tracker.current_file_progress == 1.0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_complete_transfer_success(tracker, mock_display):
@@ -84,6 +91,7 @@ def test_complete_transfer_success(tracker, mock_display):
     tracker.complete_transfer(successful=True)
     assert tracker.status == TransferStatus.SUCCESS
     assert tracker.overall_progress == 1.0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_complete_transfer_error(tracker, mock_display):
@@ -91,6 +99,7 @@ def test_complete_transfer_error(tracker, mock_display):
     tracker.complete_transfer(successful=False)
     assert tracker.status == TransferStatus.ERROR
     assert tracker.overall_progress == 1.0
+    tracker.flush(5)
     mock_display.show_progress.assert_called()
 
 def test_create_progress_callback(tracker):
@@ -100,4 +109,101 @@ def test_create_progress_callback(tracker):
     cb(5, 10)
     assert tracker.bytes_transferred == 5
     cb(10, 10)
-    assert tracker.bytes_transferred == 10 
\ No newline at end of file
+    assert tracker.bytes_transferred == 10 
+def test_concurrent_callbacks_aggregate_totals(tracker):
+    tracker.start_transfer(2, 200)
+    tracker.start_file(file_path=Path("a.txt"), file_number=1, total_files=2, file_size=100, total_size=200)
+    cb_a = tracker.create_progress_callback(TransferStatus.COPYING)
+    tracker.start_file(file_path=Path("b.txt"), file_number=2, total_files=2, file_size=100, total_size=200)
+    cb_b = tracker.create_progress_callback(TransferStatus.COPYING)
+    verify_b = tracker.create_progress_callback(TransferStatus.CHECKSUMMING)
+    cb_a(60, 100)
+    cb_b(30, 100)
+    cb_a(100, 100)
+    cb_b(100, 100)
+    verify_b(100, 100)
+    assert tracker.total_transferred == 200
+    # Only the most recently started file drives the per-file fields
+    assert tracker.current_file == "b.txt"
+    assert tracker.bytes_transferred == 100
+
+def test_progress_updates_are_coalesced_to_rate(mock_display):
+    tracker = ProgressTracker(display=mock_display, rate_hz=10)
+    tracker.start_file(Path("clip.mov"), 1, 1, 1000, 1000, 0)
+    callback = tracker.create_progress_callback(TransferStatus.COPYING)
+    for done in range(10, 1001, 10):
+        callback(done, 1000)
+    time.sleep(0.3)  # The held back update is shown when the interval is up
+    assert mock_display.show_progress.call_count == 2
+    assert mock_display.show_progress.call_args[0][0].bytes_transferred == 1000
+    tracker.complete_transfer(successful=False)
+    assert mock_display.show_progress.call_args[0][0].status == TransferStatus.ERROR
+
+def test_every_state_change_is_shown(mock_display):
+    tracker = ProgressTracker(display=mock_display, rate_hz=1)
+    tracker.start_file(Path("clip.mov"), 1, 1, 1000, 1000, 0)
+    tracker.create_progress_callback(TransferStatus.COPYING)(500, 1000)
+    tracker.set_status(TransferStatus.CHECKSUMMING)
+    tracker.complete_file(success=True)
+    tracker.flush(5)
+    statuses = [c.args[0].status for c in mock_display.show_progress.call_args_list]
+    assert statuses[0] == TransferStatus.COPYING
+    assert statuses[-2:] == [TransferStatus.CHECKSUMMING, TransferStatus.SUCCESS]
+
+def test_slow_display_does_not_block_progress_callbacks():
+    import threading
+    drawing, release = threading.Event(), threading.Event()
+    shown = []
+    display = Mock()
+    def show_progress(progress):
+        shown.append((progress.bytes_transferred, threading.current_thread()))
+        drawing.set()
+        release.wait(5)
+    display.show_progress.side_effect = show_progress
+    tracker = ProgressTracker(display=display)
+    tracker.start_file(Path("clip.mov"), 1, 1, 1000, 1000, 0)
+    assert drawing.wait(5)
+    callback = tracker.create_progress_callback(TransferStatus.COPYING)
+    started = time.monotonic()
+    for done in (100, 200, 300, 400):
+        callback(done, 1000)
+    assert time.monotonic() - started < 1
+    release.set()
+    assert tracker.flush(5)
+    assert [done for done, _ in shown] == [0, 400]
+    assert all(thread is not threading.current_thread() for _, thread in shown)
+
+def test_flusher_thread_exits_when_idle(mock_display, monkeypatch):
+    import src.core.progress_tracker as progress_tracker
+    monkeypatch.setattr(progress_tracker, "IDLE_TIMEOUT", 0.05)
+    tracker = ProgressTracker(display=mock_display)
+    tracker.set_status(TransferStatus.COPYING)
+    tracker.flush(5)
+    time.sleep(0.3)
+    assert tracker._emitter._thread is None
+    tracker.set_status(TransferStatus.SUCCESS)
+    tracker.flush(5)
+    assert mock_display.show_progress.call_args[0][0].status == TransferStatus.SUCCESS
+
+def test_progress_rate_for():
+    from src.core.progress_tracker import progress_rate_for
+    rates = {"lcd": 4.0, "web": 10.0}
+    assert progress_rate_for(Mock(progress_sink="lcd"), rates) == 4.0
+    assert progress_rate_for(Mock(progress_sink="terminal"), rates) == 0.0
+    assert progress_rate_for(None, None) == 0.0
+
+def test_complete_file_leaves_a_later_file_alone(tracker):
+    tracker.start_transfer(2, 200)
+    first = tracker.start_file(Path("a.txt"), 1, 2, 100, 200)
+    second = tracker.start_file(Path("b.txt"), 2, 2, 100, 200)
+    tracker.create_progress_callback(TransferStatus.COPYING, second)(40, 100)
+    tracker.complete_file(success=True, file_token=first)
+    assert tracker.completed_files == 1
+    assert tracker.overall_progress == 0.5
+    assert tracker.current_file == "b.txt"
+    assert tracker.status == TransferStatus.COPYING
+    assert tracker.bytes_transferred == 40
+    tracker.complete_file(success=True, file_token=second)
+    assert tracker.overall_progress == 1.0
+    assert tracker.status == TransferStatus.SUCCESS
+    assert tracker.bytes_transferred == 100
@@ -0,0 +1,76 @@
+import io
+import pytest
+import xxhash
+from src.core.resume import (
+    CheckpointWriter, ResumeCheckpoint, checkpoint_path, load_checkpoint,
+    prepare_resume, resume_offset, save_checkpoint
+)
+
+INTERVAL = 1000
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "clip.bin"
+    path.write_bytes(bytes(range(256)) * 20)
+    return path
+
+def _checkpoint(source, intervals):
+    data = source.read_bytes()
+    checkpoint = ResumeCheckpoint.for_source(source, interval=INTERVAL)
+    checkpoint.chunk_hashes = [xxhash.xxh64(data[i * INTERVAL:(i + 1) * INTERVAL]).hexdigest()
+                               for i in range(intervals)]
+    return checkpoint
+
+def test_prepare_resume_without_checkpoint_starts_over(source, tmp_path):
+    temp = tmp_path / "clip.bin.TBPART"
+    temp.write_bytes(source.read_bytes()[:1500])
+    assert resume_offset(prepare_resume(source, temp)) == 0
+
+def test_prepare_resume_keeps_verified_prefix(source, tmp_path):
+    data = source.read_bytes()
+    temp = tmp_path / "clip.bin.TBPART"
+    temp.write_bytes(data[:2500])
+    save_checkpoint(temp, _checkpoint(source, 2))
+    hash_obj = xxhash.xxh64()
+    checkpoint = prepare_resume(source, temp, hash_obj)
+    assert resume_offset(checkpoint) == 2000
+    assert temp.stat().st_size == 2000
+    assert hash_obj.hexdigest() == xxhash.xxh64(data[:2000]).hexdigest()
+
+def test_prepare_resume_drops_corrupt_interval(source, tmp_path):
+    data = bytearray(source.read_bytes()[:2000])
+    data[1500] ^= 0xFF
+    temp = tmp_path / "clip.bin.TBPART"
+    temp.write_bytes(bytes(data))
+    save_checkpoint(temp, _checkpoint(source, 2))
+    hash_obj = xxhash.xxh64()
+    checkpoint = prepare_resume(source, temp, hash_obj)
+    assert resume_offset(checkpoint) == 1000
+    assert hash_obj.hexdigest() == xxhash.xxh64(bytes(data[:1000])).hexdigest()
+
+def test_prepare_resume_ignores_checkpoint_for_changed_source(source, tmp_path):
+    temp = tmp_path / "clip.bin.TBPART"
+    temp.write_bytes(source.read_bytes()[:2000])
+    checkpoint = _checkpoint(source, 2)
+    checkpoint.source_size += 1
+    save_checkpoint(temp, checkpoint)
+    assert resume_offset(prepare_resume(source, temp)) == 0
+
+def test_checkpoint_writer_persists_written_intervals(source, tmp_path):
+    data = source.read_bytes()
+    temp = tmp_path / "clip.bin.TBPART"
+    hash_obj = xxhash.xxh64()
+    with open(temp, "wb") as dst:
+        writer = CheckpointWriter(hash_obj, temp, dst, ResumeCheckpoint.for_source(source, INTERVAL))
+        for i in range(0, len(data), 700):
+            dst.write(data[i:i + 700])
+            writer.update(data[i:i + 700])
+            writer.written(i + len(data[i:i + 700]))
+    assert writer.hexdigest() == xxhash.xxh64(data).hexdigest()
+    saved = load_checkpoint(temp)
+    assert saved.chunk_hashes == _checkpoint(source, len(data) // INTERVAL).chunk_hashes
+
+def test_load_checkpoint_ignores_garbage(tmp_path):
+    temp = tmp_path / "clip.bin.TBPART"
+    checkpoint_path(temp).write_text("not json")
+    assert load_checkpoint(temp) is None
@@ -0,0 +1,20 @@
+import os
+import subprocess
+import pytest
+from src.core.statx import birth_time, statx_available
+
+pytestmark = pytest.mark.skipif(not statx_available(), reason='statx not available')
+
+def test_birth_time_matches_stat(tmp_path):
+    path = tmp_path / "clip.mov"
+    path.write_bytes(b"x")
+    created = birth_time(path)
+    if created is None:
+        pytest.skip("filesystem does not report birth times")
+    out = subprocess.run(['stat', '--format=%W', str(path)], capture_output=True, text=True)
+    if out.returncode == 0 and out.stdout.strip() not in ('', '0'):
+        assert int(created) == int(out.stdout.strip())
+    assert created <= os.stat(path).st_mtime + 1
+
+def test_birth_time_missing_file(tmp_path):
+    assert birth_time(tmp_path / "missing") is None
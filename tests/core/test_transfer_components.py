@@ -261,4 +261,452 @@ class TestFileProcessor:
                     content = f.read()
                     assert "No files to transfer" in content or "Transfer completed at" not in content
         finally:
-            empty_dir.rmdir() 
\ No newline at end of file
+            empty_dir.rmdir() 
+    def test_process_files_concurrent_workers(self, mock_display_interface, mock_storage_interface,
+                                              mock_config, temp_source_dir, temp_dest_dir):
+        """Test that concurrent workers copy every file and log results in source order."""
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        mock_config.max_transfer_threads = 3
+        mock_config.verify_transfers = True
+
+        names = [f"clip{i:02d}.mp4" for i in range(8)]
+        for i, name in enumerate(names):
+            (temp_source_dir / name).write_bytes(bytes([i]) * (1024 * (i + 1)))
+
+        log_file = temp_dest_dir / "transfer.log"
+        with patch('os.path.ismount', return_value=True):
+            result = processor.process_files(temp_source_dir, temp_dest_dir, log_file=log_file)
+
+        assert result is True
+        for i, name in enumerate(names):
+            assert (temp_dest_dir / name).read_bytes() == bytes([i]) * (1024 * (i + 1))
+        content = log_file.read_text()
+        positions = [content.index(f"Success: {temp_source_dir / name}") for name in names]
+        assert positions == sorted(positions)
+        assert processor.progress_tracker.total_transferred == sum(1024 * (i + 1) for i in range(8))
+
+    def test_process_files_reports_source_removal_once(self, mock_display_interface, mock_storage_interface,
+                                                       mock_config, temp_source_dir, temp_dest_dir):
+        """Test that workers hitting the same pulled card produce one error and one sound."""
+        import threading
+        from src.core.transfer_components import FileTransferResult
+        from src.core.validation import ErrorMessages
+        sound_manager = Mock()
+        mock_config.max_transfer_threads = 3
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config,
+                                  sound_manager=sound_manager)
+        for i in range(5):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(b"x" * 100)
+        started, all_started = [], threading.Event()
+
+        def pulled(file_path, *args, **kwargs):
+            started.append(file_path)
+            if len(started) >= 3:
+                all_started.set()
+            all_started.wait(5)
+            return processor._report_source_removed(FileTransferResult(file_path, len(started)),
+                                                    f"Source drive removed: {file_path}")
+
+        with patch.object(processor, '_transfer_file', side_effect=pulled), \
+             patch('os.path.ismount', return_value=True):
+            assert processor.process_files(temp_source_dir, temp_dest_dir) is False
+
+        assert len(started) >= 3
+        removed = [c for c in mock_display_interface.show_error.call_args_list
+                   if c.args == (ErrorMessages.SOURCE_REMOVED,)]
+        assert len(removed) == 1
+        sound_manager.play_error.assert_called_once()
+
+    def test_process_files_reports_copy_errors_once(self, mock_display_interface, mock_storage_interface,
+                                                    mock_config, temp_source_dir, temp_dest_dir):
+        """Test that copy errors in several workers are shown once, from the recording thread."""
+        import threading
+        from src.core.file_operations import FileOperations
+        from src.core.validation import ErrorMessages
+        mock_config.max_transfer_threads = 3
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(4):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(b"x" * 100)
+        callers = set()
+
+        def failing_copy(*args, **kwargs):
+            callers.add(threading.current_thread().name)
+            raise OSError("I/O error")
+
+        with patch.object(FileOperations, 'copy_file', side_effect=failing_copy), \
+             patch.object(FileOperations, 'copy_file_with_hash', side_effect=failing_copy), \
+             patch('os.path.ismount', return_value=True):
+            assert processor.process_files(temp_source_dir, temp_dest_dir) is False
+
+        errors = [c for c in mock_display_interface.show_error.call_args_list
+                  if c.args == (ErrorMessages.TRANSFER_ERROR,)]
+        assert len(errors) == 1
+        assert processor._failures == sorted(temp_source_dir.glob("clip*.mp4"))
+
+    def test_process_files_graceful_stop(self, mock_display_interface, mock_storage_interface,
+                                         mock_config, temp_source_dir, temp_dest_dir):
+        """Test that a stop request finishes started work and reports a graceful stop."""
+        import threading
+        stop_event = threading.Event()
+        stop_event.set()
+        mock_config.max_transfer_threads = 2
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config,
+                                  stop_event=stop_event)
+        for i in range(5):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(b"x" * 100)
+
+        with patch('os.path.ismount', return_value=True):
+            result = processor.process_files(temp_source_dir, temp_dest_dir)
+
+        assert result is True
+        assert processor.stop_requested
+        copied = list(temp_dest_dir.glob("*.mp4"))
+        assert 1 <= len(copied) < 5
+
+    def test_process_files_verifies_while_next_file_copies(self, mock_display_interface, mock_storage_interface,
+                                                           mock_config, temp_source_dir, temp_dest_dir):
+        """Test that verification of one file overlaps with copying the next."""
+        import threading
+        from src.core.file_operations import FileOperations
+        mock_config.verify_transfers = True
+        mock_config.background_verification = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(2):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+
+        second_copy_started = threading.Event()
+        overlapped = []
+        real_copy = FileOperations.copy_file_with_hash
+        real_verify = FileOperations.verify_checksum
+
+        def copy(self, src_path, dst_path, *args, **kwargs):
+            if src_path.name == "clip1.mp4":
+                second_copy_started.set()
+            return real_copy(self, src_path, dst_path, *args, **kwargs)
+
+        def verify(self, file_path, expected_checksum, progress_callback=None):
+            if file_path.name == "clip0.mp4":
+                overlapped.append(second_copy_started.wait(timeout=5))
+            return real_verify(self, file_path, expected_checksum, progress_callback)
+
+        with patch.object(FileOperations, 'copy_file_with_hash', copy), \
+             patch.object(FileOperations, 'verify_checksum', verify), \
+             patch('os.path.ismount', return_value=True):
+            result = processor.process_files(temp_source_dir, temp_dest_dir)
+
+        assert result is True
+        assert overlapped == [True]
+
+    def test_process_files_verifies_in_parallel_per_device(self, mock_display_interface, mock_storage_interface,
+                                                           mock_config, temp_source_dir, temp_dest_dir):
+        """Test that several files verify at once, capped per destination drive, and record in order."""
+        import threading
+        import time
+        from src.core.file_operations import FileOperations
+        mock_config.verify_transfers = True
+        mock_config.background_verification = True
+        mock_config.verify_threads = 4
+        mock_config.verify_threads_per_device = 2
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(6):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def verify(self, file_path, expected_checksum, progress_callback=None):
+            with lock:
+                active.append(file_path)
+                peak.append(len(active))
+            if file_path.name == "clip0.mp4":
+                # Hold the first file until a later one is verifying alongside it
+                deadline = time.monotonic() + 5
+                while len(active) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.005)
+            time.sleep(0.02)
+            with lock:
+                active.remove(file_path)
+            return True
+
+        log_file = temp_dest_dir / "transfer.log"
+        with patch.object(FileOperations, 'verify_checksum', verify), \
+             patch('os.path.ismount', return_value=True):
+            assert processor.process_files(temp_source_dir, temp_dest_dir, log_file=log_file) is True
+
+        assert max(peak) == 2
+        log = log_file.read_text()
+        positions = [log.index(f"Success: {temp_source_dir / f'clip{i}.mp4'}") for i in range(6)]
+        assert positions == sorted(positions)
+
+    def test_process_files_releases_source_before_verification(self, mock_display_interface,
+                                                               mock_storage_interface, mock_config,
+                                                               temp_source_dir, temp_dest_dir):
+        """Test that the source is released once read, while copies are still verifying from a journal."""
+        import threading
+        from src.core.file_operations import FileOperations
+        from src.core.verification import find_journals, read_journal
+        mock_config.verify_transfers = True
+        mock_config.background_verification = True
+        mock_config.release_card_before_verify = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(3):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+
+        released = threading.Event()
+        journaled = []
+        real_verify = FileOperations.verify_checksum
+
+        def verify(self, file_path, expected_checksum, progress_callback=None):
+            if file_path.name == "clip0.mp4":
+                assert released.wait(timeout=5)
+            return real_verify(self, file_path, expected_checksum, progress_callback)
+
+        def release():
+            journaled.extend(read_journal(find_journals(temp_dest_dir)[0]))
+            released.set()
+
+        with patch.object(FileOperations, 'verify_checksum', verify), \
+             patch('os.path.ismount', return_value=True):
+            assert processor.process_files(temp_source_dir, temp_dest_dir,
+                                           on_source_released=release) is True
+
+        assert released.is_set()
+        assert journaled[0].dest_path == temp_dest_dir / "clip0.mp4"
+        assert find_journals(temp_dest_dir) == []
+        assert processor._successful_files == 3
+
+    def test_verify_journals_finishes_interrupted_session(self, mock_display_interface, mock_storage_interface,
+                                                          mock_config, temp_dest_dir):
+        """Test that journaled copies are verified by the next session, keeping only failures."""
+        import xxhash
+        from src.core.verification import PendingVerification, VerificationJournal, find_journals, read_journal
+        good = temp_dest_dir / "good.mp4"
+        bad = temp_dest_dir / "bad.mp4"
+        good.write_bytes(b"good")
+        bad.write_bytes(b"damaged")
+        journal = VerificationJournal.create(temp_dest_dir)
+        journal.add(PendingVerification(good, Path("/card/good.mp4"), xxhash.xxh64(b"good").hexdigest(), 4))
+        journal.add(PendingVerification(bad, Path("/card/bad.mp4"), xxhash.xxh64(b"bad").hexdigest(), 3))
+        journal.close()
+
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        assert processor.verify_journals(temp_dest_dir) is False
+        mock_display_interface.show_error.assert_called_with("Earlier copy failed: bad.mp4")
+        journals = find_journals(temp_dest_dir)
+        assert [item.dest_path for item in read_journal(journals[0])] == [bad]
+        assert processor.verify_journals(temp_dest_dir) is False
+
+        bad.write_bytes(b"bad")  # Re-copied
+        assert processor.verify_journals(temp_dest_dir) is True
+        assert find_journals(temp_dest_dir) == []
+
+    def test_process_files_late_verify_failure_fails_session(self, mock_display_interface, mock_storage_interface,
+                                                             mock_config, temp_source_dir, temp_dest_dir):
+        """Test that a failed background verification fails the transfer."""
+        from src.core.file_operations import FileOperations
+        mock_config.verify_transfers = True
+        mock_config.background_verification = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(3):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+
+        def verify(self, file_path, expected_checksum, progress_callback=None):
+            return file_path.name != "clip2.mp4"
+
+        log_file = temp_dest_dir / "transfer.log"
+        with patch.object(FileOperations, 'verify_checksum', verify), \
+             patch('os.path.ismount', return_value=True):
+            result = processor.process_files(temp_source_dir, temp_dest_dir, log_file=log_file)
+
+        assert result is False
+        assert processor._failures == [temp_source_dir / "clip2.mp4"]
+        assert "Checksum verification failed" in log_file.read_text()
+
+    def test_process_files_mirror_destinations(self, mock_display_interface, mock_storage_interface,
+                                               mock_config, temp_source_dir, temp_dest_dir):
+        """Test that mirror destinations receive every file with their own log."""
+        mock_config.verify_transfers = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(3):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+
+        mirror_dir = temp_dest_dir / "mirror"
+        mirror_dir.mkdir()
+        primary_dir = temp_dest_dir / "primary"
+        primary_dir.mkdir()
+        mirror_log = mirror_dir / "transfer.log"
+        with patch('os.path.ismount', return_value=True):
+            result = processor.process_files(temp_source_dir, primary_dir, primary_dir / "transfer.log",
+                                             mirror_targets=[(mirror_dir, mirror_log)])
+
+        assert result is True
+        for i in range(3):
+            assert (primary_dir / f"clip{i}.mp4").read_bytes() == bytes([i]) * 4096
+            assert (mirror_dir / f"clip{i}.mp4").read_bytes() == bytes([i]) * 4096
+        assert f"Success: {temp_source_dir / 'clip2.mp4'}" in mirror_log.read_text()
+        assert str(mirror_dir) in mirror_log.read_text()
+        assert processor._mirrors[0].successful_files == 3
+        assert processor.progress_tracker.total_transferred == 3 * 4096
+
+    def test_process_files_writes_mhl_per_destination(self, mock_display_interface, mock_storage_interface,
+                                                       mock_config, temp_source_dir, temp_dest_dir, tmp_path):
+        """Test that each destination's MHL lists every verified file once the session ends."""
+        import xml.etree.ElementTree as ET
+        mock_config.verify_transfers = True
+        mock_config.create_mhl_files = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        for i in range(3):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+        primary_dir = temp_dest_dir / "primary"
+        mirror_dir = temp_dest_dir / "mirror"
+        primary_dir.mkdir()
+        mirror_dir.mkdir()
+
+        with patch('os.path.ismount', return_value=True), \
+             patch('src.core.ingest_index.default_index_path', return_value=tmp_path / "index.db"):
+            assert processor.process_files(temp_source_dir, primary_dir,
+                                           mirror_targets=[(mirror_dir, None)]) is True
+
+        ns = {"mhl": "urn:ASC:MHL:v2.0"}
+        for directory in (primary_dir, mirror_dir):
+            mhl_files = list(directory.glob("*.mhl"))
+            assert len(mhl_files) == 1
+            paths = [h.text for h in ET.parse(mhl_files[0]).getroot().findall(
+                "mhl:hashes/mhl:hash/mhl:path", ns)]
+            assert paths == ["clip0.mp4", "clip1.mp4", "clip2.mp4"]
+
+    def test_process_files_records_every_checksum_algorithm(self, mock_display_interface, mock_storage_interface,
+                                                            mock_config, temp_source_dir, temp_dest_dir, tmp_path):
+        """Test that extra hash algorithms end up in the MHL and transfer log from the copy's single read."""
+        import hashlib
+        import xml.etree.ElementTree as ET
+        mock_config.verify_transfers = True
+        mock_config.create_mhl_files = True
+        mock_config.checksum_algorithms = ["xxh64", "md5"]
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        (temp_source_dir / "clip0.mp4").write_bytes(b"\x07" * 4096)
+        log_file = temp_dest_dir / "transfer.log"
+
+        with patch('os.path.ismount', return_value=True), \
+             patch('src.core.ingest_index.default_index_path', return_value=tmp_path / "index.db"):
+            assert processor.process_files(temp_source_dir, temp_dest_dir, log_file) is True
+
+        md5 = hashlib.md5(b"\x07" * 4096).hexdigest()
+        ns = {"mhl": "urn:ASC:MHL:v2.0"}
+        mhl_file = next(temp_dest_dir.glob("*.mhl"))
+        assert ET.parse(mhl_file).getroot().find("mhl:hashes/mhl:hash/mhl:md5", ns).text == md5
+        assert f"md5: {md5}" in log_file.read_text()
+
+    def test_process_files_repairs_damaged_blocks(self, mock_display_interface, mock_storage_interface,
+                                                  mock_config, temp_source_dir, temp_dest_dir):
+        """Test that large files get a chunk tree and only damaged blocks are re-copied on mismatch."""
+        from src.core.chunk_hashes import chunk_tree_path, load_chunk_tree
+        from src.core.transfer_components import FileTransferResult
+        mock_config.verify_transfers = True
+        mock_config.chunk_hash_size_mb = 1
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        data = os.urandom(3 * 1024 * 1024 + 10)
+        (temp_source_dir / "clip0.mp4").write_bytes(data)
+
+        with patch('os.path.ismount', return_value=True):
+            assert processor.process_files(temp_source_dir, temp_dest_dir) is True
+        copy = temp_dest_dir / "clip0.mp4"
+        assert chunk_tree_path(copy).exists()
+
+        result = FileTransferResult(temp_source_dir / "clip0.mp4", 1, copy, len(data), success=True,
+                                    chunk_tree=load_chunk_tree(copy))
+        assert len(result.chunk_tree.leaves) == 4
+        with open(copy, 'r+b') as f:
+            f.seek(2 * 1024 * 1024 + 1)
+            f.write(b"\x00\xff")
+        file_ops = Mock()
+        assert processor._verify_copy(result, file_ops) is True
+        assert copy.read_bytes() == data
+        assert "1 of 4 blocks" in result.messages[0]
+        file_ops.verify_checksum.assert_not_called()
+
+        # Once the card is released there is nothing to re-copy from
+        with open(copy, 'r+b') as f:
+            f.write(b"\x00\xff")
+        processor._source_released = True
+        with patch('src.core.transfer_components.repair_chunks') as repair:
+            assert processor._verify_copy(result, file_ops) is False
+        repair.assert_not_called()
+        processor._fail_verification(result)
+        assert result.error_message == f"Source already released, 1 of 4 blocks of {copy} bad"
+
+    def test_verify_copy_drops_cached_pages_first(self, mock_display_interface, mock_storage_interface,
+                                                  mock_config, temp_dest_dir):
+        """Test that drop_cache_before_verify syncs and evicts the copy before re-reading it."""
+        from src.core.transfer_components import FileTransferResult
+        mock_config.drop_cache_before_verify = True
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        copy = temp_dest_dir / "clip0.mp4"
+        copy.write_bytes(b"frame")
+        result = FileTransferResult(copy, 1, copy, 5, success=True, checksum="abc")
+        file_ops = Mock()
+        file_ops.verify_checksum.return_value = True
+        with patch('src.core.transfer_components.flush_and_drop') as flush_and_drop:
+            flush_and_drop.side_effect = lambda path: file_ops.verify_checksum.assert_not_called()
+            assert processor._verify_copy(result, file_ops) is True
+        flush_and_drop.assert_called_once_with(copy)
+
+    def test_process_files_skips_already_ingested(self, mock_display_interface, mock_storage_interface,
+                                                  mock_config, temp_source_dir, temp_dest_dir, tmp_path, caplog):
+        """Test that a re-inserted card only copies files missing from the ingest index."""
+        mock_config.verify_transfers = True
+        mock_config.skip_ingested_files = True
+        for i in range(2):
+            (temp_source_dir / f"clip{i}.mp4").write_bytes(bytes([i]) * 4096)
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+
+        with patch('os.path.ismount', return_value=True), \
+             patch('src.core.ingest_index.default_index_path', return_value=tmp_path / "index.db"), \
+             caplog.at_level("INFO", logger="src.core.transfer_components"):
+            assert processor.process_files(temp_source_dir, temp_dest_dir / "day1",
+                                           destination_roots=[temp_dest_dir]) is True
+            (temp_source_dir / "clip2.mp4").write_bytes(b"new" * 1000)
+            log_file = temp_dest_dir / "transfer.log"
+            assert processor.process_files(temp_source_dir, temp_dest_dir / "day2", log_file,
+                                           destination_roots=[temp_dest_dir]) is True
+
+        assert processor._skipped_files == 2
+        assert processor._successful_files == 1
+        assert sorted(p.name for p in (temp_dest_dir / "day2").iterdir()) == ["clip2.mp4"]
+        assert "Skipped files: 2" in log_file.read_text()
+        assert sum(r.message.startswith("Skipping already ingested file:") for r in caplog.records) == 2
+
+    def test_process_files_starts_copying_before_scan_finishes(self, mock_display_interface,
+                                                               mock_storage_interface, mock_config,
+                                                               temp_source_dir, temp_dest_dir):
+        """Test that the first file is copied while the scan is still running."""
+        import threading
+        first = temp_source_dir / "a.mp4"
+        second = temp_source_dir / "b.mp4"
+        first.write_bytes(b"a" * 1000)
+        second.write_bytes(b"b" * 1000)
+        first_copied = threading.Event()
+
+        def slow_scan(source_path, config):
+            def entries():
+                yield first, first.stat()
+                # The scan only continues once the first file has been copied
+                assert first_copied.wait(5)
+                yield second, second.stat()
+            return entries()
+
+        processor = FileProcessor(mock_display_interface, mock_storage_interface, mock_config)
+        original = processor._transfer_file
+        def transfer_and_signal(file_path, *args, **kwargs):
+            result = original(file_path, *args, **kwargs)
+            if file_path == first:
+                first_copied.set()
+            return result
+        processor._transfer_file = transfer_and_signal
+
+        with patch('os.path.ismount', return_value=True), \
+             patch('src.core.transfer_components.iter_valid_media_files', slow_scan):
+            assert processor.process_files(temp_source_dir, temp_dest_dir) is True
+        assert (temp_dest_dir / "b.mp4").read_bytes() == b"b" * 1000
+        assert processor.progress_tracker.total_files == 2
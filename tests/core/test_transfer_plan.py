@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+from src.core.transfer_plan import TransferPlan, PlannedFile
+
+def _files(tmp_path, sizes):
+    files = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"clip{i}.mov"
+        path.write_bytes(b"x" * size)
+        files.append(path)
+    return files
+
+def test_from_files_captures_stat_values(tmp_path):
+    files = _files(tmp_path, [10, 20, 30])
+    plan = TransferPlan.from_files(files)
+    assert len(plan) == 3
+    assert plan.total_size == 60
+    entry = plan[1]
+    st = files[1].stat()
+    assert entry.path == files[1]
+    assert entry.size == 20
+    assert entry.mtime_ns == st.st_mtime_ns
+    assert entry.mode == st.st_mode
+    assert entry.created == min(st.st_ctime, st.st_mtime, st.st_atime)
+
+def test_from_files_stats_each_file_once(tmp_path):
+    files = _files(tmp_path, [1, 2, 3])
+    real_stat = Path.stat
+    calls = []
+    def counting_stat(self, *args, **kwargs):
+        calls.append(self)
+        return real_stat(self, *args, **kwargs)
+    with patch.object(Path, "stat", counting_stat):
+        plan = TransferPlan.from_files(files)
+        assert [entry.size for entry in plan] == [1, 2, 3]
+    assert calls == files
+
+def test_unreadable_file_is_kept_and_counted(tmp_path):
+    files = _files(tmp_path, [5])
+    plan = TransferPlan.from_files(files + [tmp_path / "missing.mov"])
+    assert len(plan) == 2
+    assert plan.stat_failures == 1
+    assert plan[1].size == 0 and plan[1].mode == 0
+
+def test_planned_file_from_stat(tmp_path):
+    path = _files(tmp_path, [7])[0]
+    entry = PlannedFile.from_stat(path, os.stat(path))
+    assert entry.size == 7 and entry.path == path
+
+def test_stream_follows_a_running_scan(tmp_path):
+    import threading
+    files = _files(tmp_path, [1, 2])
+    release = threading.Event()
+    def slow_scan():
+        yield files[0], files[0].stat()
+        release.wait(5)
+        yield files[1], files[1].stat()
+    plan = TransferPlan.stream(slow_scan())
+    seen = []
+    for index in plan.follow():
+        seen.append(plan[index].path)
+        if index == 0:
+            assert not plan.finished
+            release.set()
+    assert seen == files
+    assert plan.finished and plan.total_size == 3
+
+def test_stream_reraises_scan_error_after_found_entries(tmp_path):
+    import pytest
+    files = _files(tmp_path, [1])
+    def failing_scan():
+        yield files[0], files[0].stat()
+        raise OSError("card removed")
+    plan = TransferPlan.stream(failing_scan())
+    seen = []
+    with pytest.raises(OSError, match="card removed"):
+        for index in plan.follow():
+            seen.append(index)
+    assert seen == [0]
+
+def test_total_size_is_kept_as_files_are_added(tmp_path):
+    files = _files(tmp_path, [5, 7])
+    plan = TransferPlan()
+    plan.add(files[0], files[0].stat())
+    assert plan.total_size == 5
+    plan.add(tmp_path / "gone.mov", None)
+    plan.add(files[1], files[1].stat())
+    assert plan.total_size == 12
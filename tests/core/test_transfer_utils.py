@@ -8,6 +8,7 @@ from datetime import datetime
 from unittest.mock import patch
 from src.core.transfer_utils import (
     get_transferable_files,
+    scan_source_files,
     calculate_transfer_totals,
     create_destination_path,
     create_directory_structure,
@@ -103,6 +104,46 @@ class TestGetTransferableFiles:
             finally:
                 os.chmod(temp_source_dir, 0o755)
 
+class TestScanSourceFiles:
+    """Test suite for scan_source_files function."""
+
+    def test_yields_sorted_paths_with_stat(self, temp_source_dir):
+        """Test that files come out in sorted path order with their stat results."""
+        for rel in ["b.mov", "a/z.mov", "a.mov", "a/b/c.mov"]:
+            path = temp_source_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * len(rel))
+        entries = list(scan_source_files(temp_source_dir))
+        paths = [path for path, _ in entries]
+        assert paths == sorted(paths)
+        assert len(paths) == 4
+        assert all(st.st_size == len(path.relative_to(temp_source_dir).as_posix())
+                   for path, st in entries)
+
+    def test_prunes_hidden_and_system_directories(self, temp_source_dir):
+        """Test that hidden entries and system directories are not descended into."""
+        for rel in [".Trashes/x.mov", "System Volume Information/y.mov", ".hidden.mov", "DCIM/clip.mov"]:
+            path = temp_source_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x")
+        paths = [path for path, _ in scan_source_files(temp_source_dir)]
+        assert paths == [temp_source_dir / "DCIM" / "clip.mov"]
+
+    def test_filters_extensions_case_insensitively(self, temp_source_dir):
+        """Test that the extension filter ignores case and missing dots."""
+        for name in ["A.MOV", "b.mp4", "c.txt"]:
+            (temp_source_dir / name).write_bytes(b"x")
+        paths = [path.name for path, _ in scan_source_files(temp_source_dir, ["mov", ".MP4"])]
+        assert paths == ["A.MOV", "b.mp4"]
+
+    def test_non_recursive(self, temp_source_dir):
+        """Test that subdirectories are skipped when not recursive."""
+        (temp_source_dir / "sub").mkdir()
+        (temp_source_dir / "sub" / "a.mov").write_bytes(b"x")
+        (temp_source_dir / "b.mov").write_bytes(b"x")
+        paths = [path.name for path, _ in scan_source_files(temp_source_dir, recursive=False)]
+        assert paths == ["b.mov"]
+
 class TestCalculateTransferTotals:
     """Test suite for calculate_transfer_totals function."""
 
@@ -148,6 +189,18 @@ class TestCreateDestinationPath:
         assert dest_path.name != "test.txt"
         assert dest_path.name.endswith(".txt")
 
+    def test_destination_path_with_known_creation_time(self, temp_source_dir, temp_dest_dir):
+        """Test that a creation time from the transfer plan is used without a stat."""
+        from datetime import datetime
+        source_file = temp_source_dir / "missing.txt"  # never stat'ed
+        created = datetime(2024, 5, 1, 12, 30, 0).timestamp()
+
+        dest_path = create_destination_path(
+            source_file, temp_dest_dir, temp_source_dir,
+            rename_with_timestamp=True, creation_time=created
+        )
+        assert dest_path.name == "missing_20240501_123000.txt"
+
     def test_destination_path_with_subdir(self, temp_source_dir, temp_dest_dir):
         """Test creating destination path preserving directory structure."""
         subdir = temp_source_dir / "subdir"
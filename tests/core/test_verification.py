@@ -0,0 +1,30 @@
+import json
+from pathlib import Path
+from src.core.verification import (
+    PendingVerification, VerificationJournal, find_journals, read_journal
+)
+
+def _item(root, name):
+    return PendingVerification(root / name, Path("/card") / name, f"{len(name):016x}", 100)
+
+def test_journal_lists_only_unverified_copies(tmp_path):
+    journal = VerificationJournal.create(tmp_path)
+    for name in ("a.mov", "b.mov", "c.mov"):
+        journal.add(_item(tmp_path, name))
+    journal.done(tmp_path / "b.mov")
+    journal.done(tmp_path / "never-queued.mov")
+    with open(journal.path, 'a') as f:
+        f.write('{"dest": "torn')  # Power cut mid-write
+    assert find_journals(tmp_path) == [journal.path]
+    assert read_journal(journal.path) == [_item(tmp_path, "a.mov"), _item(tmp_path, "c.mov")]
+    journal.close()
+    assert journal.path.exists()  # Still has pending entries
+
+def test_journal_removed_once_everything_verified(tmp_path):
+    journal = VerificationJournal.create(tmp_path)
+    journal.add(_item(tmp_path, "a.mov"))
+    journal.done(tmp_path / "a.mov")
+    lines = [json.loads(line) for line in journal.path.read_text().splitlines()]
+    assert lines[-1] == {"done": str(tmp_path / "a.mov")}
+    journal.close()
+    assert find_journals(tmp_path) == []
@@ -0,0 +1,157 @@
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from src.core.web_server import DriveInfoCache, WebServer
+
+
+def test_drive_cache_reuses_list_within_ttl():
+    cache = DriveInfoCache(ttl=60)
+    loader = mock.Mock(return_value=["a"])
+    assert cache.get(loader) == ["a"]
+    assert cache.get(loader) == ["a"]
+    assert loader.call_count == 1
+    cache.invalidate()
+    assert cache.peek() is None
+    cache.get(loader)
+    assert loader.call_count == 2
+
+
+def test_drive_cache_zero_ttl_always_reloads():
+    cache = DriveInfoCache(ttl=0)
+    loader = mock.Mock(return_value=[])
+    cache.get(loader)
+    cache.get(loader)
+    assert loader.call_count == 2
+
+
+def test_drive_cache_concurrent_callers_share_one_refresh():
+    cache = DriveInfoCache(ttl=60)
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return ["sd"]
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(slow_loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [["sd"]] * 5
+
+
+def test_drive_cache_keeps_no_list_loaded_before_invalidate():
+    cache = DriveInfoCache(ttl=60)
+
+    def loader():
+        cache.invalidate()  # A drive changed while the list was being built
+        return ["stale"]
+
+    assert cache.get(loader) == ["stale"]
+    assert cache.peek() is None
+
+
+def test_drives_endpoint_queries_storage_once_for_polling_clients():
+    storage = mock.Mock()
+    storage.get_available_drives.return_value = [Path("/media/CARD")]
+    storage.get_drive_info.return_value = {'total': 2 * 1024 ** 3, 'free': 1024 ** 3, 'used': 1024 ** 3}
+    storage.is_drive_mounted.return_value = True
+    del storage.get_drive_type
+    app = SimpleNamespace(storage=storage, config=SimpleNamespace(drive_cache_ttl=60))
+    server = WebServer(mock.Mock(), app)
+    client = TestClient(server.app)
+
+    for _ in range(3):
+        response = client.get("/api/drives")
+        assert response.status_code == 200
+        assert response.json()["drives"][0]["name"] == "CARD"
+    assert storage.get_drive_info.call_count == 1
+
+    server.invalidate_drive_cache()
+    client.get("/api/drives")
+    assert storage.get_drive_info.call_count == 2
+    server._executor.shutdown()
+
+
+def test_validate_path_runs_off_event_loop(tmp_path):
+    server = WebServer(mock.Mock(), SimpleNamespace(config=None))
+    seen = {}
+    real_check = server._check_destination_path
+
+    def check(path):
+        seen['thread'] = threading.current_thread().name
+        return real_check(path)
+
+    server._check_destination_path = check
+    response = TestClient(server.app).post("/api/validate-path", json={"path": ""})
+    assert response.json()["is_valid"] is False
+    assert seen['thread'].startswith("web-io")
+    server._executor.shutdown()
+
+
+def test_validate_path_uses_destination_checks(tmp_path):
+    server = WebServer(mock.Mock(), SimpleNamespace(config=None))
+    client = TestClient(server.app)
+    response = client.post("/api/validate-path", json={"path": str(tmp_path)}).json()
+    assert response["is_valid"] is True
+    assert response["sanitized_path"] == str(tmp_path)
+    response = client.post("/api/validate-path", json={"path": str(tmp_path / "missing" / "dir")}).json()
+    assert response == {"is_valid": False, "error_message": "Parent directory missing", "sanitized_path": None}
+    server._executor.shutdown()
+
+
+def test_restarted_server_runs_blocking_calls(tmp_path):
+    server = WebServer(mock.Mock(), SimpleNamespace(config=None))
+    server.stop_server()
+    assert server._executor is None
+
+    async def serve():
+        pass
+
+    with mock.patch("src.core.web_server.uvicorn.Server") as uvicorn_server, \
+         mock.patch("src.core.web_server.time.sleep"):
+        uvicorn_server.return_value.serve = serve
+        assert server.start_server() is True
+        server.server_thread.join(5)
+    response = TestClient(server.app).post("/api/validate-path", json={"path": str(tmp_path)})
+    assert response.json()["is_valid"] is True
+    server._executor.shutdown()
+
+
+def test_verify_mhl_runs_on_io_pool(tmp_path):
+    mhl = tmp_path / "day1.mhl"
+    mhl.write_text("<hashlist/>")
+    app = SimpleNamespace(config=None, config_manager=SimpleNamespace(config=SimpleNamespace()))
+    server = WebServer(mock.Mock(), app)
+    seen = {}
+
+    def verify(self, mhl_path):
+        seen['thread'] = threading.current_thread().name
+        return mock.Mock(success=True, to_dict=lambda: {}, summary_lines=lambda: ["All files verified"])
+
+    with mock.patch("src.core.mhl_verifier.MHLVerifier.verify", verify):
+        response = TestClient(server.app).post("/api/verify-mhl", json={"path": str(mhl)})
+    assert response.json()["message"] == "All files verified"
+    assert seen['thread'].startswith("web-io")
+    server._executor.shutdown()
+
+
+def test_verify_mhl_refuses_other_files(tmp_path):
+    server = WebServer(mock.Mock(), SimpleNamespace(config=None, config_manager=None))
+    client = TestClient(server.app)
+    notes = tmp_path / "notes.txt"
+    notes.write_text("not a manifest")
+    with mock.patch("src.core.mhl_verifier.MHLVerifier.verify") as verify:
+        for path in (str(notes), str(tmp_path / "missing.mhl"), "relative.mhl"):
+            response = client.post("/api/verify-mhl", json={"path": path})
+            assert response.status_code == 400
+    verify.assert_not_called()
+    server._executor.shutdown()
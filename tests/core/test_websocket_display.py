@@ -0,0 +1,89 @@
+import asyncio
+import json
+from src.core import websocket_display
+from src.core.websocket_display import WebSocketDisplay
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed = False
+        self.unblock = None
+
+    async def send_text(self, text):
+        if self.unblock:
+            await self.unblock.wait()
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed = True
+
+def test_broadcast_serializes_once_and_evicts_stuck_client(monkeypatch):
+    dumps = []
+    monkeypatch.setattr(websocket_display.json, "dumps", lambda obj: dumps.append(obj) or json.JSONEncoder().encode(obj))
+
+    async def scenario():
+        display = WebSocketDisplay(send_timeout=0.2)
+        fast, stuck = FakeWebSocket(), FakeWebSocket(delay=60)
+        display.add_websocket_client(fast)
+        display.add_websocket_client(stuck)
+        await display.broadcast_message("status", {"message": "Copying"})
+        assert len(dumps) == 1
+        await asyncio.sleep(0.05)
+        assert [m["data"] for m in fast.sent] == [{"message": "Copying"}]
+        await asyncio.sleep(0.4)
+        assert stuck not in display.connected_clients and stuck.closed
+        assert fast in display.connected_clients
+
+    asyncio.run(scenario())
+
+def test_unsent_progress_is_replaced_by_newer_progress():
+    async def scenario():
+        display = WebSocketDisplay()
+        client = FakeWebSocket()
+        client.unblock = asyncio.Event()
+        display.add_websocket_client(client)
+        await display.broadcast_message("status", {"message": "Copying"})
+        for done in range(10):
+            await display.broadcast_message("progress", {"bytes_transferred": done})
+        await display.broadcast_message("error", {"message": "Read error"})
+        client.unblock.set()
+        await asyncio.sleep(0.05)
+        assert [(m["type"], m["data"]) for m in client.sent] == [
+            ("status", {"message": "Copying"}),
+            ("progress", {"bytes_transferred": 9}),
+            ("error", {"message": "Read error"}),
+        ]
+
+    asyncio.run(scenario())
+
+def test_client_evicted_when_queue_is_full_of_messages():
+    async def scenario():
+        display = WebSocketDisplay(max_pending=2)
+        client = FakeWebSocket()
+        client.unblock = asyncio.Event()
+        display.add_websocket_client(client)
+        for i in range(4):
+            await display.broadcast_message("status", {"message": str(i)})
+        await asyncio.sleep(0.01)
+        assert client not in display.connected_clients
+
+    asyncio.run(scenario())
+
+def test_messages_from_transfer_threads_reach_clients():
+    async def scenario():
+        display = WebSocketDisplay()
+        display.set_event_loop(asyncio.get_running_loop())
+        client = FakeWebSocket()
+        display.add_websocket_client(client)
+
+        def transfer_thread():
+            display.show_status("Copying")
+            display.send_destination_reset()
+
+        await asyncio.to_thread(transfer_thread)
+        await asyncio.sleep(0.05)
+        assert [m["type"] for m in client.sent] == ["status", "destination_reset"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,74 @@
+import importlib
+import sys
+import types
+import pytest
+
+class FakeSMBus:
+    """Records every byte written to the I2C bus."""
+
+    def __init__(self, bus):
+        self.writes = []
+
+    def write_byte(self, addr, value):
+        self.writes.append(value)
+
+    def sent(self):
+        """Decode the nibble writes back into (is_data, byte) pairs."""
+        strobes = [w for w in self.writes if w & 0x04]
+        return [(bool(high & 0x01), (high & 0xF0) | (low >> 4))
+                for high, low in zip(strobes[::2], strobes[1::2])]
+
+@pytest.fixture
+def lcd_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, "smbus", types.SimpleNamespace(SMBus=FakeSMBus))
+    monkeypatch.delitem(sys.modules, "src.platform.raspberry_pi.lcd_display", raising=False)
+    module = importlib.import_module("src.platform.raspberry_pi.lcd_display")
+    monkeypatch.setattr(module.time, "sleep", lambda seconds: None)
+    yield module
+    sys.modules.pop("src.platform.raspberry_pi.lcd_display", None)
+
+@pytest.fixture
+def lcd(lcd_module):
+    display = lcd_module.LCDDisplay(max_refresh_hz=0)
+    display.clear()
+    display.bus.writes.clear()
+    return display
+
+def test_write_sends_only_changed_cells(lcd):
+    lcd.write(0, 1, "3/26 ####      ")
+    first = lcd.bus.sent()
+    assert first[0] == (False, 0x80 | 0x40)
+    assert [chr(b) for is_data, b in first if is_data] == list("3/26####")  # Blank cells are skipped
+    lcd.bus.writes.clear()
+
+    lcd.write(0, 1, "3/26 #####     ")
+    assert lcd.bus.sent() == [(True, ord("#"))]  # One cell, right after the last one sent
+    lcd.bus.writes.clear()
+
+    lcd.write(0, 1, "4/26 ")
+    assert lcd.bus.sent() == [(False, 0x80 | 0x40), (True, ord("4"))]
+    assert lcd.line_content[1] == "4/26 #####      "
+
+def test_unchanged_frame_sends_nothing(lcd):
+    lcd.write(0, 0, "clip0001.mov")
+    lcd.bus.writes.clear()
+    lcd.write(0, 0, "clip0001.mov")
+    assert lcd.bus.writes == []
+
+def test_contiguous_changes_skip_cursor_moves(lcd):
+    lcd.write(0, 0, "abcd")
+    lcd.bus.writes.clear()
+    lcd.write(0, 0, "xbyz")
+    assert lcd.bus.sent() == [(False, 0x80), (True, ord("x")), (False, 0x82),
+                              (True, ord("y")), (True, ord("z"))]
+
+def test_unforced_refresh_is_rate_limited(lcd_module):
+    lcd = lcd_module.LCDDisplay(max_refresh_hz=1)
+    lcd.clear()
+    lcd.write(0, 1, "#")
+    lcd.draw(0, 1, "##")
+    assert lcd.refresh(force=False) is False
+    assert lcd.line_content[1].startswith("##")
+    lcd.bus.writes.clear()
+    assert lcd.refresh() is True
+    assert lcd.bus.sent() == [(True, ord("#"))]  # The cursor is already there
@@ -104,6 +104,23 @@ def test_transfer_operation_execute_transfer_success(monkeypatch):
     display.show_status.assert_any_call("Transfer complete")
     storage.unmount_drive.assert_called_once()
 
+def test_transfer_operation_releases_card_before_verification(monkeypatch):
+    display = mock.Mock()
+    storage = mock.Mock()
+    file_transfer = mock.Mock()
+    storage.unmount_drive.return_value = True
+
+    def copy(source, destination, log_file, on_source_released=None):
+        on_source_released()
+        return False  # A destination failed verification after the card was released
+
+    file_transfer.copy_sd_to_dump.side_effect = copy
+    op = TransferOperation(display, storage, file_transfer, mock.Mock())
+    assert op.execute_transfer(mock.Mock(), Path('/tmp')) is True
+    storage.unmount_drive.assert_called_once()
+    display.show_status.assert_any_call("Safe to remove card - verifying")
+    display.show_error.assert_called_once_with("Transfer failed")
+
 def test_transfer_operation_execute_transfer_failure(monkeypatch):
     display = mock.Mock()
     storage = mock.Mock()
@@ -225,4 +242,15 @@ def test_base_transfer_box_setup(monkeypatch):
     box.display.show_status = mock.Mock()
     box.setup()
     box.display.clear.assert_called_once()
-    box.display.show_status.assert_called_with('Completed: Setup') 
\ No newline at end of file
+    box.display.show_status.assert_called_with('Completed: Setup') 
+def test_parse_arguments_verify_mhl(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--verify-mhl', '/archive/day1.mhl'])
+    args = parse_arguments()
+    assert args.verify_mhl == '/archive/day1.mhl'
+    assert validate_arguments(args) == (True, "")
+
+def test_validate_arguments_rejects_non_mhl(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--verify-mhl', '/archive/day1.txt'])
+    is_valid, message = validate_arguments(parse_arguments())
+    assert not is_valid
+    assert ".mhl" in message